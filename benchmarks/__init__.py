@@ -0,0 +1,12 @@
+"""Micro benchmarks for toradh.
+
+The hot path suite compares toradh against the equivalent `try/except`
+and `is None` code and prints a JSON report:
+
+    python -m benchmarks --output run.json
+    python -m benchmarks --compare run.json
+
+Other modules focus on a single topic and can be run on their own, e.g.:
+
+    python -m benchmarks.bench_typecheck
+"""
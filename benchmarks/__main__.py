@@ -0,0 +1,104 @@
+"""Runs the hot path suite and prints a JSON report.
+
+Usage:
+
+    python -m benchmarks --output run.json
+    python -m benchmarks --compare previous.json --threshold 1.15
+"""
+
+import argparse
+import json
+import platform
+import sys
+from typing import Any, Dict, List, Optional
+
+from benchmarks import hot_paths
+from toradh import set_typecheck_policy
+from toradh.typecheck import get_typecheck_policy
+
+
+def _toradh_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("toradh")
+    except Exception:
+        return "unknown"
+
+
+def _regressions(
+    current: List[Dict[str, Any]], previous: Dict[str, Any], threshold: float
+) -> List[str]:
+    before = {record["name"]: record for record in previous["results"]}
+    messages = []
+    for record in current:
+        old = before.get(record["name"])
+        if old is None:
+            continue
+        ratio = record["toradh_ns"] / old["toradh_ns"]
+        if ratio > threshold:
+            messages.append(
+                f"{record['name']}: {old['toradh_ns']} ns -> {record['toradh_ns']} ns (x{ratio:.2f})"
+            )
+    return messages
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "--number", type=int, default=100_000, help="calls per repetition"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="repetitions, the best is kept"
+    )
+    parser.add_argument(
+        "--only", help="run only the cases whose name contains this text"
+    )
+    parser.add_argument(
+        "--typecheck", choices=("off", "sampled", "full"), help="type check policy"
+    )
+    parser.add_argument(
+        "--output", help="write the report to this file instead of stdout"
+    )
+    parser.add_argument("--compare", help="previous report to check for regressions")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.10,
+        help="slowdown ratio against --compare considered a regression",
+    )
+    args = parser.parse_args(argv)
+
+    if args.typecheck:
+        set_typecheck_policy(args.typecheck)
+
+    results = hot_paths.run(number=args.number, repeat=args.repeat, only=args.only)
+    report = {
+        "toradh": _toradh_version(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "typecheck": get_typecheck_policy(),
+        "number": args.number,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(payload + "\n")
+    else:
+        print(payload)
+
+    if args.compare:
+        with open(args.compare) as fh:
+            previous = json.load(fh)
+        regressions = _regressions(results, previous, args.threshold)
+        for message in regressions:
+            print(f"regression: {message}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""`kind()` + `match` dispatch cases, kept apart since they need Python 3.10+."""
+
+from benchmarks._fixtures import find_err, find_ok, find_raise, find_raw
+
+
+def match_kind_ok() -> int:
+    res = find_ok()
+    match res.kind():
+        case int():
+            return res.unwrap()
+        case KeyError():
+            return -1
+        case ValueError():
+            return -2
+    return -3
+
+
+def match_kind_err() -> int:
+    res = find_err()
+    match res.kind():
+        case int():
+            return res.unwrap()
+        case KeyError():
+            return -1
+        case ValueError():
+            return -2
+    return -3
+
+
+def try_except_ok() -> int:
+    try:
+        return find_raw()
+    except KeyError:
+        return -1
+    except ValueError:
+        return -2
+
+
+def try_except_err() -> int:
+    try:
+        return find_raise()
+    except KeyError:
+        return -1
+    except ValueError:
+        return -2
@@ -0,0 +1,24 @@
+"""Functions shared by the hot path cases."""
+
+from toradh import Err, Ok, Result
+
+# shared by the cases that never raise it: raising an instance again keeps
+# growing its traceback, which slows every raise down
+ERROR = ValueError("boom")
+
+
+def find_ok() -> Result[int, ValueError]:
+    return Ok(1)
+
+
+def find_err() -> Result[int, ValueError]:
+    # a new error on every call, like find_raise
+    return Err(ValueError("boom"))
+
+
+def find_raw() -> int:
+    return 1
+
+
+def find_raise() -> int:
+    raise ValueError("boom")
@@ -0,0 +1,12 @@
+import timeit
+from typing import Any, Callable
+
+
+def best_ns(func: Callable[[], Any], number: int = 200_000, repeat: int = 5) -> float:
+    """Returns the best observed time per call in nanoseconds."""
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def report(name: str, ns: float, baseline: float) -> None:
+    print(f"{name:<40} {ns:>10.1f} ns/call  x{ns / baseline:>6.2f}")
@@ -0,0 +1,85 @@
+"""An async chain of four Result steps, mixing regular and async
+functions: `AsyncResult`, built per call or reused, against awaiting the
+Result at every step and checking each returned value with
+`inspect.isawaitable`."""
+
+import asyncio
+import inspect
+from typing import Any, Callable, List
+
+from benchmarks._timing import best_ns, report
+from toradh import Ok, Result, set_typecheck_policy
+from toradh.async_result import AsyncResult
+from toradh.typecheck import get_sample_rate, get_typecheck_policy
+
+BATCH = 1_000
+
+
+async def fetch() -> Result[int, KeyError]:
+    return Ok(1)
+
+
+async def enrich(value: int) -> int:
+    return value + 1
+
+
+def double(value: int) -> int:
+    return value * 2
+
+
+STEPS: List[Callable[[int], Any]] = [double, enrich, double, enrich]
+
+
+async def per_step() -> Result[int, KeyError]:
+    res = await fetch()
+    for op in STEPS:
+        if not res.is_ok():
+            break
+        value = op(res.unwrap())
+        if inspect.isawaitable(value):
+            value = await value
+        res = Ok(value)
+    return res
+
+
+async def chained() -> Result[int, KeyError]:
+    return await AsyncResult(fetch()).map(double).map(enrich).map(double).map(enrich)
+
+
+CHAIN = AsyncResult.chain().map(double).map(enrich).map(double).map(enrich)
+
+
+async def reused() -> Result[int, KeyError]:
+    return await CHAIN.on(fetch())
+
+
+def batch(chain: Callable[[], Any]) -> Callable[[], Any]:
+    loop = asyncio.new_event_loop()
+
+    async def many() -> None:
+        for _ in range(BATCH):
+            await chain()
+
+    return lambda: loop.run_until_complete(many())
+
+
+def main() -> None:
+    previous, rate = get_typecheck_policy(), get_sample_rate()
+    set_typecheck_policy("off")
+    try:
+        assert (
+            asyncio.run(per_step()) == asyncio.run(chained()) == asyncio.run(reused())
+        )
+        baseline = best_ns(batch(per_step), number=50) / BATCH
+        report("await + isawaitable per step", baseline, baseline)
+        for name, chain in (
+            ("AsyncResult, built per call", chained),
+            ("AsyncResult.chain() reused with on()", reused),
+        ):
+            report(name, best_ns(batch(chain), number=50) / BATCH, baseline)
+    finally:
+        set_typecheck_policy(previous, sample_rate=rate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Overhead of @catch on the success and failure paths."""
+
+from benchmarks._timing import best_ns, report
+from toradh import Err, Ok, catch
+
+DATA = {"a": 1}
+
+
+def lookup(key: str) -> int:
+    return DATA[key]
+
+
+caught = catch(KeyError)(lookup)
+stripped = catch(KeyError, strip_traceback=True)(lookup)
+
+
+def manual(key: str) -> object:
+    try:
+        return Ok(lookup(key))
+    except KeyError as e:
+        return Err(e)
+
+
+def bare_ok(key: str) -> object:
+    return Ok(lookup(key))
+
+
+def main() -> None:
+    baseline = best_ns(lambda: bare_ok("a"))
+    report("Ok(bare call) [success]", baseline, baseline)
+    report("manual try/except [success]", best_ns(lambda: manual("a")), baseline)
+    report("@catch [success]", best_ns(lambda: caught("a")), baseline)
+
+    baseline = best_ns(lambda: manual("b"))
+    report("manual try/except [failure]", baseline, baseline)
+    report("@catch [failure]", best_ns(lambda: caught("b")), baseline)
+    report("@catch strip_traceback [failure]", best_ns(lambda: stripped("b")), baseline)
+
+
+if __name__ == "__main__":
+    main()
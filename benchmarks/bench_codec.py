@@ -0,0 +1,80 @@
+"""Encode/decode throughput and payload size of toradh.codec against pickle."""
+
+import json
+import pickle
+import time
+from typing import Any, Callable, List
+
+from toradh import Err, Nothing, Ok, Some
+from toradh import codec
+
+N = 50_000
+
+
+def _raise_chained() -> Err[ValueError]:
+    try:
+        try:
+            {}["id"]
+        except KeyError as e:
+            raise ValueError("lookup failed") from e
+    except ValueError as e:
+        return Err(e)
+    raise AssertionError()
+
+
+def _measure(
+    label: str, encode: Callable[[], Any], decode: Callable[[Any], Any]
+) -> None:
+    start = time.perf_counter()
+    payload = encode()
+    encoded = time.perf_counter() - start
+    start = time.perf_counter()
+    decode(payload)
+    decoded = time.perf_counter() - start
+    size = len(payload) if isinstance(payload, (bytes, str)) else sum(map(len, payload))
+    print(
+        f"{label:<24} encode {N / encoded / 1e3:>8.0f}k/s  "
+        f"decode {N / decoded / 1e3:>8.0f}k/s  {size / N:>7.1f} B/value"
+    )
+
+
+def main() -> None:
+    err = _raise_chained()
+    values: List[Any] = [
+        [Ok({"id": i}), err, Some(i), Nothing()][i % 4] for i in range(N)
+    ]
+
+    _measure(
+        "pickle (list)",
+        lambda: pickle.dumps(values, pickle.HIGHEST_PROTOCOL),
+        pickle.loads,
+    )
+    _measure(
+        "pickle (per value)",
+        lambda: [pickle.dumps(v, pickle.HIGHEST_PROTOCOL) for v in values],
+        lambda frames: [pickle.loads(frame) for frame in frames],
+    )
+    _measure(
+        "codec binary (frames)",
+        lambda: codec.dumps_many(values),
+        lambda d: list(codec.iter_loads(d)),
+    )
+    _measure(
+        "codec binary (per value)",
+        lambda: [codec.dumps(v) for v in values],
+        lambda frames: [codec.loads(frame) for frame in frames],
+    )
+    _measure(
+        "codec JSON stream",
+        lambda: "".join(codec.iterencode_json(values)),
+        lambda doc: list(codec.iterdecode_json([doc])),
+    )
+    _measure(
+        "json (to_json)",
+        lambda: json.dumps([codec.to_json(v) for v in values]),
+        lambda doc: [codec.from_json(v) for v in json.loads(doc)],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Per construction cost of Option values.
+
+The "legacy" classes reproduce the previous construction path, which
+mutated a class attribute on every call, guarded `__init__` with
+`getattr` and allocated a new Nothing() each time.
+"""
+
+from typing import Any, Optional
+
+from benchmarks._timing import best_ns, report
+from toradh import Nothing, Option, Some
+
+
+class LegacyOption:
+    __slots__ = ("_value",)
+
+    def __init__(self, value: Any) -> None:
+        if getattr(self, "_flag", None) is None:
+            raise ValueError()
+        self._value = value
+
+    @classmethod
+    def of(cls, value: Optional[Any]) -> "LegacyOption":
+        setattr(cls, "_flag", True)  # noqa: B010
+        if value is None:
+            return LegacyNothing()
+        return LegacySome(value)
+
+
+class LegacySome(LegacyOption):
+    __slots__ = ()
+    _flag = True
+
+    def __init__(self, value: Any) -> None:
+        super().__init__(value)
+
+
+class LegacyNothing(LegacyOption):
+    __slots__ = ()
+    _flag = True
+
+    def __init__(self) -> None:
+        super().__init__(None)
+
+
+def main() -> None:
+    cases = (
+        ("Option.of(x)", lambda: LegacyOption.of(1), lambda: Option.of(1)),
+        ("Option.of(None)", lambda: LegacyOption.of(None), lambda: Option.of(None)),
+        ("Some(x)", lambda: LegacySome(1), lambda: Some(1)),
+        ("Nothing()", lambda: LegacyNothing(), lambda: Nothing()),
+    )
+    for name, legacy, current in cases:
+        baseline = best_ns(legacy)
+        report(f"{name} [legacy]", baseline, baseline)
+        report(f"{name} [current]", best_ns(current), baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""`dispatch` tables against the equivalent `match` statement, as the number
+of cases grows.
+
+The `match` functions are generated at runtime so this module imports on
+every Python version, they are only measured on 3.10+.
+"""
+
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks._timing import best_ns, report
+from toradh import Err
+from toradh.dispatch import dispatch
+
+SIZES = (2, 4, 8, 16, 32)
+
+
+def error_types(count: int) -> List[type]:
+    return [type(f"Error{i}", (Exception,), {}) for i in range(count)]
+
+
+def match_chain(types: List[type]) -> Callable[[Any], int]:
+    cases = "\n".join(
+        f"        case Error{i}():\n            return {i}" for i in range(len(types))
+    )
+    source = f"def handle(value):\n    match value:\n{cases}\n    return -1\n"
+    namespace: Dict[str, Any] = {t.__name__: t for t in types}
+    exec(source, namespace)
+    return namespace["handle"]
+
+
+def table(types: List[type]) -> Callable[[Any], int]:
+    return dispatch({t: (lambda i: lambda value: i)(i) for i, t in enumerate(types)})
+
+
+def main() -> None:
+    if sys.version_info < (3, 10):
+        print("the match statement requires Python 3.10+")
+        return
+    for size in SIZES:
+        types = error_types(size)
+        matcher, dispatcher = match_chain(types), table(types)
+        cases: Tuple[Tuple[str, Any], ...] = (
+            ("first", Err(types[0]()).kind()),
+            ("last", Err(types[-1]()).kind()),
+        )
+        for position, value in cases:
+            assert matcher(value) == dispatcher(value)
+            baseline = best_ns(lambda: matcher(value))
+            report(f"match    {size:>2} cases, {position}", baseline, baseline)
+            report(
+                f"dispatch {size:>2} cases, {position}",
+                best_ns(lambda: dispatcher(value)),
+                baseline,
+            )
+
+
+if __name__ == "__main__":
+    main()
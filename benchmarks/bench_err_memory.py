@@ -0,0 +1,73 @@
+"""Bytes retained per cached Err, with and without the lightweight mode.
+
+Each error is raised a few frames deep, below functions holding sizeable
+locals, captured into an Err and unwrapped a few times, as a cache of
+failures being served again would.
+"""
+
+import tracemalloc
+from typing import Any, List
+
+from toradh import Err, lightweight
+
+N = 2_000
+DEPTH = 10
+UNWRAPS = 3
+
+
+def raise_deep(depth: int) -> None:
+    scratch = bytearray(512)  # noqa: F841
+    if depth == 0:
+        raise ValueError("not found")
+    raise_deep(depth - 1)
+
+
+def make_err() -> Err[ValueError]:
+    try:
+        raise_deep(DEPTH)
+    except ValueError as err:
+        return Err(err)
+    raise AssertionError("unreachable")
+
+
+def serve(err: Err[Any]) -> None:
+    for _ in range(UNWRAPS):
+        try:
+            err.unwrap()
+        except ValueError:
+            pass
+
+
+def bytes_per_err(n: int = N) -> float:
+    cache: List[Err[ValueError]] = []
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(n):
+        err = make_err()
+        serve(err)
+        cache.append(err)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    size -= cache.__sizeof__()
+    return size / n
+
+
+def main() -> None:
+    cases = (
+        ("off", None),
+        ("traceback_limit=0", 0),
+        ("traceback_limit=1", 1),
+    )
+    print(f"{'mode':<20} {'retained':>12}")
+    for name, limit in cases:
+        if limit is None:
+            lightweight.disable()
+        else:
+            lightweight.enable(traceback_limit=limit)
+        print(f"{name:<20} {bytes_per_err():>10.1f} B")
+    lightweight.disable()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""ResultExecutor throughput on a process pool for several chunk sizes,
+compared with a plain ProcessPoolExecutor.map that raises on failure."""
+
+import concurrent.futures
+import time
+
+from toradh.executor import ResultExecutor
+
+N = 20_000
+
+
+def validate(value: int) -> int:
+    if value % 97 == 0:
+        raise ValueError(value)
+    return value * 2
+
+
+def safe_validate(value: int) -> int:
+    try:
+        return validate(value)
+    except ValueError:
+        return -1
+
+
+def main() -> None:
+    with concurrent.futures.ProcessPoolExecutor() as pool:
+        start = time.perf_counter()
+        list(pool.map(safe_validate, range(N), chunksize=256))
+        print(
+            f"ProcessPoolExecutor.map chunksize=256 {time.perf_counter() - start:.3f}s"
+        )
+
+    with ResultExecutor.processes() as pool:
+        for chunksize in (1, 16, 256):
+            start = time.perf_counter()
+            results = list(pool.map(validate, range(N), chunksize=chunksize))
+            elapsed = time.perf_counter() - start
+            errors = sum(1 for r in results if r.is_error())
+            print(
+                f"ResultExecutor.map chunksize={chunksize:<4} {elapsed:.3f}s ({errors} Err)"
+            )
+
+
+if __name__ == "__main__":
+    main()
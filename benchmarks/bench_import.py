@@ -0,0 +1,74 @@
+"""Cost of `import toradh` in a fresh interpreter, from `python -X importtime`.
+
+Exits with status 1 when the median import time goes over the budget, or
+when a module which should be loaded lazily gets imported.
+
+    python -m benchmarks.bench_import --runs 20 --budget-ms 50
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# about twice the cost measured on a development machine, `typing` included
+DEFAULT_BUDGET_MS = 50.0
+
+# only imported once a feature needing them is used
+LAZY_MODULES = ("typeguard", "typing_extensions", "inspect", "asyncio")
+
+
+def import_times(module: str = "toradh") -> Tuple[float, Dict[str, float]]:
+    """Imports module in a fresh interpreter and returns its cumulative import
+    time along with the self time of every module loaded, in milliseconds."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0.0
+    modules: Dict[str, float] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        name = name.strip()
+        modules[name] = int(self_us) / 1000
+        if name == module:
+            total = int(cumulative_us) / 1000
+    return total, modules
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    totals: List[float] = []
+    modules: Dict[str, float] = {}
+    for _ in range(args.runs):
+        total, modules = import_times()
+        totals.append(total)
+    median = statistics.median(totals)
+
+    print(f"import toradh: median {median:.1f} ms over {args.runs} runs")
+    own = {name: ms for name, ms in modules.items() if name.startswith("toradh")}
+    for name, ms in sorted(own.items(), key=lambda item: -item[1]):
+        print(f"  {name:<30} {ms:>6.1f} ms")
+
+    failed = False
+    eager = [name for name in LAZY_MODULES if name in modules]
+    if eager:
+        print(f"FAIL: imported eagerly: {', '.join(eager)}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"FAIL: over the budget of {args.budget_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,33 @@
+"""Cost of the instrumentation counters on the instrumented paths, disabled
+and enabled."""
+
+from benchmarks._timing import best_ns, report
+from toradh import Err, Nothing, instrumentation, set_typecheck_policy
+from toradh.typecheck import get_sample_rate, get_typecheck_policy
+
+
+def main() -> None:
+    previous, rate = get_typecheck_policy(), get_sample_rate()
+    set_typecheck_policy("off")
+    error = ValueError()
+    err = Err(error)
+    nothing = Nothing()
+    cases = (
+        ("Err(...)", lambda: Err(error)),
+        ("Err.unwrap_or", lambda: err.unwrap_or(0)),
+        ("Nothing.unwrap_or", lambda: nothing.unwrap_or(0)),
+    )
+    try:
+        for name, func in cases:
+            baseline = best_ns(func)
+            report(f"{name} [disabled]", baseline, baseline)
+            instrumentation.enable()
+            report(f"{name} [enabled]", best_ns(func), baseline)
+            instrumentation.disable()
+    finally:
+        instrumentation.reset()
+        set_typecheck_policy(previous, sample_rate=rate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Cost of a cache hit with `memoize` compared with `functools.lru_cache`."""
+
+import functools
+
+from benchmarks._timing import best_ns, report
+from toradh import Ok
+from toradh.memo import memoize
+
+
+@functools.lru_cache(maxsize=1024)
+def lru(value: int) -> Ok[int]:
+    return Ok(value)
+
+
+@memoize(maxsize=1024, ttl=60)
+def memo_ttl(value: int) -> Ok[int]:
+    return Ok(value)
+
+
+@memoize(maxsize=1024)
+def memo(value: int) -> Ok[int]:
+    return Ok(value)
+
+
+def main() -> None:
+    baseline = best_ns(lambda: lru(1))
+    report("functools.lru_cache hit", baseline, baseline)
+    report("memoize hit", best_ns(lambda: memo(1)), baseline)
+    report("memoize hit, ttl", best_ns(lambda: memo_ttl(1)), baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Bytes retained per instance, measured with tracemalloc.
+
+The "legacy" classes reproduce the previous layout (per instance `__dict__`
+plus the redundant `_flag` attribute on Some/Nothing) for comparison.
+"""
+
+import tracemalloc
+from typing import Any, Callable
+
+from toradh import Err, Nothing, Ok, Some
+
+N = 100_000
+
+
+class LegacyOk:
+    def __init__(self, value: Any) -> None:
+        self._value = value
+
+
+class LegacyErr:
+    def __init__(self, err: BaseException) -> None:
+        self._err = err
+
+
+class LegacySome:
+    def __init__(self, value: Any) -> None:
+        self._flag = True
+        self._value = value
+
+
+class LegacyNothing:
+    def __init__(self) -> None:
+        self._flag = True
+        self._value = None
+
+
+def bytes_per_instance(factory: Callable[[int], Any], n: int = N) -> float:
+    # the wrapped values are allocated up front so only the wrappers are measured
+    payload = list(range(n))
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [factory(value) for value in payload]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # discount the list holding the instances
+    size -= instances.__sizeof__()
+    return size / n
+
+
+def main() -> None:
+    err = ValueError()
+    cases = (
+        ("Ok", lambda v: LegacyOk(v), lambda v: Ok(v)),
+        ("Err", lambda v: LegacyErr(err), lambda v: Err(err)),
+        ("Some", lambda v: LegacySome(v), lambda v: Some(v)),
+        ("Nothing", lambda v: LegacyNothing(), lambda v: Nothing()),
+    )
+    print(f"{'type':<10} {'legacy':>12} {'current':>12}")
+    for name, legacy, current in cases:
+        print(
+            f"{name:<10} {bytes_per_instance(legacy):>10.1f} B "
+            f"{bytes_per_instance(current):>10.1f} B"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""`OptionMap` lookups against wrapping `dict.get` in `Option.of`, along
+with the memory used by both containers."""
+
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from benchmarks._timing import best_ns, report
+from toradh import Option, set_typecheck_policy
+from toradh.option_map import OptionMap
+from toradh.typecheck import get_sample_rate, get_typecheck_policy
+
+N = 100_000
+
+
+def allocated(build: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    container = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del container
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def main() -> None:
+    previous, rate = get_typecheck_policy(), get_sample_rate()
+    set_typecheck_policy("off")
+    values = [object() for _ in range(N)]
+    plain: Dict[int, Any] = dict(enumerate(values))
+    wrapped = OptionMap(plain)
+    keys = list(range(0, 2 * N, 2))
+    try:
+        baseline = best_ns(lambda: Option.of(plain.get(1)))
+        report("Option.of(dict.get(k)) hit", baseline, baseline)
+        report("OptionMap.get(k) hit", best_ns(lambda: wrapped.get(1)), baseline)
+        baseline = best_ns(lambda: Option.of(plain.get(-1)))
+        report("Option.of(dict.get(k)) miss", baseline, baseline)
+        report("OptionMap.get(k) miss", best_ns(lambda: wrapped.get(-1)), baseline)
+
+        get = plain.get
+        baseline = best_ns(lambda: [Option.of(get(k)) for k in keys], number=5)
+        report(f"{N} x Option.of(dict.get(k))", baseline, baseline)
+        report(
+            f"OptionMap.get_many({N} keys)",
+            best_ns(lambda: wrapped.get_many(keys), number=5),
+            baseline,
+        )
+    finally:
+        set_typecheck_policy(previous, sample_rate=rate)
+
+    dict_bytes = allocated(lambda: dict(enumerate(values)))
+    map_bytes = allocated(lambda: OptionMap(enumerate(values)))
+    print(f"{'memory dict':<40} {dict_bytes / N:>10.1f} B/entry")
+    print(f"{'memory OptionMap':<40} {map_bytes / N:>10.1f} B/entry")
+
+
+if __name__ == "__main__":
+    main()
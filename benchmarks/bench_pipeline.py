@@ -0,0 +1,34 @@
+"""Method chaining over Ok/Err against a fused Pipeline of the same steps."""
+
+from benchmarks._timing import best_ns, report
+from toradh import Err, Ok, Result
+from toradh.pipeline import Pipeline
+
+
+def check(value: int) -> Result[int, ValueError]:
+    return Ok(value) if value < 1_000 else Err(ValueError(value))
+
+
+def inc(value: int) -> int:
+    return value + 1
+
+
+def main() -> None:
+    pipeline = (
+        Pipeline().map(inc).map(inc).and_then(check).map(inc).map(inc).and_then(check)
+    )
+    fused = pipeline.compile()
+    ok, err = Ok(1), Err(ValueError())
+
+    def chained(res: Result[int, ValueError]) -> Result[int, ValueError]:
+        return res.map(inc).map(inc).and_then(check).map(inc).map(inc).and_then(check)
+
+    for label, value in (("Ok input", ok), ("Err input", err)):
+        baseline = best_ns(lambda: chained(value))
+        report(f"method chain [{label}]", baseline, baseline)
+        report(f"pipeline [{label}]", best_ns(lambda: pipeline(value)), baseline)
+        report(f"compiled pipeline [{label}]", best_ns(lambda: fused(value)), baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""Overhead of `@profile` per call, recording every call or a sample."""
+
+from benchmarks._fixtures import find_err, find_ok
+from benchmarks._timing import best_ns, report
+from toradh import set_typecheck_policy
+from toradh.profiling import profile
+from toradh.typecheck import get_sample_rate, get_typecheck_policy
+
+
+def main() -> None:
+    previous, rate = get_typecheck_policy(), get_sample_rate()
+    set_typecheck_policy("off")
+    try:
+        for path, func in (("Ok", find_ok), ("Err", find_err)):
+            baseline = best_ns(func)
+            report(f"bare call [{path}]", baseline, baseline)
+            report(f"@profile [{path}]", best_ns(profile()(func)), baseline)
+            report(
+                f"@profile(sample_rate=0.01) [{path}]",
+                best_ns(profile(sample_rate=0.01)(func)),
+                baseline,
+            )
+    finally:
+        set_typecheck_policy(previous, sample_rate=rate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Bulk operations over a list of Ok/Err instances against ResultArray."""
+
+from benchmarks._timing import best_ns
+from toradh import Err, Ok, is_ok
+from toradh.result_array import ResultArray
+
+N = 100_000
+
+
+def main() -> None:
+    err = ValueError()
+    results = [Ok(i) if i % 10 else Err(err) for i in range(N)]
+    arr = ResultArray.from_results(results)
+
+    cases = (
+        (
+            "count_ok",
+            lambda: sum(1 for r in results if is_ok(r)),
+            lambda: arr.count_ok(),
+        ),
+        (
+            "sum of Ok values",
+            lambda: sum(r.unwrap() for r in results if r.is_ok()),
+            lambda: sum(arr.values()),
+        ),
+        (
+            "partition",
+            lambda: (
+                [r.unwrap() for r in results if isinstance(r, Ok)],
+                [r.kind() for r in results if isinstance(r, Err)],
+            ),
+            lambda: arr.partition(),
+        ),
+        (
+            "map",
+            lambda: [Ok(r.unwrap() + 1) if r.is_ok() else r for r in results],
+            lambda: arr.map(lambda x: x + 1),
+        ),
+    )
+    print(f"{N} rows, 10% errors")
+    for name, listed, columnar in cases:
+        before = best_ns(listed, number=3, repeat=3) / 1e6
+        after = best_ns(columnar, number=3, repeat=3) / 1e6
+        print(f"{name:<20} list {before:>8.2f} ms  ResultArray {after:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
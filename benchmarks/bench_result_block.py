@@ -0,0 +1,60 @@
+"""Early return on Err: `@result_block` against `if is_err(...)` checks and
+`unwrap()` inside a `try`, on the success and failure paths."""
+
+from benchmarks._fixtures import find_ok
+from benchmarks._timing import best_ns, report
+from toradh import Err, Ok, Result, is_err, set_typecheck_policy
+from toradh.block import ResultBlock, result_block
+from toradh.typecheck import get_sample_rate, get_typecheck_policy
+
+
+def fail() -> Result[int, ValueError]:
+    # a fresh exception per call, re-raising a shared one grows its traceback
+    return Err(ValueError("boom"))
+
+
+def checks(second: object) -> Result[int, ValueError]:
+    first = find_ok()
+    if is_err(first):
+        return first
+    res = second()  # type: ignore[operator]
+    if is_err(res):
+        return res
+    return Ok(first.unwrap() + res.unwrap())
+
+
+def unwrap_try(second: object) -> Result[int, ValueError]:
+    try:
+        first = find_ok().unwrap()
+        value = second().unwrap()  # type: ignore[operator]
+    except ValueError as e:
+        return Err(e)
+    return Ok(first + value)
+
+
+@result_block
+def block(second: object) -> ResultBlock[Result[int, ValueError]]:
+    first = yield find_ok()
+    value = yield second()  # type: ignore[operator]
+    return Ok(first + value)
+
+
+def main() -> None:
+    previous, rate = get_typecheck_policy(), get_sample_rate()
+    set_typecheck_policy("off")
+    try:
+        for path, second in (("success", find_ok), ("failure", fail)):
+            baseline = best_ns(lambda: checks(second))
+            report(f"if is_err() checks [{path}]", baseline, baseline)
+            report(
+                f"unwrap() + try [{path}]",
+                best_ns(lambda: unwrap_try(second)),
+                baseline,
+            )
+            report(f"@result_block [{path}]", best_ns(lambda: block(second)), baseline)
+    finally:
+        set_typecheck_policy(previous, sample_rate=rate)
+
+
+if __name__ == "__main__":
+    main()
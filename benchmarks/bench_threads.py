@@ -0,0 +1,124 @@
+"""Throughput of Option/Result hot paths as the thread count grows.
+
+Every thread builds, maps, hashes and unwraps values in a loop, and checks
+what it gets back. With the GIL the total throughput stays flat whatever
+the thread count; on a free-threaded build (3.13t and later) it should grow
+with the threads, unless some shared state makes them contend.
+
+On free-threaded builds the run fails, with status 1, when the scaling
+efficiency (throughput over thread count times the single thread one) of
+any thread count drops under `--min-efficiency`. A wrong value seen by any
+thread fails the run on every build.
+
+    python -m benchmarks.bench_threads --threads 1,2,4,8 --iterations 20000
+    python3.13t -m benchmarks.bench_threads --policy sampled
+"""
+
+import argparse
+import sys
+import threading
+import time
+from typing import List, Optional
+
+from benchmarks._fixtures import ERROR
+from toradh import Err, Nothing, Ok, Option, Some, set_typecheck_policy
+from toradh.typecheck import get_sample_rate, get_typecheck_policy
+
+DEFAULT_MIN_EFFICIENCY = 0.7
+
+
+def gil_enabled() -> bool:
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else bool(check())
+
+
+def double(value: int) -> int:
+    return value * 2
+
+
+def workload(iterations: int) -> int:
+    """Runs the hot paths, returns the number of wrong values seen."""
+    wrong = 0
+    for i in range(1, iterations + 1):
+        if Option.of(i).map(double).unwrap_or(0) != 2 * i:
+            wrong += 1
+        if Option.of(None) is not Nothing() or Option.empty().unwrap_or(i) != i:
+            wrong += 1
+        if Ok(i).map(double).unwrap() != 2 * i:
+            wrong += 1
+        if Err(ERROR).unwrap_or(i) != i:
+            wrong += 1
+        some = Some(i)
+        if hash(some) != hash(Some(i)) or some != Some(i):
+            wrong += 1
+    return wrong
+
+
+def run(threads: int, iterations: int) -> Optional[float]:
+    """Runs the workload on every thread at once, returns the iterations per
+    second over all threads, or None if a wrong value was seen."""
+    barrier = threading.Barrier(threads + 1)
+    wrong: List[int] = []
+
+    def worker() -> None:
+        barrier.wait()
+        wrong.append(workload(iterations))
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    if any(wrong) or len(wrong) != threads:
+        return None
+    return threads * iterations / elapsed
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", default="1,2,4,8")
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--policy", choices=("off", "sampled", "full"), default="off")
+    parser.add_argument("--sample-rate", type=float, default=0.01)
+    parser.add_argument("--min-efficiency", type=float, default=DEFAULT_MIN_EFFICIENCY)
+    args = parser.parse_args(argv)
+    counts = sorted({int(count) for count in args.threads.split(",")} | {1})
+
+    free_threaded = not gil_enabled()
+    build = "free-threaded" if free_threaded else "GIL"
+    print(f"Python {sys.version.split()[0]} ({build}), policy {args.policy}")
+
+    previous, rate = get_typecheck_policy(), get_sample_rate()
+    set_typecheck_policy(args.policy, sample_rate=args.sample_rate)
+    failed = False
+    try:
+        # the first checked call imports typeguard, keep it out of the timings
+        workload(100)
+        single = 0.0
+        for count in counts:
+            runs = [run(count, args.iterations) for _ in range(args.repeat)]
+            if any(result is None for result in runs):
+                print(f"FAIL: wrong values seen with {count} threads")
+                failed = True
+                continue
+            throughput = max(result for result in runs if result is not None)
+            single = single or throughput
+            efficiency = throughput / (count * single)
+            print(
+                f"{count:>3} threads {throughput:>12,.0f} iterations/s"
+                f"  efficiency {efficiency:>5.2f}"
+            )
+            if free_threaded and efficiency < args.min_efficiency:
+                print(f"FAIL: efficiency under {args.min_efficiency:.2f}")
+                failed = True
+    finally:
+        set_typecheck_policy(previous, sample_rate=rate)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
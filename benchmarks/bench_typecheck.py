@@ -0,0 +1,35 @@
+"""Cost of each type check policy compared with a plain method call."""
+
+from benchmarks._timing import best_ns, report
+from toradh import Option, set_typecheck_policy
+from toradh.typecheck import get_sample_rate, get_typecheck_policy
+
+
+class Plain:
+    __slots__ = ("_value",)
+
+    def __init__(self, value: int) -> None:
+        self._value = value
+
+    def unwrap_or(self, default: int) -> int:
+        return self._value
+
+
+def main() -> None:
+    previous, rate = get_typecheck_policy(), get_sample_rate()
+    plain = Plain(1)
+    option = Option.of(1)
+
+    baseline = best_ns(lambda: plain.unwrap_or(0))
+    report("plain method", baseline, baseline)
+    try:
+        for policy, sample_rate in (("off", None), ("sampled", 0.01), ("full", None)):
+            set_typecheck_policy(policy, sample_rate=sample_rate)  # type: ignore
+            label = f"Option.unwrap_or [{policy}]"
+            report(label, best_ns(lambda: option.unwrap_or(0)), baseline)
+    finally:
+        set_typecheck_policy(previous, sample_rate=rate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Validating a 10k row upload and reporting every field error: two passes
+with `Result` (find the failing rows, then check them again field by field)
+against a single pass with `toradh.validated`."""
+
+from typing import Any, Dict, List, Union
+
+from benchmarks._timing import best_ns, report
+from toradh import Err, Ok, set_typecheck_policy
+from toradh.iter import collect_all
+from toradh.typecheck import get_sample_rate, get_typecheck_policy
+from toradh.validated import collect, combine
+
+ROWS = 10_000
+# one row out of BAD_EVERY has two invalid fields
+BAD_EVERY = 10
+
+Row = Dict[str, Any]
+FieldResult = Union[Ok[Any], Err[ValueError]]
+
+
+def check_name(row: Row) -> FieldResult:
+    name = row["name"]
+    return Ok(name) if name else Err(ValueError("empty name"))
+
+
+def check_age(row: Row) -> FieldResult:
+    age = row["age"]
+    return Ok(age) if 0 <= age < 150 else Err(ValueError(f"bad age {age}"))
+
+
+def check_email(row: Row) -> FieldResult:
+    email = row["email"]
+    return Ok(email) if "@" in email else Err(ValueError(f"bad email {email}"))
+
+
+CHECKS = (check_name, check_age, check_email)
+
+
+def make_rows() -> List[Row]:
+    rows = []
+    for i in range(ROWS):
+        bad = i % BAD_EVERY == 0
+        rows.append(
+            {
+                "name": f"user {i}",
+                "age": -1 if bad else 30,
+                "email": "nowhere" if bad else f"user{i}@example.com",
+            }
+        )
+    return rows
+
+
+def first_error(row: Row) -> FieldResult:
+    return check_name(row).and_then(
+        lambda _: check_age(row).and_then(lambda _: check_email(row))
+    )
+
+
+def two_passes(rows: List[Row]) -> List[BaseException]:
+    # the usual Result code: a first pass tells whether the upload is
+    # valid, a second one gathers every error of every row
+    if collect_all(first_error(row) for row in rows).is_ok():
+        return []
+    errors = []
+    for row in rows:
+        for check in CHECKS:
+            res = check(row)
+            if res.is_error():
+                errors.append(res.kind())
+    return errors
+
+
+def single_pass(rows: List[Row]) -> List[BaseException]:
+    validated = collect(
+        combine(check_name(row), check_age(row), check_email(row)) for row in rows
+    )
+    return list(validated.errors)
+
+
+def main() -> None:
+    previous, rate = get_typecheck_policy(), get_sample_rate()
+    set_typecheck_policy("off")
+    rows = make_rows()
+    try:
+        assert len(two_passes(rows)) == len(single_pass(rows))
+        baseline = best_ns(lambda: two_passes(rows), number=5)
+        report(f"Result, two passes ({ROWS} rows)", baseline, baseline)
+        report(
+            f"Validated, one pass ({ROWS} rows)",
+            best_ns(lambda: single_pass(rows), number=5),
+            baseline,
+        )
+    finally:
+        set_typecheck_policy(previous, sample_rate=rate)
+
+
+if __name__ == "__main__":
+    main()
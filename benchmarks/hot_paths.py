@@ -0,0 +1,201 @@
+"""toradh hot paths measured against the equivalent plain Python code.
+
+Every case pairs a toradh snippet with the `try/except` or `is None`
+code it replaces, so the report shows what the abstraction costs.
+"""
+
+import asyncio
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from benchmarks._fixtures import ERROR, find_err, find_ok, find_raise, find_raw
+from benchmarks._timing import best_ns
+from toradh import Err, Ok, Option, is_err, is_ok
+
+
+class Case(NamedTuple):
+    name: str
+    group: str
+    toradh: Callable[[], Any]
+    baseline: Callable[[], Any]
+
+
+DATA: Dict[int, Optional[int]] = {1: 1}
+# read from a global so the baseline tuples are built on every call, not
+# folded into constants
+VALUE = 1
+
+
+def lookup_option(key: int) -> Option[int]:
+    return Option.of(DATA.get(key))
+
+
+def lookup_raw(key: int) -> Optional[int]:
+    return DATA.get(key)
+
+
+def _unwrap_or_raise() -> int:
+    try:
+        return find_raise()
+    except ValueError:
+        return 0
+
+
+def _unwrap_or_else_raise() -> int:
+    try:
+        return find_raise()
+    except ValueError as err:
+        return len(err.args)
+
+
+def _none_check_hit() -> int:
+    value = lookup_raw(1)
+    return value if value is not None else 0
+
+
+def _none_check_miss() -> int:
+    value = lookup_raw(2)
+    return value if value is not None else 0
+
+
+def _none_map() -> Optional[int]:
+    value = lookup_raw(1)
+    return value + 1 if value is not None else None
+
+
+def _is_ok_raw() -> bool:
+    try:
+        find_raw()
+        return True
+    except ValueError:
+        return False
+
+
+def _is_err_raw() -> bool:
+    try:
+        find_raise()
+        return False
+    except ValueError:
+        return True
+
+
+def _increment(value: int) -> int:
+    return value + 1
+
+
+CASES: List[Case] = [
+    # against the (value, error) pairs returned without toradh
+    Case("construct_ok", "construction", lambda: Ok(VALUE), lambda: (VALUE, None)),
+    Case("construct_err", "construction", lambda: Err(ERROR), lambda: (None, ERROR)),
+    Case(
+        "option_of_hit", "construction", lambda: lookup_option(1), lambda: lookup_raw(1)
+    ),
+    Case("unwrap_ok", "unwrap", lambda: find_ok().unwrap(), find_raw),
+    Case("unwrap_or_ok", "unwrap", lambda: find_ok().unwrap_or(0), find_raw),
+    Case("unwrap_or_err", "unwrap", lambda: find_err().unwrap_or(0), _unwrap_or_raise),
+    Case(
+        "unwrap_or_else_err",
+        "unwrap",
+        lambda: find_err().unwrap_or_else(lambda e: len(e.args)),
+        _unwrap_or_else_raise,
+    ),
+    Case(
+        "option_unwrap_or_hit",
+        "unwrap",
+        lambda: lookup_option(1).unwrap_or(0),
+        _none_check_hit,
+    ),
+    Case(
+        "option_unwrap_or_miss",
+        "unwrap",
+        lambda: lookup_option(2).unwrap_or(0),
+        _none_check_miss,
+    ),
+    Case("is_ok", "predicates", lambda: is_ok(find_ok()), _is_ok_raw),
+    Case("is_err", "predicates", lambda: is_err(find_err()), _is_err_raw),
+    Case("method_is_ok", "predicates", lambda: find_ok().is_ok(), _is_ok_raw),
+    Case(
+        "option_map", "combinators", lambda: lookup_option(1).map(_increment), _none_map
+    ),
+]
+
+if sys.version_info >= (3, 10):
+    from benchmarks._dispatch import (
+        match_kind_err,
+        match_kind_ok,
+        try_except_err,
+        try_except_ok,
+    )
+
+    CASES += [
+        Case("match_kind_ok", "dispatch", match_kind_ok, try_except_ok),
+        Case("match_kind_err", "dispatch", match_kind_err, try_except_err),
+    ]
+
+
+async def _consume(value: int) -> None:
+    return None
+
+
+async def _async_if_ok() -> None:
+    await find_ok().async_if_ok(_consume)
+
+
+async def _async_raw() -> None:
+    await _consume(find_raw())
+
+
+# same fields as CASES, both sides are coroutine functions
+ASYNC_CASES: List[Case] = [
+    Case("async_if_ok", "async", _async_if_ok, _async_raw),
+]
+
+
+def _best_async_ns(coro_fn: Callable[[], Any], number: int, repeat: int) -> float:
+    async def loop() -> float:
+        start = time.perf_counter()
+        for _ in range(number):
+            await coro_fn()
+        return time.perf_counter() - start
+
+    timings = [asyncio.run(loop()) for _ in range(repeat)]
+    return min(timings) / number * 1e9
+
+
+def run(
+    number: int = 100_000, repeat: int = 5, only: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Runs every case and returns one record per case."""
+    results = []
+    for case in CASES:
+        if only and only not in case.name:
+            continue
+        results.append(
+            _record(
+                case,
+                best_ns(case.toradh, number, repeat),
+                best_ns(case.baseline, number, repeat),
+            )
+        )
+    for case in ASYNC_CASES:
+        if only and only not in case.name:
+            continue
+        results.append(
+            _record(
+                case,
+                _best_async_ns(case.toradh, number, repeat),
+                _best_async_ns(case.baseline, number, repeat),
+            )
+        )
+    return results
+
+
+def _record(case: Case, toradh_ns: float, baseline_ns: float) -> Dict[str, Any]:
+    return {
+        "name": case.name,
+        "group": case.group,
+        "toradh_ns": round(toradh_ns, 2),
+        "baseline_ns": round(baseline_ns, 2),
+        "overhead": round(toradh_ns / baseline_ns, 3),
+    }
@@ -1,6 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import datetime
 import sys
+from typing import List
 
 import pytest
 
@@ -20,6 +21,24 @@ class Movie:
     released: datetime.datetime
 
 
+@dataclass
+class FakeClock:
+    """Time source of the tests, set by hand through `now`, or advanced
+    by the next of `steps` on every read."""
+
+    now: int = 0
+    steps: List[int] = field(default_factory=list)
+
+    def __call__(self) -> int:
+        self.now += self.steps.pop(0) if self.steps else 0
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
 @pytest.fixture
 def simple_movie() -> Movie:
     return Movie(
@@ -58,3 +58,20 @@ def test_match_over_err(mock_err: Result[Movie, Exception]) -> None:
                 mock_err.unwrap()
             case Err(KeyError()):
                 raise AssertionError("match a KeyError when ValueError was expected")
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires Python 3.10 or higher")
+def test_match_hashable_results() -> None:
+    seen = {Ok(1), Err(KeyError("k")), Some(2), Nothing()}
+    kinds = []
+    for value in seen:
+        match value:
+            case Ok(1):
+                kinds.append("ok")
+            case Err(KeyError()):
+                kinds.append("err")
+            case Some(2):
+                kinds.append("some")
+            case Nothing():
+                kinds.append("nothing")
+    assert sorted(kinds) == ["err", "nothing", "ok", "some"]
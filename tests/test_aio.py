@@ -0,0 +1,259 @@
+import asyncio
+from typing import Any, AsyncIterator, List, Optional, Union
+
+import pytest
+
+from toradh import Err, Ok
+from toradh.aio import (
+    achunked,
+    acollect,
+    afilter_err,
+    afilter_ok,
+    amap_ok,
+    apartition,
+    as_completed_results,
+    collect_results,
+    gather_results,
+)
+
+
+async def echo(value: int, delay: float = 0.0) -> Ok[int]:
+    await asyncio.sleep(delay)
+    return Ok(value)
+
+
+async def fail(delay: float = 0.0) -> Err[ValueError]:
+    await asyncio.sleep(delay)
+    return Err(ValueError("bad"))
+
+
+async def boom() -> int:
+    raise KeyError("missing")
+
+
+def test_gather_keeps_input_order() -> None:
+    calls = [echo(i, delay=(5 - i) / 1000) for i in range(5)]
+    results = asyncio.run(gather_results(calls, limit=2))
+    assert results == [Ok(i) for i in range(5)]
+
+
+def test_gather_wraps_values_and_exceptions() -> None:
+    async def plain() -> int:
+        return 3
+
+    results = asyncio.run(gather_results([plain(), boom(), fail()]))
+    assert results[0] == Ok(3)
+    assert isinstance(results[1].kind(), KeyError)
+    assert isinstance(results[2].kind(), ValueError)
+
+
+def test_limit_caps_in_flight_calls() -> None:
+    in_flight: List[int] = []
+    peak = 0
+
+    async def tracked(value: int) -> int:
+        nonlocal peak
+        in_flight.append(value)
+        peak = max(peak, len(in_flight))
+        await asyncio.sleep(0.001)
+        in_flight.remove(value)
+        return value
+
+    results = asyncio.run(gather_results((tracked(i) for i in range(20)), limit=3))
+    assert [r.unwrap() for r in results] == list(range(20))
+    assert peak == 3
+
+
+def test_timeout_returns_err() -> None:
+    results = asyncio.run(gather_results([echo(1, delay=1), echo(2)], timeout=0.01))
+    assert isinstance(results[0].kind(), TimeoutError)
+    assert results[1] == Ok(2)
+
+
+def test_timeout_raised_by_the_call_is_kept() -> None:
+    error = TimeoutError("upstream timed out")
+
+    async def timing_out() -> int:
+        raise error
+
+    for timeout in (None, 1.0):
+        results = asyncio.run(gather_results([timing_out()], timeout=timeout))
+        assert results[0].kind() is error
+
+
+def test_fail_fast_cancels_the_rest() -> None:
+    finished: List[int] = []
+
+    async def slow(value: int) -> int:
+        await asyncio.sleep(0.5)
+        finished.append(value)
+        return value
+
+    calls = [fail(), slow(1), slow(2), slow(3)]
+    results = asyncio.run(gather_results(calls, limit=2, fail_fast=True))
+    assert isinstance(results[0].kind(), ValueError)
+    assert all(isinstance(r.kind(), asyncio.CancelledError) for r in results[1:])
+    assert finished == []
+
+
+def test_collect_results() -> None:
+    assert asyncio.run(collect_results([echo(i) for i in range(3)])) == Ok([0, 1, 2])
+
+    res = asyncio.run(collect_results([echo(1, delay=0.5), fail()], limit=2))
+    assert isinstance(res.kind(), ValueError)
+
+
+def test_as_completed_yields_in_completion_order() -> None:
+    async def run() -> List[int]:
+        order = []
+        calls = [echo(0, delay=0.02), echo(1), echo(2, delay=0.01)]
+        async for index, res in as_completed_results(calls):
+            assert res == Ok(index)
+            order.append(index)
+        return order
+
+    assert asyncio.run(run()) == [1, 2, 0]
+
+
+def test_invalid_limit() -> None:
+    async def run() -> None:
+        async for _ in as_completed_results([], limit=0):
+            pass
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+
+
+async def stream(
+    count: int, pulled: Optional[List[int]] = None, delay: float = 0.0
+) -> AsyncIterator[Union[Ok[int], Err[ValueError]]]:
+    # every third item fails
+    for i in range(count):
+        if pulled is not None:
+            pulled.append(i)
+        await asyncio.sleep(delay)
+        yield Err(ValueError(i)) if i % 3 == 2 else Ok(i)
+
+
+async def drain(agen: AsyncIterator[Any]) -> List[Any]:
+    return [item async for item in agen]
+
+
+def test_afilter() -> None:
+    assert asyncio.run(drain(afilter_ok(stream(6)))) == [0, 1, 3, 4]
+    errors = asyncio.run(drain(afilter_err(stream(6))))
+    assert [e.args for e in errors] == [(2,), (5,)]
+
+
+async def double(value: int) -> int:
+    await asyncio.sleep((5 - value % 5) / 1000)
+    return value * 2
+
+
+def test_amap_ok_keeps_order_and_passes_errors() -> None:
+    results = asyncio.run(drain(amap_ok(stream(7), double, limit=3)))
+    assert [r.kind() if r.is_ok() else "err" for r in results] == [
+        0,
+        2,
+        "err",
+        6,
+        8,
+        "err",
+        12,
+    ]
+
+
+def test_amap_ok_unordered_and_failures() -> None:
+    async def check(value: int) -> int:
+        if value == 4:
+            raise KeyError(value)
+        return await double(value)
+
+    results = asyncio.run(drain(amap_ok(stream(6), check, ordered=False)))
+    assert sorted(r.kind() for r in results if r.is_ok()) == [0, 2, 6]
+    assert sorted(type(r.kind()).__name__ for r in results if r.is_error()) == [
+        "KeyError",
+        "ValueError",
+        "ValueError",
+    ]
+
+
+def test_amap_ok_limits_concurrency_and_read_ahead() -> None:
+    running = peak = 0
+    pulled: List[int] = []
+
+    async def track(value: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return value
+
+    async def main() -> None:
+        agen = amap_ok(stream(100, pulled), track, limit=4)
+        await agen.__anext__()
+        # the consumer stalls, the input must not be read any further
+        await asyncio.sleep(0.02)
+        assert len(pulled) <= 5
+        await agen.aclose()
+        assert peak <= 4
+
+    asyncio.run(main())
+
+
+def test_apartition() -> None:
+    async def main() -> None:
+        values, errors = apartition(stream(30), maxsize=2)
+        oks, errs = await asyncio.gather(drain(values), drain(errors))
+        assert oks == [i for i in range(30) if i % 3 != 2]
+        assert [e.args[0] for e in errs] == [i for i in range(30) if i % 3 == 2]
+
+    asyncio.run(main())
+
+
+def test_apartition_bounds_the_buffer() -> None:
+    async def main() -> None:
+        pulled: List[int] = []
+        values, errors = apartition(stream(100, pulled), maxsize=2)
+        first = await values.__anext__()
+        assert first == 0
+        # reads ahead until the error buffer is full, then waits
+        task = asyncio.ensure_future(drain(values))
+        await asyncio.sleep(0.01)
+        assert not task.done()
+        assert len(pulled) < 10
+        rest = await asyncio.gather(task, drain(errors))
+        assert len(rest[0]) + 1 + len(rest[1]) == 100
+
+    asyncio.run(main())
+
+
+def test_acollect() -> None:
+    pulled: List[int] = []
+    result = asyncio.run(acollect(stream(10, pulled)))
+    assert isinstance(result, Err) and result.kind().args == (2,)
+    assert pulled == [0, 1, 2]
+
+    async def oks() -> AsyncIterator[Ok[int]]:
+        for i in range(3):
+            yield Ok(i)
+
+    assert asyncio.run(acollect(oks())) == Ok([0, 1, 2])
+
+
+def test_achunked_by_size() -> None:
+    chunks = asyncio.run(drain(achunked(stream(5), 2)))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    with pytest.raises(ValueError):
+        asyncio.run(drain(achunked(stream(5), 0)))
+
+
+def test_achunked_by_time() -> None:
+    async def slow() -> AsyncIterator[int]:
+        for i in range(4):
+            yield i
+            await asyncio.sleep(0.03 if i == 1 else 0)
+
+    chunks = asyncio.run(drain(achunked(slow(), 10, max_delay=0.01)))
+    assert chunks == [[0, 1], [2, 3]]
@@ -0,0 +1,88 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from toradh import Err, Ok, Result
+from toradh.async_result import AsyncResult
+
+
+async def fetch(value: int) -> Result[int, KeyError]:
+    await asyncio.sleep(0)
+    return Ok(value) if value >= 0 else Err(KeyError(value))
+
+
+async def adouble(value: int) -> int:
+    await asyncio.sleep(0)
+    return value * 2
+
+
+async def ahalf(value: int) -> Result[int, ValueError]:
+    return Ok(value // 2) if value % 2 == 0 else Err(ValueError(value))
+
+
+def run(aw: Any) -> Any:
+    async def main() -> Any:
+        return await aw
+
+    return asyncio.run(main())
+
+
+def test_sync_and_async_steps() -> None:
+    chain = AsyncResult(fetch(3)).map(adouble).map(str).and_then(lambda s: Ok(s + "!"))
+    assert run(chain) == Ok("6!")
+
+
+def test_and_then_async() -> None:
+    assert run(AsyncResult(fetch(4)).and_then(ahalf).map(adouble)) == Ok(4)
+    res = run(AsyncResult(fetch(3)).and_then(ahalf).map(adouble))
+    assert isinstance(res, Err) and isinstance(res.kind(), ValueError)
+
+
+def test_err_skips_ok_steps() -> None:
+    calls: List[int] = []
+
+    def record(value: int) -> int:
+        calls.append(value)
+        return value
+
+    res = run(AsyncResult(fetch(-1)).map(record).and_then(ahalf))
+    assert isinstance(res.kind(), KeyError)
+    assert calls == []
+
+
+def test_map_err_and_or_else() -> None:
+    async def wrap(err: KeyError) -> ValueError:
+        return ValueError(f"missing {err.args[0]}")
+
+    async def recover(err: BaseException) -> Result[int, BaseException]:
+        return Ok(0)
+
+    res = run(AsyncResult(fetch(-2)).map_err(wrap))
+    assert str(res.kind()) == "missing -2"
+    assert run(AsyncResult(fetch(-2)).or_else(recover).map(adouble)) == Ok(0)
+    assert run(AsyncResult(fetch(5)).map_err(wrap).or_else(recover)) == Ok(5)
+
+
+def test_result_source_and_branches() -> None:
+    base: AsyncResult[int, Exception] = AsyncResult(Ok(2))
+    assert run(base.map(adouble)) == Ok(4)
+    assert run(base.map(str)) == Ok("2")
+    assert run(base) == Ok(2)
+
+
+def test_exceptions_propagate() -> None:
+    def boom(value: int) -> int:
+        raise RuntimeError(value)
+
+    with pytest.raises(RuntimeError):
+        run(AsyncResult(fetch(1)).map(boom))
+
+
+def test_reusable_chain() -> None:
+    chain = AsyncResult.chain().map(adouble).and_then(ahalf)
+    assert run(chain.on(fetch(3))) == Ok(3)
+    assert run(chain.on(Ok(5))) == Ok(5)
+    assert isinstance(run(chain.on(fetch(-1))).kind(), KeyError)
+    with pytest.raises(TypeError):
+        run(chain)
@@ -0,0 +1,106 @@
+import asyncio
+from typing import Any, List, Union
+
+import pytest
+
+from toradh import Err, Ok, Result
+from toradh.block import AsyncResultBlock, Return, ResultBlock, result_block
+
+
+def half(value: int) -> Result[int, ValueError]:
+    if value % 2:
+        return Err(ValueError(f"{value} is odd"))
+    return Ok(value // 2)
+
+
+@result_block
+def quarter(value: int) -> ResultBlock[Result[int, ValueError]]:
+    once = yield half(value)
+    twice = yield half(once)
+    return Ok(twice)
+
+
+def test_sync_block_ok() -> None:
+    assert quarter(8) == Ok(2)
+
+
+def test_sync_block_returns_first_err() -> None:
+    res = quarter(6)
+    assert res.is_error()
+    assert str(res.kind()) == "3 is odd"
+
+
+def test_sync_block_stops_and_cleans_up() -> None:
+    steps: List[str] = []
+
+    @result_block
+    def body() -> ResultBlock[Any]:
+        try:
+            steps.append("start")
+            yield Err(KeyError())
+            steps.append("unreachable")
+        finally:
+            steps.append("finally")
+        return Ok(1)
+
+    assert body().is_error()
+    assert steps == ["start", "finally"]
+
+
+def test_sync_block_return_marker_and_errors() -> None:
+    @result_block
+    def early() -> ResultBlock[Any]:
+        yield Return(Ok("early"))
+        return Ok("late")
+
+    assert early() == Ok("early")
+
+    @result_block
+    def wrong() -> ResultBlock[Any]:
+        yield 1  # type: ignore[misc]
+
+    with pytest.raises(TypeError):
+        wrong()
+
+    with pytest.raises(TypeError):
+        result_block(lambda: Ok(1))  # type: ignore[arg-type, return-value]
+
+
+def test_exceptions_in_body_propagate() -> None:
+    @result_block
+    def body() -> ResultBlock[Any]:
+        yield Ok(1)
+        raise RuntimeError("bug")
+
+    with pytest.raises(RuntimeError):
+        body()
+
+
+def test_async_block() -> None:
+    async def ahalf(value: int) -> Result[int, ValueError]:
+        await asyncio.sleep(0)
+        return half(value)
+
+    closed: List[bool] = []
+
+    @result_block
+    async def aquarter(value: int) -> AsyncResultBlock[Result[int, ValueError]]:
+        try:
+            once = yield await ahalf(value)
+            twice = yield await ahalf(once)
+            yield Return(Ok(twice))
+        finally:
+            closed.append(True)
+
+    @result_block
+    async def nothing() -> AsyncResultBlock[None]:
+        yield Ok(1)
+
+    async def main() -> List[Union[Result[int, ValueError], None]]:
+        return [await aquarter(8), await aquarter(6), await nothing()]
+
+    done, failed, empty = asyncio.run(main())
+    assert done == Ok(2)
+    assert failed is not None and failed.is_error()
+    assert empty is None
+    assert closed == [True, True]
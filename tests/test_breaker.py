@@ -0,0 +1,187 @@
+import asyncio
+from typing import List, Tuple, Union
+
+import pytest
+
+from tests.conftest import FakeClock
+from toradh import Err, Ok
+from toradh.breaker import CircuitBreaker, CircuitOpenError
+
+
+def make_breaker(
+    clock: FakeClock, transitions: List[Tuple[str, str]], half_open_probes: int = 1
+) -> CircuitBreaker:
+    return CircuitBreaker(
+        {TimeoutError: 0.5, ConnectionError: 0.9},
+        window=10,
+        min_calls=4,
+        open_for=5,
+        half_open_probes=half_open_probes,
+        clock=clock,
+        on_state_change=lambda old, new: transitions.append((old, new)),
+    )
+
+
+def state_of(breaker: CircuitBreaker) -> str:
+    # breaker.state changes between reads, mypy would keep the narrowed value
+    return breaker.state
+
+
+def respond(error: Union[BaseException, None]) -> Union[Ok[int], Err[BaseException]]:
+    return Ok(1) if error is None else Err(error)
+
+
+def test_opens_over_threshold_and_rejects(clock: FakeClock) -> None:
+    transitions: List[Tuple[str, str]] = []
+    breaker = make_breaker(clock, transitions)
+    calls: List[int] = []
+
+    @breaker
+    def fetch(
+        error: Union[BaseException, None] = None,
+    ) -> Union[Ok[int], Err[BaseException]]:
+        calls.append(1)
+        return respond(error)
+
+    fetch()
+    fetch()
+    fetch(TimeoutError())
+    assert state_of(breaker) == "closed"  # below min_calls
+    fetch(TimeoutError())
+    assert state_of(breaker) == "open"
+    assert transitions == [("closed", "open")]
+    assert breaker.failure_rates()["TimeoutError"] == 0.5
+
+    rejected = fetch()
+    assert rejected is breaker.rejection
+    assert isinstance(rejected.kind(), CircuitOpenError)
+    assert len(calls) == 4
+    with pytest.raises(CircuitOpenError):
+        rejected.unwrap()
+
+
+def test_other_errors_count_as_successes(clock: FakeClock) -> None:
+    transitions: List[Tuple[str, str]] = []
+    breaker = make_breaker(clock, transitions)
+    for _ in range(10):
+        breaker.call(respond, KeyError())
+    assert state_of(breaker) == "closed"
+
+
+def test_subclasses_count_towards_their_base(clock: FakeClock) -> None:
+    transitions: List[Tuple[str, str]] = []
+    breaker = make_breaker(clock, transitions)
+    for _ in range(4):
+        breaker.call(respond, ConnectionResetError())
+    assert state_of(breaker) == "open"
+
+
+def test_raised_exceptions_are_recorded(clock: FakeClock) -> None:
+    transitions: List[Tuple[str, str]] = []
+    breaker = make_breaker(clock, transitions)
+
+    def boom() -> Ok[int]:
+        raise TimeoutError()
+
+    for _ in range(4):
+        with pytest.raises(TimeoutError):
+            breaker.call(boom)
+    assert state_of(breaker) == "open"
+
+
+def test_window_slides(clock: FakeClock) -> None:
+    transitions: List[Tuple[str, str]] = []
+    breaker = make_breaker(clock, transitions)
+    breaker.call(respond, TimeoutError())
+    breaker.call(respond, TimeoutError())
+    clock.now = 20  # the failures above fell out of the window
+    breaker.call(respond, None)
+    breaker.call(respond, None)
+    breaker.call(respond, TimeoutError())
+    breaker.call(respond, None)
+    assert state_of(breaker) == "closed"
+
+
+def test_half_open_probe_closes_or_reopens(clock: FakeClock) -> None:
+    transitions: List[Tuple[str, str]] = []
+    breaker = make_breaker(clock, transitions)
+    for _ in range(4):
+        breaker.call(respond, TimeoutError())
+    clock.now = 5
+    assert state_of(breaker) == "half_open"
+    assert isinstance(breaker.call(respond, TimeoutError()).kind(), TimeoutError)
+    assert state_of(breaker) == "open"
+
+    clock.now = 10
+    assert breaker.call(respond, None) == Ok(1)
+    assert state_of(breaker) == "closed"
+    assert transitions == [
+        ("closed", "open"),
+        ("open", "half_open"),
+        ("half_open", "open"),
+        ("open", "half_open"),
+        ("half_open", "closed"),
+    ]
+
+
+def test_half_open_limits_probes(clock: FakeClock) -> None:
+    transitions: List[Tuple[str, str]] = []
+    breaker = make_breaker(clock, transitions, half_open_probes=2)
+    for _ in range(4):
+        breaker.call(respond, TimeoutError())
+    clock.now = 5
+
+    def nested() -> object:
+        # while this probe runs, only one more call may go through
+        second = breaker.call(respond, None)
+        third = breaker.call(respond, None)
+        assert second == Ok(1)
+        assert third is breaker.rejection
+        return Ok(1)
+
+    breaker.call(nested)
+    assert state_of(breaker) == "closed"
+
+
+def test_reset(clock: FakeClock) -> None:
+    transitions: List[Tuple[str, str]] = []
+    breaker = make_breaker(clock, transitions)
+    for _ in range(4):
+        breaker.call(respond, TimeoutError())
+    breaker.reset()
+    assert state_of(breaker) == "closed"
+    assert breaker.failure_rates() == {"TimeoutError": 0.0, "ConnectionError": 0.0}
+
+
+def test_async(clock: FakeClock) -> None:
+    transitions: List[Tuple[str, str]] = []
+    breaker = make_breaker(clock, transitions)
+
+    @breaker
+    async def fetch(error: Union[BaseException, None] = None) -> object:
+        await asyncio.sleep(0)
+        return respond(error)
+
+    async def main() -> None:
+        for _ in range(4):
+            await fetch(TimeoutError())
+        assert (await fetch()) is breaker.rejection
+        clock.now = 5
+        probe = asyncio.ensure_future(fetch())
+        await asyncio.sleep(0)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        # the cancelled probe gave its slot back
+        assert state_of(breaker) == "half_open"
+        assert await fetch() == Ok(1)
+        assert state_of(breaker) == "closed"
+
+    asyncio.run(main())
+
+
+def test_invalid_settings() -> None:
+    with pytest.raises(ValueError):
+        CircuitBreaker({TimeoutError: 0})
+    with pytest.raises(ValueError):
+        CircuitBreaker({TimeoutError: 0.5}, min_calls=0)
@@ -0,0 +1,118 @@
+import asyncio
+import functools
+from typing import Any, Callable
+
+import pytest
+
+from toradh import Err, Ok, catch
+
+
+@catch(KeyError, ValueError)
+def parse(raw: dict) -> int:
+    return int(raw["id"])
+
+
+def test_returns_ok_or_err() -> None:
+    assert parse({"id": "1"}) == Ok(1)
+    assert isinstance(parse({}).kind(), KeyError)
+    assert isinstance(parse({"id": "x"}).kind(), ValueError)
+
+
+def test_other_exceptions_propagate() -> None:
+    with pytest.raises(TypeError):
+        parse(None)  # type: ignore[arg-type]
+
+
+def test_bare_decorator_catches_exception() -> None:
+    @catch
+    def fail() -> int:
+        raise RuntimeError("boom")
+
+    assert isinstance(fail().kind(), RuntimeError)
+    assert fail.__name__ == "fail"
+
+
+def test_strip_traceback() -> None:
+    @catch(ValueError, strip_traceback=True)
+    def fail() -> int:
+        raise ValueError()
+
+    @catch(ValueError)
+    def keep() -> int:
+        raise ValueError()
+
+    stripped, kept = fail(), keep()
+    assert isinstance(stripped, Err) and isinstance(kept, Err)
+    assert stripped.kind().__traceback__ is None
+    assert kept.kind().__traceback__ is not None
+
+
+def test_async_functions() -> None:
+    @catch(KeyError, strip_traceback=True)
+    async def lookup(key: str) -> int:
+        await asyncio.sleep(0)
+        return {"a": 1}[key]
+
+    assert asyncio.run(lookup("a")) == Ok(1)
+    res = asyncio.run(lookup("b"))
+    assert isinstance(res, Err)
+    assert res.kind().__traceback__ is None
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(TypeError):
+        catch("ValueError")  # type: ignore[call-overload]
+
+
+def test_keeps_any_signature() -> None:
+    @catch(ValueError)
+    def build(
+        a: Any, /, b: Any, c: Any = 2, *rest: Any, d: Any, e: Any = 5, **extra: Any
+    ) -> tuple:
+        return (a, b, c, rest, d, e, extra)
+
+    assert build(1, 2, d=4) == Ok((1, 2, 2, (), 4, 5, {}))
+    assert build(1, b=2, c=3, d=4, x=0) == Ok((1, 2, 3, (), 4, 5, {"x": 0}))
+    assert build(1, 2, 3, 9, d=4, e=6) == Ok((1, 2, 3, (9,), 4, 6, {}))
+    with pytest.raises(TypeError):
+        build(1, 2)  # type: ignore[call-arg]
+
+    @catch(ValueError)
+    def keyword_only(*, flag: bool = False) -> bool:
+        return flag
+
+    assert keyword_only(flag=True) == Ok(True)
+
+    # builtins without an inspectable signature fall back to *args/**kwargs
+    assert isinstance(catch(ValueError)(int)("x").kind(), ValueError)
+
+
+def test_keeps_the_signature_of_decorated_functions() -> None:
+    # functools.wraps sets __wrapped__, the wrapper takes other parameters
+    def add_offset(func: Callable[[int, int], int]) -> Callable[[int], int]:
+        @functools.wraps(func)
+        def wrapper(x: int) -> int:
+            return func(x, 10)
+
+        return wrapper
+
+    @catch(ValueError)
+    @add_offset
+    def add(x: int, y: int) -> int:
+        return x + y
+
+    assert add(1) == Ok(11)
+
+
+def test_any_callable() -> None:
+    parse_binary = catch(ValueError)(functools.partial(int, base=2))
+    assert parse_binary("101") == Ok(5)
+    assert isinstance(parse_binary("2").kind(), ValueError)
+
+    class Parser:
+        def __call__(self, raw: str) -> int:
+            return int(raw)
+
+    parse = catch(ValueError)(Parser())
+    assert parse("3") == Ok(3)
+    assert isinstance(parse("x").kind(), ValueError)
@@ -0,0 +1,165 @@
+import json
+from typing import Any, Iterator, List, cast
+
+import pytest
+
+from toradh import Err, Nothing, Ok, Some
+from toradh import codec
+from toradh.codec import Codec, CodecError, Encodable, ExceptionRegistry, RemoteError
+
+
+class CartNotFoundError(RuntimeError):
+    def __init__(self, cart_id: int) -> None:
+        super().__init__(f"cart {cart_id} not found")
+        self.cart_id = cart_id
+
+
+VALUES: List[Encodable] = [
+    Ok({"id": 1, "items": ["a"]}),
+    Err(KeyError("id")),
+    Some(3),
+    Nothing(),
+]
+
+
+def same(left: Encodable, right: Encodable) -> bool:
+    return type(left) is type(right) and repr(left) == repr(right)
+
+
+def error_of(value: Encodable) -> Any:
+    assert isinstance(value, Err)
+    return value.kind()
+
+
+@pytest.mark.parametrize("value", VALUES, ids=repr)
+def test_binary_round_trip(value: Encodable) -> None:
+    assert same(codec.loads(codec.dumps(value)), value)
+
+
+@pytest.mark.parametrize("value", VALUES, ids=repr)
+def test_json_round_trip(value: Encodable) -> None:
+    payload = json.loads(json.dumps(codec.to_json(value)))
+    assert same(codec.from_json(payload), value)
+
+
+def test_many_frames() -> None:
+    data = codec.dumps_many(VALUES * 3)
+    decoded = list(codec.iter_loads(data))
+    assert len(decoded) == len(VALUES) * 3
+    assert all(same(a, b) for a, b in zip(decoded, VALUES * 3))
+
+
+def test_err_drops_traceback_and_keeps_cause() -> None:
+    try:
+        try:
+            raise KeyError("id")
+        except KeyError as e:
+            raise ValueError("lookup failed") from e
+    except ValueError as e:
+        err = Err(e)
+
+    decoded = error_of(codec.loads(codec.dumps(err)))
+    assert isinstance(decoded, ValueError)
+    assert decoded.__traceback__ is None
+    assert isinstance(decoded.__cause__, KeyError)
+
+    without_cause = Codec(include_cause=False)
+    assert error_of(without_cause.loads(without_cause.dumps(err))).__cause__ is None
+
+
+def test_unknown_exception_types() -> None:
+    decoded = error_of(codec.loads(codec.dumps(Err(CartNotFoundError(4)))))
+    assert isinstance(decoded, RemoteError)
+    assert decoded.type_name.endswith("CartNotFoundError")
+
+    # a RemoteError is sent again under its original name
+    again = error_of(codec.loads(codec.dumps(Err(decoded))))
+    assert again.type_name == decoded.type_name
+
+
+def test_registered_exception_types() -> None:
+    registry = ExceptionRegistry()
+    registry.register(
+        CartNotFoundError,
+        name="cart-not-found",
+        encode=lambda e: (cast(CartNotFoundError, e).cart_id,),
+        decode=lambda args: CartNotFoundError(*args),
+    )
+    custom = Codec(registry=registry)
+
+    decoded = error_of(custom.loads(custom.dumps(Err(CartNotFoundError(4)))))
+    assert isinstance(decoded, CartNotFoundError)
+    assert decoded.cart_id == 4
+
+    payload = custom.to_json(Err(CartNotFoundError(4)))
+    assert payload["err"]["type"] == "cart-not-found"
+    assert error_of(custom.from_json(payload)).cart_id == 4
+
+
+def test_streaming_json() -> None:
+    values: List[Encodable] = VALUES * 10
+    document = "".join(codec.iterencode_json(values))
+    assert len(json.loads(document)) == len(values)
+
+    # decode out of arbitrary small chunks
+    chunks = [document[i : i + 7] for i in range(0, len(document), 7)]
+    decoded = list(codec.iterdecode_json(chunks))
+    assert all(same(a, b) for a, b in zip(decoded, values))
+    assert len(decoded) == len(values)
+
+    assert list(codec.iterdecode_json(codec.iterencode_json([]))) == []
+
+
+def test_streaming_json_values_cut_anywhere() -> None:
+    values: List[Encodable] = [Ok([1.5e-3, -2, True, None, "x\u00e9"]), Nothing()]
+    document = "".join(codec.iterencode_json(values))
+    for cut in range(len(document) + 1):
+        chunks = [document[:cut], document[cut:]]
+        decoded = list(codec.iterdecode_json(chunks))
+        assert all(same(a, b) for a, b in zip(decoded, values))
+        assert len(decoded) == len(values)
+
+
+def test_streaming_json_fails_on_the_first_invalid_value() -> None:
+    def chunks() -> Iterator[str]:
+        yield '[{"ok": 1}}, '
+        # never reached
+        raise AssertionError("kept reading")
+
+    decoded = codec.iterdecode_json(chunks())
+    assert same(next(decoded), Ok(1))
+    with pytest.raises(CodecError, match="expected ','"):
+        next(decoded)
+    with pytest.raises(CodecError, match="character 19"):
+        list(codec.iterdecode_json(['[{"ok": 1}, ', '{"ok": tru}]']))
+
+
+def test_invalid_payloads() -> None:
+    with pytest.raises(CodecError):
+        codec.loads(b"\x09")
+    with pytest.raises(CodecError):
+        codec.loads(codec.dumps(Ok(1))[:-1])
+    with pytest.raises(CodecError):
+        codec.loads(codec.dumps(Ok(1)) + b"\x00")
+    with pytest.raises(CodecError):
+        codec.from_json({"maybe": 1})
+    with pytest.raises(CodecError):
+        list(codec.iterdecode_json(['[{"ok":1}']))
+    with pytest.raises(CodecError):
+        codec.dumps(1)  # type: ignore[arg-type]
+    with pytest.raises(CodecError):
+        codec.loads(b"\x01\x01x")
+    with pytest.raises(CodecError):
+        codec.loads(b"\x01\x01\xff")
+    with pytest.raises(CodecError):
+        list(codec.iter_loads(b"\x03\x01{"))
+
+
+def test_values_not_json_serializable() -> None:
+    # encoding them as their repr would decode them as strings
+    with pytest.raises(CodecError):
+        codec.dumps(Ok(object()))
+    with pytest.raises(CodecError):
+        codec.dumps_many([Ok(1), Some({1, 2})])
+    with pytest.raises(CodecError):
+        list(codec.iterencode_json([Ok(object())]))
@@ -0,0 +1,96 @@
+import collections.abc
+
+import pytest
+
+from toradh import Err, Ok
+from toradh.dispatch import UnhandledTypeError, dispatch
+
+
+class NotFound(KeyError):
+    pass
+
+
+handle = dispatch(
+    {
+        int: lambda value: value,
+        KeyError: lambda err: -1,
+        ValueError: lambda err: -2,
+        Exception: lambda err: -3,
+    }
+)
+
+
+def test_dispatches_on_type() -> None:
+    assert handle(Ok(5).kind()) == 5
+    assert handle(Err(KeyError()).kind()) == -1
+    assert handle(Err(ValueError()).kind()) == -2
+
+
+def test_resolves_closest_base_regardless_of_order() -> None:
+    assert handle(NotFound()) == -1
+    assert handle(True) is True
+    assert handle(RuntimeError()) == -3
+    assert handle.handler_for(NotFound) is handle.handler_for(KeyError)
+
+
+def test_unhandled_type_raises() -> None:
+    with pytest.raises(UnhandledTypeError, match="no handler for str"):
+        handle("x")
+    # the miss is cached too
+    with pytest.raises(UnhandledTypeError):
+        handle("y")
+    assert handle.handler_for(str) is None
+
+
+def test_default_handler() -> None:
+    handler = dispatch({int: str}, default=lambda value: "other")
+    assert handler(1) == "1"
+    assert handler(b"") == "other"
+
+
+def test_virtual_subclasses() -> None:
+    class Registry:
+        pass
+
+    collections.abc.Mapping.register(Registry)
+    handler = dispatch({collections.abc.Mapping: lambda value: "mapping"})
+    assert handler(Registry()) == "mapping"
+
+
+def test_invalid_table() -> None:
+    with pytest.raises(TypeError):
+        dispatch({"int": str})  # type: ignore[dict-item]
+    with pytest.raises(TypeError):
+        dispatch({int: 1})  # type: ignore[arg-type]
+
+
+def test_virtual_subclasses_resolve_in_registration_order() -> None:
+    class Both:
+        pass
+
+    collections.abc.Sized.register(Both)
+    collections.abc.Hashable.register(Both)
+    sized_first = dispatch(
+        {
+            collections.abc.Sized: lambda value: 1,
+            collections.abc.Hashable: lambda value: 2,
+        }
+    )
+    hashable_first = dispatch(
+        {
+            collections.abc.Hashable: lambda value: 2,
+            collections.abc.Sized: lambda value: 1,
+        }
+    )
+    assert sized_first(Both()) == 1
+    assert hashable_first(Both()) == 2
+
+
+def test_cache_is_bounded() -> None:
+    handler = dispatch({Exception: lambda err: 0}, cache_size=4)
+    for i in range(100):
+        assert handler(type(f"Error{i}", (Exception,), {})()) == 0
+    assert handler(KeyError()) == 0
+    assert len(handler._cache) == 4
+    with pytest.raises(ValueError):
+        dispatch({int: str}, cache_size=0)
@@ -0,0 +1,71 @@
+import pickle
+from typing import Iterator
+
+import pytest
+
+from toradh import Err, Nothing, Ok, Some
+from toradh.executor import ResultExecutor
+
+
+def parse(value: str) -> int:
+    return int(value)
+
+
+def checked(value: int) -> Ok[int]:
+    return Ok(value * 2)
+
+
+def interrupt(value: int) -> int:
+    raise KeyboardInterrupt()
+
+
+@pytest.fixture(params=["threads", "processes"])
+def pool(request: pytest.FixtureRequest) -> Iterator[ResultExecutor]:
+    executor = getattr(ResultExecutor, request.param)(max_workers=2)
+    with executor:
+        yield executor
+
+
+def test_wrappers_pickle_round_trip() -> None:
+    for value in (Ok(1), Err(ValueError("x")), Some([1]), Nothing()):
+        restored = pickle.loads(pickle.dumps(value))
+        assert type(restored) is type(value)
+        assert repr(restored) == repr(value)
+    assert pickle.loads(pickle.dumps(Nothing())) is Nothing()
+
+
+def test_submit(pool: ResultExecutor) -> None:
+    assert pool.submit(parse, "3").result() == Ok(3)
+    assert isinstance(pool.submit(parse, "x").result().kind(), ValueError)
+    assert pool.submit(checked, 2).result() == Ok(4)
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 50])
+def test_map_keeps_order(pool: ResultExecutor, chunksize: int) -> None:
+    values = [str(i) if i % 4 else "x" for i in range(20)]
+    results = list(pool.map(parse, values, chunksize=chunksize))
+
+    assert len(results) == len(values)
+    for value, res in zip(values, results):
+        if value == "x":
+            assert isinstance(res.kind(), ValueError)
+        else:
+            assert res == Ok(int(value))
+
+
+def test_map_unordered(pool: ResultExecutor) -> None:
+    results = pool.map(checked, range(10), chunksize=2, ordered=False)
+    assert sorted(r.unwrap() for r in results) == [i * 2 for i in range(10)]
+
+
+def test_uncaught_exceptions_propagate() -> None:
+    with ResultExecutor.threads(max_workers=1, catch=(ValueError,)) as pool:
+        with pytest.raises(KeyboardInterrupt):
+            pool.submit(interrupt, 1).result()
+        with pytest.raises(KeyboardInterrupt):
+            list(pool.map(interrupt, [1]))
+
+
+def test_invalid_chunksize(pool: ResultExecutor) -> None:
+    with pytest.raises(ValueError):
+        pool.map(parse, ["1"], chunksize=0)
@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+
+
+def run(code: str) -> None:
+    env = {**os.environ, "TORADH_TYPECHECK": "full"}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+def test_import_is_lazy() -> None:
+    run(
+        "import sys, toradh\n"
+        "for name in ('typeguard', 'typing_extensions', 'inspect'):\n"
+        "    assert name not in sys.modules, name\n"
+    )
+
+
+def test_typeguard_is_loaded_by_the_first_checked_call() -> None:
+    run(
+        "import sys\n"
+        "from toradh import Option\n"
+        "assert Option.of(1).unwrap_or(0) == 1\n"
+        "assert 'typeguard' in sys.modules\n"
+        "try:\n"
+        "    Option.of(1).map(1)\n"
+        "except Exception as e:\n"
+        "    assert type(e).__name__ == 'TypeCheckError'\n"
+        "else:\n"
+        "    raise AssertionError('not checked')\n"
+    )
@@ -0,0 +1,110 @@
+import threading
+from typing import Iterator
+
+import pytest
+
+from toradh import Err, Nothing, Ok, Some, instrumentation, lightweight
+
+
+@pytest.fixture(autouse=True)
+def clean_registry() -> Iterator[None]:
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_installs_nothing() -> None:
+    init, unwrap = Err.__init__, Nothing.unwrap
+    instrumentation.enable()
+    assert Err.__init__ is not init
+    instrumentation.disable()
+    assert Err.__init__ is init and Nothing.unwrap is unwrap
+
+    Err(ValueError())
+    assert instrumentation.snapshot()["err_created"] == {}
+
+
+def test_counts() -> None:
+    instrumentation.enable()
+    assert instrumentation.is_enabled()
+    errors = [Err(ValueError()), Err(ValueError()), Err(KeyError())]
+    with pytest.raises(ValueError):
+        errors[0].unwrap()
+    with pytest.raises(ValueError):
+        Nothing().unwrap()
+    assert errors[2].unwrap_or(1) == 1
+    assert errors[2].unwrap_or_else(lambda _: 2) == 2
+    assert Nothing().unwrap_or(default=3) == 3
+    assert Ok(1).unwrap_or(0) == 1 and Some(1).unwrap() == 1
+
+    counts = instrumentation.snapshot()
+    assert counts["err_created"] == {"ValueError": 2, "KeyError": 1}
+    assert counts["err_unwrapped"] == {"ValueError": 1}
+    assert counts["nothing_unwrapped"] == {"": 1}
+    assert counts["unwrap_or_fallback"] == {"Err": 2, "Nothing": 1}
+
+
+def test_reset() -> None:
+    instrumentation.enable()
+    Err(ValueError())
+    instrumentation.reset()
+    Err(KeyError())
+    assert instrumentation.snapshot()["err_created"] == {"KeyError": 1}
+
+
+def test_counts_from_many_threads() -> None:
+    instrumentation.enable()
+
+    def work() -> None:
+        for _ in range(1000):
+            Err(ValueError())
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    work()
+    for thread in threads:
+        thread.join()
+    assert instrumentation.snapshot()["err_created"] == {"ValueError": 9000}
+    # finished threads are folded in once and kept
+    assert instrumentation.snapshot()["err_created"] == {"ValueError": 9000}
+
+
+def test_sentinel_unwraps_are_counted() -> None:
+    not_found = lightweight.sentinel(KeyError("missing"))
+    instrumentation.enable()
+    with pytest.raises(KeyError):
+        not_found.unwrap()
+    assert instrumentation.snapshot()["err_unwrapped"] == {"KeyError": 1}
+
+
+def test_composes_with_lightweight_mode() -> None:
+    instrumentation.enable()
+    lightweight.enable()
+    try:
+        try:
+            raise ValueError()
+        except ValueError as e:
+            err = Err(e)
+        assert err.kind().__traceback__ is None
+    finally:
+        lightweight.disable()
+    assert instrumentation.snapshot()["err_created"] == {"ValueError": 1}
+
+
+def test_prometheus_export() -> None:
+    class Odd(Exception):
+        pass
+
+    instrumentation.enable()
+    Err(Odd())
+    Nothing().unwrap_or(0)
+    text = instrumentation.to_prometheus()
+    assert "# TYPE toradh_err_created_total counter" in text
+    assert (
+        'toradh_err_created_total{exception="tests.test_instrumentation.'
+        'test_prometheus_export.<locals>.Odd"} 1'
+    ) in text
+    assert "toradh_nothing_unwrapped_total 0" in text
+    assert 'toradh_unwrap_or_fallback_total{type="Nothing"} 1' in text
@@ -0,0 +1,97 @@
+import itertools
+from typing import Any, Iterator, List, Union
+
+import pytest
+
+from toradh import Err, Nothing, Ok, Some
+from toradh.iter import (
+    chunked,
+    collect,
+    collect_all,
+    filter_err,
+    filter_ok,
+    filter_some,
+    partition,
+    sequence,
+    try_fold,
+)
+
+
+def numbers() -> Iterator[Union[Ok[int], Err[ValueError]]]:
+    # unbounded, every third item fails
+    for i in itertools.count():
+        yield Err(ValueError(i)) if i % 3 == 2 else Ok(i)
+
+
+def test_filters_are_lazy() -> None:
+    assert list(itertools.islice(filter_ok(numbers()), 4)) == [0, 1, 3, 4]
+    errors = list(itertools.islice(filter_err(numbers()), 2))
+    assert [e.args for e in errors] == [(2,), (5,)]
+    options: List[Union[Some[Any], Nothing]] = [Some(1), Nothing(), Some(None)]
+    assert list(filter_some(options)) == [1, None]
+
+
+def test_partition() -> None:
+    values, errors = partition(numbers())
+    assert list(itertools.islice(values, 4)) == [0, 1, 3, 4]
+    assert next(errors).args == (2,)
+
+    mixed: List[Union[Ok[int], Err[KeyError]]] = [Err(KeyError()), Ok(1)]
+    ok_values, key_errors = partition(mixed)
+    assert list(ok_values) == [1]
+    assert [type(e) for e in key_errors] == [KeyError]
+
+
+def test_partition_does_not_read_ahead() -> None:
+    pulled: List[int] = []
+
+    def source() -> Iterator[Ok[int]]:
+        for i in range(10):
+            pulled.append(i)
+            yield Ok(i)
+
+    values, _ = partition(source())
+    assert next(values) == 0
+    assert pulled == [0]
+
+
+def test_collect_stops_at_first_err() -> None:
+    stream = numbers()
+    result = collect(stream)
+    assert isinstance(result, Err) and result.kind().args == (2,)
+    assert next(stream) == Ok(3)
+
+    assert collect([Ok(1), Ok(2)]) == Ok([1, 2])
+    assert sequence([]) == Ok([])
+
+
+def test_collect_all() -> None:
+    assert collect_all([Ok(1), Ok(2)]) == Ok([1, 2])
+
+    first, second = KeyError("a"), ValueError("b")
+    results: List[Union[Ok[int], Err[Exception]]] = [
+        Ok(1),
+        Err(first),
+        Ok(2),
+        Err(second),
+    ]
+    result = collect_all(results)
+    assert isinstance(result, Err)
+    # ExceptionGroup, or ErrorGroup before Python 3.11
+    group: Any = result.kind()
+    assert list(group.exceptions) == [first, second]
+    assert "2 of 4" in str(group)
+
+
+def test_try_fold() -> None:
+    assert try_fold([Ok(1), Ok(2), Ok(3)], 0, lambda acc, v: acc + v) == Ok(6)
+    assert isinstance(try_fold(numbers(), 0, lambda acc, v: acc + v), Err)
+
+
+def test_chunked() -> None:
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 3)) == []
+    first = next(chunked(numbers(), 3))
+    assert first[:2] == [Ok(0), Ok(1)]
+    with pytest.raises(ValueError):
+        chunked(range(3), 0)
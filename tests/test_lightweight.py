@@ -0,0 +1,158 @@
+import pickle
+import random
+from typing import Iterator, List
+
+import pytest
+
+from toradh import Err, Ok, lightweight
+
+
+@pytest.fixture(autouse=True)
+def restore_mode() -> Iterator[None]:
+    yield
+    lightweight.disable()
+
+
+def deep(depth: int) -> None:
+    big = bytearray(1024)  # noqa: F841
+    if depth == 0:
+        raise ValueError("deep")
+    deep(depth - 1)
+
+
+def captured(depth: int = 5) -> Err[ValueError]:
+    try:
+        deep(depth)
+    except ValueError as err:
+        return Err(err)
+    raise AssertionError("unreachable")
+
+
+def traceback_length(exc: BaseException) -> int:
+    tb, count = exc.__traceback__, 0
+    while tb is not None:
+        tb, count = tb.tb_next, count + 1
+    return count
+
+
+def test_disabled_by_default() -> None:
+    assert not lightweight.is_enabled()
+    assert traceback_length(captured().kind()) > 5
+
+
+def test_traceback_is_dropped() -> None:
+    lightweight.enable()
+    assert lightweight.is_enabled()
+    assert captured().kind().__traceback__ is None
+
+
+def test_traceback_is_truncated_to_innermost_frames() -> None:
+    lightweight.enable(traceback_limit=2)
+    exc = captured().kind()
+    assert traceback_length(exc) == 2
+    tb = exc.__traceback__
+    assert tb is not None and tb.tb_next is not None
+    assert tb.tb_next.tb_frame.f_code.co_name == "deep"
+    assert tb.tb_next.tb_frame.f_locals == {}
+
+
+def test_whole_chain_is_stripped() -> None:
+    lightweight.enable()
+    chain: List[BaseException] = []
+    for depth in range(20):
+        try:
+            try:
+                raise chain[-1] if chain else ValueError(depth)
+            except Exception:
+                raise KeyError(depth)
+        except KeyError as e:
+            chain.append(e)
+    Err(chain[-1])
+    assert all(exc.__traceback__ is None for exc in chain)
+
+    # chains set by hand may loop
+    first, second = ValueError(), KeyError()
+    first.__cause__, second.__cause__ = second, first
+    try:
+        raise first
+    except ValueError as e:
+        assert Err(e).kind().__traceback__ is None
+
+
+def test_unwrap_raises_a_copy() -> None:
+    lightweight.enable()
+    err = captured()
+    for _ in range(3):
+        with pytest.raises(ValueError, match="deep") as info:
+            err.unwrap()
+        assert info.value is not err.kind()
+    assert err.kind().__traceback__ is None
+
+
+def test_disable_restores_plain_methods() -> None:
+    init, unwrap = Err.__init__, Err.unwrap
+    lightweight.enable()
+    assert Err.__init__ is not init
+    lightweight.disable()
+    assert Err.__init__ is init and Err.unwrap is unwrap
+    assert captured().kind().__traceback__ is not None
+
+
+def test_uncopyable_exception_is_raised_as_is() -> None:
+    class Custom(Exception):
+        def __init__(self, code: int, reason: str) -> None:
+            super().__init__(f"{code}: {reason}")
+
+    lightweight.enable()
+    err = Err(Custom(1, "x"))
+    with pytest.raises(Custom) as info:
+        err.unwrap()
+    assert info.value is err.kind()
+
+
+def test_creation_site_is_sampled() -> None:
+    lightweight.enable(site_sample_rate=1.0)
+    err = Err(ValueError())
+    site = lightweight.creation_site(err)
+    assert site is not None
+    filename, lineno = site
+    assert filename == __file__
+    assert lineno > 0
+
+    lightweight.enable(site_sample_rate=0.0)
+    assert lightweight.creation_site(Err(ValueError())) is None
+
+
+def test_sampling_leaves_the_shared_generator_alone() -> None:
+    lightweight.enable(site_sample_rate=0.5)
+    state = random.getstate()
+    for _ in range(100):
+        Err(ValueError())
+    assert random.getstate() == state
+
+
+def test_invalid_settings() -> None:
+    with pytest.raises(ValueError):
+        lightweight.enable(traceback_limit=-1)
+    with pytest.raises(ValueError):
+        lightweight.enable(site_sample_rate=2)
+    assert not lightweight.is_enabled()
+
+
+def test_sentinel_is_shared() -> None:
+    not_found = lightweight.sentinel(KeyError("missing"))
+    assert lightweight.sentinel(KeyError("missing")) is not_found
+    assert lightweight.sentinel(KeyError("other")) is not not_found
+    assert not_found == Err(not_found.kind())
+    assert not_found.is_error() and not Ok(1).is_error()
+
+    for _ in range(3):
+        with pytest.raises(KeyError):
+            not_found.unwrap()
+    assert not_found.kind().__traceback__ is None
+
+
+def test_sentinel_pickles_as_plain_err() -> None:
+    restored = pickle.loads(pickle.dumps(lightweight.sentinel(KeyError("k"))))
+    assert isinstance(restored, Err)
+    assert restored.kind().args == ("k",)
@@ -0,0 +1,217 @@
+import asyncio
+import threading
+import time
+from typing import List, Union
+
+import pytest
+
+from tests.conftest import FakeClock
+from toradh import Err, Ok, is_err
+from toradh.memo import CacheStats, memoize
+
+
+def test_caches_ok_with_ttl(clock: FakeClock) -> None:
+    calls: List[int] = []
+
+    @memoize(ttl=10, clock=clock)
+    def double(value: int) -> Ok[int]:
+        calls.append(value)
+        return Ok(value * 2)
+
+    assert double(1) == Ok(2)
+    assert double(1) == Ok(2)
+    assert calls == [1]
+    clock.now = 10
+    assert double(1) == Ok(2)
+    assert calls == [1, 1]
+    assert double.stats() == CacheStats(
+        hits=1, misses=2, evictions=0, expirations=1, size=1
+    )
+    assert double.__name__ == "double"
+
+
+def test_size_leaves_out_expired_entries(clock: FakeClock) -> None:
+    @memoize(ttl=10, clock=clock)
+    def double(value: int) -> Ok[int]:
+        return Ok(value * 2)
+
+    double(1)
+    clock.now = 5
+    double(2)
+    clock.now = 10
+    assert double.stats() == CacheStats(
+        hits=0, misses=2, evictions=0, expirations=1, size=1
+    )
+
+
+def test_err_policy_per_exception_type(clock: FakeClock) -> None:
+    calls: List[str] = []
+
+    class NotFound(KeyError):
+        pass
+
+    @memoize(err_ttl={KeyError: 5, ConnectionError: 0}, clock=clock)
+    def fetch(kind: str) -> Err[Exception]:
+        calls.append(kind)
+        errors = {"missing": NotFound(), "down": ConnectionError(), "bad": ValueError()}
+        return Err(errors[kind])
+
+    for _ in range(3):
+        fetch("missing")
+        fetch("down")
+        fetch("bad")
+    # only the KeyError subclass is cached
+    assert calls.count("missing") == 1
+    assert calls.count("down") == 3
+    assert calls.count("bad") == 3
+    clock.now = 5
+    fetch("missing")
+    assert calls.count("missing") == 2
+
+
+def test_lru_eviction() -> None:
+    @memoize(maxsize=2)
+    def identity(value: int) -> Ok[int]:
+        return Ok(value)
+
+    identity(1)
+    identity(2)
+    identity(1)
+    identity(3)  # evicts 2, the least recently used
+    assert identity.stats().evictions == 1
+    identity(1)
+    assert identity.stats().hits == 2
+    identity(2)
+    assert identity.stats().misses == 4
+
+
+def test_invalidation() -> None:
+    @memoize(err_ttl={Exception: None})
+    def load(value: int, *, strict: bool = False) -> Union[Ok[int], Err[ValueError]]:
+        return Err(ValueError()) if value < 0 else Ok(value)
+
+    load(1)
+    load(1, strict=True)
+    load(-1)
+    assert load.stats().size == 3
+    assert load.invalidate(1, strict=True)
+    assert not load.invalidate(2)
+    assert load.invalidate_if(is_err) == 1
+    assert load.stats().size == 1
+    load.clear()
+    assert load.stats() == CacheStats(0, 0, 0, 0, 0)
+
+
+def test_exceptions_are_not_cached() -> None:
+    calls: List[int] = []
+
+    @memoize()
+    def fail(value: int) -> Ok[int]:
+        calls.append(value)
+        raise RuntimeError()
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            fail(1)
+    assert calls == [1, 1]
+
+
+def test_methods() -> None:
+    class Repo:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        @memoize()
+        def get(self, key: int) -> Ok[int]:
+            self.calls += 1
+            return Ok(key)
+
+    repo = Repo()
+    assert repo.get(1) == Ok(1)
+    assert repo.get(1) == Ok(1)
+    assert repo.calls == 1
+
+
+def test_concurrent_callers_share_one_call() -> None:
+    calls: List[int] = []
+    barrier = threading.Barrier(8)
+
+    @memoize()
+    def slow(value: int) -> Ok[int]:
+        calls.append(value)
+        time.sleep(0.05)
+        return Ok(value)
+
+    def worker() -> None:
+        barrier.wait()
+        assert slow(1) == Ok(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert calls == [1]
+
+
+def test_hits_from_many_threads() -> None:
+    @memoize()
+    def identity(value: int) -> Ok[int]:
+        return Ok(value)
+
+    identity(1)
+
+    def worker() -> None:
+        for _ in range(1000):
+            identity(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert identity.stats().hits == 8000
+    identity.clear()
+    assert identity.stats().hits == 0
+
+
+def test_async() -> None:
+    calls: List[int] = []
+
+    @memoize(ttl=None, err_ttl={KeyError: None})
+    async def fetch(value: int) -> Union[Ok[int], Err[KeyError]]:
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return Err(KeyError()) if value < 0 else Ok(value)
+
+    async def main() -> None:
+        results = await asyncio.gather(*(fetch(1) for _ in range(5)))
+        assert results == [Ok(1)] * 5
+        assert await fetch(1) == Ok(1)
+        assert isinstance(await fetch(-1), Err)
+        await fetch(-1)
+
+    asyncio.run(main())
+    assert calls == [1, -1]
+    assert fetch.stats().hits == 2
+
+
+def test_async_cancelled_caller_does_not_cancel_others() -> None:
+    @memoize()
+    async def slow() -> Ok[int]:
+        await asyncio.sleep(0.02)
+        return Ok(1)
+
+    async def main() -> None:
+        first = asyncio.ensure_future(slow())
+        second = asyncio.ensure_future(slow())
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == Ok(1)
+
+    asyncio.run(main())
+
+
+def test_invalid_maxsize() -> None:
+    with pytest.raises(ValueError):
+        memoize(maxsize=0)
@@ -0,0 +1,50 @@
+import pytest
+
+from toradh import Nothing, Some
+from toradh.option_map import OptionMap
+
+
+def test_get_returns_shared_instances() -> None:
+    carts = OptionMap({1: "a", 2: None})
+    hit = carts.get(1)
+    assert isinstance(hit, Some) and hit.unwrap() == "a"
+    assert carts.get(1) is hit
+    assert carts.get(3) is Nothing()
+    # None is stored, as Nothing like Option.of does
+    assert carts.get(2) is Nothing()
+    assert 2 in carts and carts[2] is None
+    assert carts.to_dict() == {1: "a", 2: None}
+    carts[1] = None
+    assert carts.get(1) is Nothing()
+
+
+def test_get_many() -> None:
+    carts = OptionMap([(1, "a"), (2, "b")])
+    found = carts.get_many([2, 3, 1])
+    assert [option.unwrap_or("-") for option in found] == ["b", "-", "a"]
+    assert found[1] is Nothing()
+    assert carts.get_many(iter([])) == []
+
+
+def test_mapping_protocol() -> None:
+    carts: OptionMap[int, str] = OptionMap()
+    carts[1] = "a"
+    carts.update({2: "b"})
+    assert carts[1] == "a"
+    assert 2 in carts and 3 not in carts
+    assert len(carts) == 2
+    assert list(carts) == [1, 2]
+    assert list(carts.keys()) == [1, 2]
+    assert list(carts.values()) == ["a", "b"]
+    assert carts.to_dict() == {1: "a", 2: "b"}
+    assert carts == OptionMap({1: "a", 2: "b"})
+    assert repr(carts) == "OptionMap({1: 'a', 2: 'b'})"
+
+    assert carts.pop(1).unwrap() == "a"
+    assert carts.pop(1) is Nothing()
+    del carts[2]
+    with pytest.raises(KeyError):
+        carts[2]
+    carts[3] = "c"
+    carts.clear()
+    assert len(carts) == 0
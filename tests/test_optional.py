@@ -1,6 +1,6 @@
 import pytest
 
-from toradh import Option, Nothing
+from toradh import Nothing, Option, Some
 
 
 @pytest.fixture
@@ -46,3 +46,90 @@ def test_dataclass_optional() -> None:
 
     user = User(name=Option.of("a"))
     assert user.name.is_some()
+
+
+def test_options_are_slotted() -> None:
+    assert not hasattr(Option.of(1), "__dict__")
+    assert not hasattr(Option.empty(), "__dict__")
+
+
+def test_user_subclass() -> None:
+    class Named(Some[int]):
+        __slots__ = ("name",)
+
+        def __init__(self, value: int, name: str) -> None:
+            super().__init__(value)
+            self.name = name
+
+    named = Named(1, "a")
+    assert named.unwrap() == 1
+    assert named.name == "a"
+    assert not hasattr(named, "__dict__")
+
+
+def test_nothing_is_singleton() -> None:
+    assert Nothing() is Nothing()
+    assert Option.empty() is Nothing()
+    assert Option.of(None) is Nothing()
+    assert Nothing().map(str) is Nothing()
+
+
+def test_nothing_pickle_and_copy() -> None:
+    import copy
+    import pickle
+
+    assert pickle.loads(pickle.dumps(Nothing())) is Nothing()
+    assert copy.copy(Nothing()) is Nothing()
+    assert copy.deepcopy(Nothing()) is Nothing()
+
+
+def test_option_cannot_be_built_directly() -> None:
+    Option.of(1)
+    with pytest.raises(ValueError):
+        Option(1)
+    assert Some(1).unwrap() == 1
+
+
+def test_options_are_immutable() -> None:
+    some = Some(1)
+    with pytest.raises(AttributeError):
+        some._value = 2
+    with pytest.raises(AttributeError):
+        Nothing()._value = None
+    assert some.unwrap() == 1
+    assert Nothing().is_nothing()
+
+
+def test_option_equality() -> None:
+    assert Some(1) == Some(1)
+    assert Some(1) != Some(2)
+    assert Some(1) != Nothing()
+    assert Nothing() == Nothing()
+    assert Nothing() != Some(None)
+    assert Some(1) != 1
+
+
+def test_options_are_hashable() -> None:
+    assert hash(Some("a")) == hash(Some("a"))
+    assert hash(Nothing()) == hash(Option.empty())
+    assert len({Some(1), Some(1), Some(2), Nothing(), Option.of(None)}) == 3
+
+    with pytest.raises(TypeError):
+        hash(Some({}))
+
+
+def test_options_as_cache_keys() -> None:
+    import functools
+
+    calls = []
+
+    @functools.lru_cache(maxsize=None)
+    def describe(option: Option[int]) -> str:
+        calls.append(option)
+        return repr(option)
+
+    describe(Some(1))
+    describe(Some(1))
+    describe(Nothing())
+    describe(Nothing())
+    assert calls == [Some(1), Nothing()]
@@ -0,0 +1,74 @@
+from typing import List
+
+import pytest
+
+from toradh import Err, Ok, Result
+from toradh.pipeline import Pipeline
+
+
+def to_int(value: str) -> Result[int, ValueError]:
+    try:
+        return Ok(int(value))
+    except ValueError as e:
+        return Err(e)
+
+
+@pytest.fixture
+def parse() -> Pipeline:
+    return Pipeline().map(str.strip).and_then(to_int).map(abs)
+
+
+def test_ok_path(parse: Pipeline) -> None:
+    assert parse(Ok(" -3 ")) == Ok(3)
+
+
+def test_err_short_circuits(parse: Pipeline) -> None:
+    calls: List[int] = []
+    pipeline = parse.map(calls.append)
+
+    res = pipeline(Ok("x"))
+    assert isinstance(res.kind(), ValueError)
+    assert calls == []
+
+
+def test_error_steps(parse: Pipeline) -> None:
+    recovered = parse.map_err(lambda e: KeyError(str(e))).or_else(lambda e: Ok(0))
+    assert recovered(Ok("x")) == Ok(0)
+    assert recovered(Ok("7")) == Ok(7)
+
+    mapped = parse.map_err(lambda e: KeyError())
+    assert isinstance(mapped(Ok("x")).kind(), KeyError)
+
+    # error steps are skipped on the Ok track
+    assert mapped(Ok("7")) == Ok(7)
+
+
+def test_err_input_and_empty_pipeline() -> None:
+    err = Err(ValueError())
+    assert Pipeline().map(str)(err) is err
+    assert Pipeline()(err) is err
+    assert len(Pipeline().map(str).map(int)) == 2
+
+
+def test_pipelines_are_immutable(parse: Pipeline) -> None:
+    longer = parse.map(str)
+    assert len(parse) == 3
+    assert len(longer) == 4
+    assert parse(Ok("5")) == Ok(5)
+    assert longer(Ok("5")) == Ok("5")
+
+
+def test_matches_method_chaining(parse: Pipeline) -> None:
+    for value in (" 4", "-2 ", "nope"):
+        chained = Ok(value).map(str.strip).and_then(to_int).map(abs)
+        fused = parse(Ok(value))
+        assert chained.is_ok() == fused.is_ok()
+        if chained.is_ok():
+            assert chained == fused
+
+
+def test_compiled_function(parse: Pipeline) -> None:
+    run = parse.compile()
+    assert run is parse.compile()
+    assert run(Ok(" 8")) == Ok(8)
+    assert run(Ok("x")).is_error()
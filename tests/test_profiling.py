@@ -0,0 +1,198 @@
+import asyncio
+import functools
+import threading
+from typing import Callable, Iterator
+
+import pytest
+
+from tests.conftest import FakeClock
+from toradh import Err, Ok, Result
+from toradh import profiling
+from toradh.profiling import BUCKETS, Histogram, profile, reset, snapshot
+
+
+@pytest.fixture(autouse=True)
+def clean() -> Iterator[None]:
+    reset()
+    yield
+    reset()
+
+
+def make(
+    clock: FakeClock, name: str, sample_rate: float = 1.0
+) -> Callable[[int], Result[int, Exception]]:
+    @profile(name, sample_rate=sample_rate, clock=clock)
+    def find(key: int) -> Result[int, Exception]:
+        if key < 0:
+            return Err(KeyError(key))
+        if key == 0:
+            raise RuntimeError()
+        return Ok(key)
+
+    return find
+
+
+def test_split_by_outcome(clock: FakeClock) -> None:
+    find = make(clock, "split")
+    # every other read is the end of a call, which took the next step
+    clock.steps = [0, 100, 0, 100, 0, 5000]
+    assert find(1) == Ok(1)
+    find(2)
+    assert find(-1).is_error()
+
+    outcomes = snapshot()["split"]
+    assert set(outcomes) == {"Ok", "KeyError"}
+    ok = outcomes["Ok"]
+    assert ok.calls == 2 and ok.total_ns == 200 and ok.mean_ns == 100
+    # 100 ns is in [64, 128)
+    assert ok.buckets[7] == 2 and len(ok.buckets) == BUCKETS
+    assert outcomes["KeyError"].percentile(0.5) == 8192
+
+
+def test_raised_calls_are_not_recorded(clock: FakeClock) -> None:
+    find = make(clock, "raised")
+    with pytest.raises(RuntimeError):
+        find(0)
+    assert snapshot()["raised"] == {}
+
+
+def test_percentile() -> None:
+    histogram = Histogram(4, 0, (0, 1, 1, 0, 2))
+    assert histogram.percentile(0.0) == 2
+    assert histogram.percentile(0.5) == 4
+    assert histogram.percentile(1.0) == 16
+    assert Histogram(0, 0, ()).percentile(0.99) == 0
+    with pytest.raises(ValueError):
+        histogram.percentile(2)
+
+
+def test_sampling(clock: FakeClock) -> None:
+    never = make(clock, "never", sample_rate=0.0)
+    half = make(clock, "half", sample_rate=0.5)
+    for key in range(1, 2001):
+        never(key)
+        half(key)
+    current = snapshot()
+    assert current["never"] == {}
+    assert 800 < current["half"]["Ok"].calls < 1200
+
+    with pytest.raises(ValueError):
+        profile(sample_rate=1.5)
+
+
+def test_reset(clock: FakeClock) -> None:
+    find = make(clock, "reset")
+    find(1)
+    assert snapshot()["reset"]["Ok"].calls == 1
+    reset()
+    assert snapshot()["reset"] == {}
+    find(1)
+    assert snapshot()["reset"]["Ok"].calls == 1
+
+
+def test_threads_are_added_up(clock: FakeClock) -> None:
+    find = make(clock, "threads")
+
+    def work() -> None:
+        for key in range(1, 101):
+            find(key)
+            find(-key)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    outcomes = snapshot()["threads"]
+    assert outcomes["Ok"].calls == 400
+    assert outcomes["KeyError"].calls == 400
+    # finished threads are kept once folded
+    assert snapshot()["threads"]["Ok"].calls == 400
+
+
+def test_async(clock: FakeClock) -> None:
+
+    @profile("async", clock=clock)
+    async def fetch(key: int) -> Result[int, Exception]:
+        await asyncio.sleep(0)
+        return Ok(key) if key > 0 else Err(TimeoutError())
+
+    async def main() -> None:
+        clock.steps = [0, 10, 0, 1_000_000]
+        await fetch(1)
+        await fetch(0)
+
+    asyncio.run(main())
+    outcomes = snapshot()["async"]
+    assert outcomes["Ok"].total_ns == 10
+    assert outcomes["TimeoutError"].percentile(1.0) == 1 << 20
+
+
+def test_default_name() -> None:
+    @profile()
+    def named() -> Result[int, Exception]:
+        return Ok(1)
+
+    named()
+    assert "tests.test_profiling.test_default_name.<locals>.named" in snapshot()
+
+
+def test_any_callable() -> None:
+    def lookup(key: int, offset: int) -> Result[int, Exception]:
+        return Ok(key + offset)
+
+    class Lookup:
+        def __call__(self, key: int) -> Result[int, Exception]:
+            return Ok(key)
+
+    partial = profile()(functools.partial(lookup, offset=1))
+    instance = profile("instance")(Lookup())
+    assert partial(1) == Ok(2)
+    assert instance(1) == Ok(1)
+    assert snapshot()["instance"]["Ok"].calls == 1
+    assert any("functools.partial" in name for name in snapshot())
+
+
+def test_keeps_signature() -> None:
+    @profile("signature")
+    def lookup(key: int, *, default: int = 3, **extra: int) -> Result[int, Exception]:
+        return Ok(key + default + sum(extra.values()))
+
+    assert lookup(1) == Ok(4)
+    assert lookup(1, default=0, a=5) == Ok(6)
+    assert lookup.__name__ == "lookup"
+    with pytest.raises(TypeError):
+        lookup()  # type: ignore[call-arg]
+    assert snapshot()["signature"]["Ok"].calls == 2
+
+
+def test_keeps_signature_of_decorated_functions() -> None:
+    def add_offset(
+        func: Callable[[int, int], Result[int, Exception]],
+    ) -> Callable[[int], Result[int, Exception]]:
+        @functools.wraps(func)
+        def wrapper(x: int) -> Result[int, Exception]:
+            return func(x, 10)
+
+        return wrapper
+
+    @profile("wrapped")
+    @add_offset
+    def add(x: int, y: int) -> Result[int, Exception]:
+        return Ok(x + y)
+
+    assert add(1) == Ok(11)
+    assert snapshot()["wrapped"]["Ok"].calls == 1
+
+
+def test_decorating_again_reuses_the_histograms() -> None:
+    before = len(profiling._profiles)
+    for _ in range(100):
+
+        @profile("again")
+        def find() -> Result[int, Exception]:
+            return Ok(1)
+
+        find()
+    assert len(profiling._profiles) == before + 1
+    assert snapshot()["again"]["Ok"].calls == 100
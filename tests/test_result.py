@@ -1,5 +1,5 @@
 from tests.conftest import Movie
-from toradh import Ok, Result
+from toradh import Err, Ok, Result
 
 import pytest
 
@@ -35,3 +35,94 @@ def test_equals(
 
 def test_kind(mock_ok: Result[Movie, Exception]) -> None:
     assert mock_ok.kind() == mock_ok.unwrap()
+
+
+def test_results_are_slotted() -> None:
+    assert not hasattr(Ok(1), "__dict__")
+    assert not hasattr(Err(ValueError()), "__dict__")
+
+
+def test_user_subclass() -> None:
+    class Tagged(Ok[int]):
+        def __init__(self, value: int, tag: str) -> None:
+            super().__init__(value)
+            self.tag = tag
+
+    tagged = Tagged(1, "a")
+    assert tagged.unwrap() == 1
+    assert tagged.tag == "a"
+    assert tagged == Ok(1)
+
+
+def test_combinators_over_ok() -> None:
+    res: Result[int, ValueError] = Ok(2)
+    assert res.map(lambda x: x + 1) == Ok(3)
+    assert res.and_then(lambda x: Err(KeyError(x))).is_error()
+    assert res.map_err(lambda e: KeyError()) is res
+    assert res.or_else(lambda e: Ok(0)) is res
+
+
+def test_combinators_over_err() -> None:
+    err = ValueError("bad")
+    res: Result[int, ValueError] = Err(err)
+    assert res.map(lambda x: x + 1) is res
+    assert res.and_then(lambda x: Ok(x)) is res
+    mapped = res.map_err(lambda e: KeyError(*e.args))
+    assert isinstance(mapped, Err) and mapped.kind().args == ("bad",)
+    assert res.or_else(lambda e: Ok(0)) == Ok(0)
+
+
+def test_results_are_immutable() -> None:
+    res = Ok(1)
+    with pytest.raises(AttributeError):
+        res._value = 2
+    with pytest.raises(AttributeError):
+        del res._value
+    with pytest.raises(AttributeError):
+        Err(ValueError())._err = ValueError()
+    assert res.unwrap() == 1
+
+
+def test_results_are_hashable() -> None:
+    err = ValueError("bad")
+    assert hash(Ok(1)) == hash(Ok(1))
+    assert hash(Err(err)) == hash(Err(err))
+    assert len({Ok(1), Ok(1), Ok(2), Err(err), Err(err)}) == 3
+    assert Ok(1) != Err(err)
+    assert {Ok((1, "a")): "x"}[Ok((1, "a"))] == "x"
+
+    with pytest.raises(TypeError):
+        hash(Ok([1]))
+
+
+def test_subclass_hash_matches_equality() -> None:
+    class Tagged(Ok[int]):
+        def __init__(self, value: int, tag: str) -> None:
+            super().__init__(value)
+            self.tag = tag
+
+    tagged = Tagged(1, "a")
+    assert tagged == Ok(1)
+    assert hash(tagged) == hash(Ok(1))
+
+
+def test_subclass_pickle_and_copy() -> None:
+    import copy
+    import pickle
+
+    res = Named(3, "x")
+    hash(res)
+    for clone in (pickle.loads(pickle.dumps(res)), copy.copy(res), copy.deepcopy(res)):
+        assert type(clone) is Named
+        assert clone == res and clone.name == "x"
+        assert hash(clone) == hash(res)
+    with pytest.raises(AttributeError):
+        clone._value = 4
+
+
+class Named(Ok[int]):
+    __slots__ = ("name",)
+
+    def __init__(self, value: int, name: str) -> None:
+        super().__init__(value)
+        self.name = name
@@ -0,0 +1,100 @@
+from typing import Any, List, Tuple
+
+import pytest
+
+from toradh import Err, Ok, Result
+from toradh.result_array import ResultArray
+
+Rows = List[Result[int, ValueError]]
+
+
+@pytest.fixture
+def results() -> Rows:
+    err = ValueError("bad")
+    return [Ok(i) if i % 3 else Err(err) for i in range(20)]
+
+
+def test_round_trip(results: Rows) -> None:
+    arr: ResultArray[int, ValueError] = ResultArray.from_results(results)
+    assert len(arr) == len(results)
+    assert arr.to_list() == results
+    assert [arr[i] for i in range(len(arr))] == results
+    assert arr[-1] == results[-1]
+
+
+def test_indexing_across_blocks() -> None:
+    err = ValueError("bad")
+    rows: Rows = [Ok(i) if i % 7 % 3 else Err(err) for i in range(1_000)]
+    arr = ResultArray.from_results(rows)
+    assert [arr[i] for i in range(len(arr))] == rows
+    assert [arr[i] for i in range(len(arr))] == arr.map(lambda x: x).to_list()
+
+
+def test_bulk_operations(results: Rows) -> None:
+    arr: ResultArray[int, ValueError] = ResultArray.from_results(results)
+    oks = [r.unwrap() for r in results if r.is_ok()]
+    errs = [r.kind() for r in results if r.is_error()]
+
+    assert arr.count_ok() == len(oks)
+    assert arr.count_err() == len(errs)
+    assert arr.values() == oks
+    assert arr.errors() == errs
+    assert arr.partition() == (oks, errs)
+    assert arr.is_ok(1)
+    assert not arr.is_ok(0)
+
+
+def test_map_only_touches_ok(results: Rows) -> None:
+    arr: ResultArray[int, ValueError] = ResultArray.from_results(results)
+    mapped = arr.map(lambda x: x * 2)
+
+    assert mapped.values() == [v * 2 for v in arr.values()]
+    assert mapped.errors() == arr.errors()
+    assert [r.is_ok() for r in mapped] == [r.is_ok() for r in results]
+
+
+def test_index_errors() -> None:
+    arr: ResultArray[int, ValueError] = ResultArray.from_results([Ok(1)])
+    with pytest.raises(IndexError):
+        arr[1]
+    with pytest.raises(TypeError):
+        arr.append(1)  # type: ignore[arg-type]
+
+
+def test_masked_array_round_trip(results: Rows) -> None:
+    np = pytest.importorskip("numpy")
+    arr: ResultArray[int, ValueError] = ResultArray.from_results(results)
+
+    masked = arr.to_masked_array(fill_value=-1)
+    assert masked.count() == arr.count_ok()
+    assert masked.compressed().tolist() == arr.values()
+
+    back: ResultArray[Any, ValueError] = ResultArray.from_masked_array(masked)
+    assert back.values() == arr.values()
+    assert [r.is_ok() for r in back] == [r.is_ok() for r in arr]
+
+    empty: ResultArray[Any, ValueError] = ResultArray.from_masked_array(
+        np.ma.masked_array([], mask=[])
+    )
+    assert len(empty) == 0
+
+
+def test_masked_array_of_other_values() -> None:
+    pytest.importorskip("numpy")
+    err = ValueError("bad")
+
+    pairs: ResultArray[Tuple[int, int], ValueError] = ResultArray.from_results(
+        [Ok((1, 2)), Err(err), Ok((3, 4))]
+    )
+    masked = pairs.to_masked_array()
+    assert masked.shape == (3,)
+    assert masked.compressed().tolist() == [(1, 2), (3, 4)]
+
+    names: ResultArray[str, ValueError] = ResultArray.from_results(
+        [Ok("a"), Err(err), Ok("bc")]
+    )
+    filled = names.to_masked_array(fill_value="missing").filled()
+    assert filled.tolist() == ["a", "missing", "bc"]
+
+    numbers: ResultArray[int, ValueError] = ResultArray.from_results([Ok(1), Err(err)])
+    assert numbers.to_masked_array(fill_value=0.5).filled().tolist() == [1, 0.5]
@@ -0,0 +1,83 @@
+import sys
+import threading
+from typing import Any, Callable, Iterator, List
+
+import pytest
+
+from toradh import Err, Nothing, Ok, Option, Some, set_typecheck_policy
+from toradh import typecheck
+from toradh.typecheck import TypeCheckPolicy
+
+THREADS = 8
+
+
+@pytest.fixture(autouse=True)
+def short_switch_interval() -> Iterator[None]:
+    # more thread switches, more chances to hit a race
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def run_threads(work: Callable[[], Any]) -> List[Any]:
+    barrier = threading.Barrier(THREADS)
+    results: List[Any] = []
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(work())
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == THREADS
+    return results
+
+
+def test_nothing_subclass_created_once() -> None:
+    class Missing(Nothing):
+        __slots__ = ()
+
+    instances = run_threads(Missing)
+    assert all(instance is instances[0] for instance in instances)
+    assert type(instances[0]) is Missing
+
+
+def test_shared_values_hash_consistently() -> None:
+    shared = [Some(i) for i in range(200)] + [Ok(str(i)) for i in range(200)]
+
+    def work() -> List[int]:
+        return [hash(value) for value in shared]
+
+    hashes = run_threads(work)
+    assert all(values == hashes[0] for values in hashes)
+    assert hashes[0] == [hash(Some(i)) for i in range(200)] + [
+        hash(Ok(str(i))) for i in range(200)
+    ]
+
+
+@pytest.mark.parametrize("policy", ["off", "sampled"])
+def test_hot_paths_under_contention(policy: TypeCheckPolicy) -> None:
+    rate = typecheck.get_sample_rate()
+    previous = typecheck.get_typecheck_policy()
+    set_typecheck_policy(policy, sample_rate=0.5)
+    error = ValueError()
+
+    def work() -> int:
+        total = 0
+        for i in range(1, 2_001):
+            total += Option.of(i).map(lambda x: x + 1).unwrap_or(0)
+            total += Option.empty().unwrap_or(1)
+            total += Ok(i).map(lambda x: -x).unwrap()
+            total += Err(error).unwrap_or(1)
+        return total
+
+    try:
+        totals = run_threads(work)
+    finally:
+        set_typecheck_policy(previous, sample_rate=rate)
+    expected = sum(i + 1 + 1 - i + 1 for i in range(1, 2_001))
+    assert totals == [expected] * THREADS
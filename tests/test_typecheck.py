@@ -0,0 +1,56 @@
+from typing import Iterator
+
+import pytest
+from typeguard import TypeCheckError
+
+from toradh import Err, Nothing, Option, get_typecheck_policy, set_typecheck_policy
+from toradh import typecheck
+
+
+@pytest.fixture(autouse=True)
+def restore_policy() -> Iterator[None]:
+    policy = typecheck.get_typecheck_policy()
+    rate = typecheck.get_sample_rate()
+    yield
+    set_typecheck_policy(policy, sample_rate=rate)
+
+
+def test_full_policy_checks_arguments() -> None:
+    set_typecheck_policy("full")
+    with pytest.raises(TypeCheckError):
+        Option.of(1).map(5)  # type: ignore[arg-type]
+
+
+def test_off_policy_installs_plain_methods() -> None:
+    set_typecheck_policy("off")
+    assert get_typecheck_policy() == "off"
+    # no wrapper left behind, the class holds the original function
+    for entry in typecheck._registry:
+        assert entry.owner.__dict__[entry.name] is entry.func
+    assert Err(ValueError()).map_to_err(5) == Err(5)  # type: ignore[type-var]
+
+
+def test_sampled_policy_uses_rate() -> None:
+    set_typecheck_policy("sampled", sample_rate=1.0)
+    with pytest.raises(TypeCheckError):
+        Err(ValueError()).map_to_err(5)  # type: ignore[type-var]
+
+    set_typecheck_policy("sampled", sample_rate=0.0)
+    assert Err(ValueError()).map_to_err(5) == Err(5)  # type: ignore[type-var]
+    assert typecheck.get_sample_rate() == 0.0
+
+
+def test_policy_applies_to_subclass_overrides() -> None:
+    set_typecheck_policy("off")
+    assert Nothing().unwrap_or(1) == 1
+    set_typecheck_policy("full")
+    with pytest.raises(TypeCheckError):
+        Nothing().map(1)  # type: ignore[arg-type]
+
+
+def test_invalid_policy() -> None:
+    with pytest.raises(ValueError):
+        set_typecheck_policy("sometimes")  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError):
+        set_typecheck_policy("sampled", sample_rate=2)
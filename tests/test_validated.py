@@ -0,0 +1,96 @@
+import pickle
+from typing import Any, Iterator, List
+
+import pytest
+
+from toradh import Err, Ok
+from toradh.validated import (
+    Invalid,
+    Valid,
+    Validated,
+    collect,
+    combine,
+    from_result,
+    validate,
+)
+
+
+def positive(value: int) -> "Ok[int] | Err[ValueError]":
+    return Ok(value) if value > 0 else Err(ValueError(f"{value} <= 0"))
+
+
+def even(value: int) -> "Ok[int] | Err[ValueError]":
+    return Ok(value) if value % 2 == 0 else Err(ValueError(f"{value} is odd"))
+
+
+def test_from_result() -> None:
+    err = KeyError("k")
+    assert from_result(Ok(1)) == Valid(1)
+    assert from_result(Err(err)) == Invalid(err)
+
+
+def test_combine_keeps_every_error() -> None:
+    first, second, third = KeyError(), ValueError(), TypeError()
+    combined = combine(Ok(1), Err(first), Valid(2), Invalid(second, third))
+    assert combined.is_invalid()
+    assert combined.errors == (first, second, third)
+
+
+def test_combine_values_in_order() -> None:
+    combined = combine(Ok(1), Valid("a"), Ok(None))
+    assert combined == Valid((1, "a", None))
+    assert combined.map(len) == Valid(3)
+    assert combine() == Valid(())
+
+
+def test_combine_rejects_other_values() -> None:
+    with pytest.raises(TypeError):
+        combine(Ok(1), 2)  # type: ignore[arg-type]
+
+
+def test_collect_single_pass() -> None:
+    consumed: List[int] = []
+
+    def rows() -> Iterator[Validated[int]]:
+        for value in (2, -1, 3, 4):
+            consumed.append(value)
+            yield validate(value, positive, even)
+
+    collected = collect(rows())
+    assert consumed == [2, -1, 3, 4]
+    assert [str(e) for e in collected.errors] == ["-1 <= 0", "-1 is odd", "3 is odd"]
+    assert collect(positive(v) for v in (1, 2)) == Valid([1, 2])
+
+
+def test_validate_runs_every_check() -> None:
+    assert validate(4, positive, even) == Valid(4)
+    result = validate(-3, positive, even)
+    assert isinstance(result, Invalid)
+    assert len(result.errors) == 2
+
+
+def test_to_result() -> None:
+    assert Valid(1).to_result() == Ok(1)
+    errors = (KeyError(), ValueError())
+    res = Invalid(*errors).to_result("bad payload")
+    assert res.is_error()
+    # an ExceptionGroup, or its stand-in before Python 3.11
+    group: Any = res.kind()
+    assert group.message == "bad payload"
+    assert group.exceptions == errors
+
+
+def test_invalid_needs_errors() -> None:
+    with pytest.raises(ValueError):
+        Invalid()
+
+
+def test_immutable_hashable_and_picklable() -> None:
+    err = KeyError("k")
+    with pytest.raises(AttributeError):
+        Valid(1)._value = 2
+    with pytest.raises(AttributeError):
+        Invalid(err)._errors = ()
+    assert len({Valid(1), Valid(1), Invalid(err), Invalid(err)}) == 2
+    assert pickle.loads(pickle.dumps(Valid([1]))) == Valid([1])
+    assert pickle.loads(pickle.dumps(Invalid(err))).errors[0].args == ("k",)
@@ -1,5 +1,7 @@
 from .option import Option, Nothing, Some, Optional
 from .result import Result, Ok, Err, is_ok, is_err
+from .catch import catch
+from .typecheck import get_typecheck_policy, set_typecheck_policy
 
 __all__ = [
     "Optional",
@@ -11,4 +13,7 @@ __all__ = [
     "Err",
     "is_ok",
     "is_err",
+    "catch",
+    "get_typecheck_policy",
+    "set_typecheck_policy",
 ]
@@ -0,0 +1,34 @@
+"""Shims for features missing on the older Python versions supported."""
+
+import sys
+from typing import Sequence
+
+
+class ErrorGroup(Exception):
+    """Stand-in for `ExceptionGroup` before Python 3.11, exposing the same
+    `message` and `exceptions` attributes."""
+
+    def __init__(self, message: str, exceptions: Sequence[BaseException]) -> None:
+        super().__init__(message, tuple(exceptions))
+        self.message = message
+        self.exceptions = tuple(exceptions)
+
+    def __str__(self) -> str:
+        count = len(self.exceptions)
+        return f"{self.message} ({count} sub-exception{'s' if count != 1 else ''})"
+
+
+def error_group(message: str, exceptions: Sequence[BaseException]) -> BaseException:
+    """Groups several errors into a single exception: an `ExceptionGroup`
+    (or `BaseExceptionGroup`) when available, an `ErrorGroup` otherwise.
+
+    Args:
+        message (str): description of the group.
+        exceptions (Sequence[BaseException]): at least one error.
+
+    Returns:
+        BaseException: the group.
+    """
+    if sys.version_info >= (3, 11):
+        return BaseExceptionGroup(message, exceptions)
+    return ErrorGroup(message, exceptions)
@@ -0,0 +1,49 @@
+"""Immutability shared by Ok, Err, Some and Nothing.
+
+The wrapped value is written once, by the constructor, through the slot
+descriptor itself: plain attribute assignment is refused afterwards. Only
+the slots owned by toradh are protected, attributes added by user
+subclasses keep working as usual.
+"""
+
+from typing import Any, Callable
+
+_FROZEN = frozenset(("_value", "_err", "_errors", "_hash"))
+
+
+def slot_setter(cls: type, name: str) -> Callable[[Any, Any], None]:
+    """Returns the setter of a slot, bypassing `Frozen.__setattr__`.
+
+    Args:
+        cls (type): class declaring the slot.
+        name (str): name of the slot.
+
+    Returns:
+        Callable[[Any, Any], None]: called with the instance and the value.
+    """
+    setter: Callable[[Any, Any], None] = cls.__dict__[name].__set__
+    return setter
+
+
+class Frozen:
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _FROZEN:
+            raise AttributeError(f"{type(self).__name__} is immutable")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if name in _FROZEN:
+            raise AttributeError(f"{type(self).__name__} is immutable")
+        object.__delattr__(self, name)
+
+    def __setstate__(self, state: Any) -> None:
+        # used by the default pickle protocol of subclasses, state is either
+        # the instance dict or a (dict, slots) pair
+        dict_state, slot_state = state if isinstance(state, tuple) else (state, None)
+        for mapping in (dict_state, slot_state):
+            for name, value in (mapping or {}).items():
+                # hashes are not stable across processes
+                if name != "_hash":
+                    object.__setattr__(self, name, value)
@@ -0,0 +1,71 @@
+"""Swappable method implementations for the core classes.
+
+Features which change how `Ok`/`Err`/`Option` behave at runtime (type check
+policy, lightweight errors, ...) install their own version of a method on
+the class through this module, instead of checking a flag on every call.
+When a feature is off the class holds the plain function again, so it
+costs nothing.
+
+Every method has a base implementation plus an ordered set of layers.
+Each layer is a factory receiving the implementation below it and
+returning the one to use instead; lower orders sit closer to the base.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+Factory = Callable[[Callable[..., Any]], Callable[..., Any]]
+
+
+class _MethodSlot:
+    __slots__ = ("owner", "name", "base", "layers")
+
+    def __init__(self, owner: type, name: str, base: Callable[..., Any]) -> None:
+        self.owner = owner
+        self.name = name
+        self.base = base
+        self.layers: Dict[str, Tuple[int, Factory]] = {}
+
+    def install(self) -> None:
+        func = self.base
+        for _, factory in sorted(self.layers.values(), key=lambda layer: layer[0]):
+            func = factory(func)
+        setattr(self.owner, self.name, func)
+
+
+_lock = threading.RLock()
+_methods: Dict[Tuple[type, str], _MethodSlot] = {}
+
+
+def _slot(owner: type, name: str) -> _MethodSlot:
+    slot = _methods.get((owner, name))
+    if slot is None:
+        slot = _MethodSlot(owner, name, owner.__dict__[name])
+        _methods[(owner, name)] = slot
+    return slot
+
+
+def set_base(owner: type, name: str, func: Callable[..., Any]) -> None:
+    """Replaces the base implementation of owner.name, keeping its layers."""
+    with _lock:
+        slot = _slot(owner, name)
+        slot.base = func
+        slot.install()
+
+
+def add_layer(
+    owner: type, name: str, key: str, factory: Factory, order: int = 0
+) -> None:
+    """Adds (or replaces) the layer identified by key on owner.name."""
+    with _lock:
+        slot = _slot(owner, name)
+        slot.layers[key] = (order, factory)
+        slot.install()
+
+
+def remove_layer(owner: type, name: str, key: str) -> None:
+    """Removes the layer identified by key from owner.name, if present."""
+    with _lock:
+        slot = _methods.get((owner, name))
+        if slot is not None and slot.layers.pop(key, None) is not None:
+            slot.install()
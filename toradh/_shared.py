@@ -0,0 +1,229 @@
+"""Helpers shared by the features recording or wrapping calls.
+
+- `PerThread`: state updated by each thread without locks, added up on
+  demand, used by `instrumentation` and `profiling`.
+- `thread_random`: a random generator per thread, for sampling. The
+  generator of the random module is shared, every thread drawing from it
+  contends on it.
+- `generate_wrapper`: wrappers with the same parameters as the function
+  they wrap, used by `catch` and `profiling`.
+- `label`: names of types as shown in reports.
+"""
+
+import functools
+import threading
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+S = TypeVar("S")
+
+
+class PerThread(Generic[S]):
+    """State of each thread, plus the totals of the finished ones.
+
+    Threads read `local.state` and call `register` when it is missing, the
+    state is then theirs to update without locks.
+    """
+
+    __slots__ = (
+        "local",
+        "_new",
+        "_copy",
+        "_add",
+        "_subtract",
+        "_lock",
+        "_threads",
+        "_retired",
+        "_baseline",
+    )
+
+    def __init__(
+        self,
+        new: Callable[[], S],
+        copy: Callable[[S], S],
+        add: Callable[[S, S], None],
+        subtract: Callable[[S, S], None],
+    ) -> None:
+        """
+        Args:
+            new (Callable[[], S]): returns an empty state.
+            copy (Callable[[S], S]): copies a state while its thread may be
+            updating it, so without iterating over it.
+            add (Callable[[S, S], None]): adds the second state to the first.
+            subtract (Callable[[S, S], None]): subtracts the second state
+            from the first.
+        """
+        self.local = threading.local()
+        self._new = new
+        self._copy = copy
+        self._add = add
+        self._subtract = subtract
+        self._lock = threading.Lock()
+        self._threads: List[Tuple[threading.Thread, S]] = []
+        self._retired = new()
+        self._baseline = new()
+
+    def register(self) -> S:
+        """Returns a new state for the calling thread."""
+        state = self._new()
+        self.local.state = state
+        with self._lock:
+            self._threads.append((threading.current_thread(), state))
+        return state
+
+    def _totals(self) -> S:
+        # called with the lock held
+        totals = self._copy(self._retired)
+        alive = []
+        for thread, state in self._threads:
+            # no need to stop the owner thread
+            current = self._copy(state)
+            if thread.is_alive():
+                alive.append((thread, state))
+            else:
+                # a finished thread can not update its state anymore
+                self._add(self._retired, current)
+            self._add(totals, current)
+        self._threads[:] = alive
+        return totals
+
+    def totals(self) -> S:
+        """Returns the states of every thread added up, since the last
+        `reset`."""
+        with self._lock:
+            totals = self._totals()
+            self._subtract(totals, self._baseline)
+        return totals
+
+    def reset(self) -> None:
+        """Sets the totals back to zero."""
+        with self._lock:
+            self._baseline = self._totals()
+
+
+class _ThreadRandom(threading.local):
+    draw: Callable[[], float]
+
+    def __getattr__(self, name: str) -> Any:
+        # first draw of the thread, random is imported by the first user
+        if name != "draw":
+            raise AttributeError(name)
+        import random
+
+        self.draw = random.Random().random
+        return self.draw
+
+
+# thread_random.draw() returns a float in [0, 1) out of the generator of
+# the calling thread
+thread_random = _ThreadRandom()
+
+
+def label(value: Any) -> str:
+    """Name of a type, without the module for builtins, or str(value)."""
+    if isinstance(value, type):
+        if value.__module__ == "builtins":
+            return value.__qualname__
+        return f"{value.__module__}.{value.__qualname__}"
+    return str(value)
+
+
+def qualname(func: Callable[..., Any]) -> str:
+    """Qualified name of a function, the repr of other callables (partials,
+    callable instances), which have none."""
+    return getattr(func, "__qualname__", None) or repr(func)
+
+
+def signature_source(
+    func: Callable[..., Any],
+) -> Optional[Tuple[str, str, Dict[str, Any]]]:
+    """Returns the parameter list and the forwarding call of func as source
+    code, along with the defaults they refer to. None if the signature can
+    not be inspected (some builtins)."""
+    import inspect
+
+    try:
+        # the parameters of func itself: a decorator setting __wrapped__
+        # (functools.wraps) may take other parameters than the function it
+        # wraps
+        signature = inspect.signature(func, follow_wrapped=False)
+    except (TypeError, ValueError):
+        return None
+    params: List[str] = []
+    call: List[str] = []
+    defaults: Dict[str, Any] = {}
+    kind = inspect.Parameter
+    previous = None
+    for index, param in enumerate(signature.parameters.values()):
+        if previous is kind.POSITIONAL_ONLY and param.kind is not kind.POSITIONAL_ONLY:
+            params.append("/")
+        if param.kind is kind.KEYWORD_ONLY and previous not in (
+            kind.KEYWORD_ONLY,
+            kind.VAR_POSITIONAL,
+        ):
+            params.append("*")
+        default = ""
+        if param.default is not param.empty:
+            defaults[f"_toradh_default{index}"] = param.default
+            default = f"=_toradh_default{index}"
+        if param.kind is kind.VAR_POSITIONAL:
+            params.append(f"*{param.name}")
+            call.append(f"*{param.name}")
+        elif param.kind is kind.VAR_KEYWORD:
+            params.append(f"**{param.name}")
+            call.append(f"**{param.name}")
+        elif param.kind is kind.KEYWORD_ONLY:
+            params.append(f"{param.name}{default}")
+            call.append(f"{param.name}={param.name}")
+        else:
+            params.append(f"{param.name}{default}")
+            call.append(param.name)
+        previous = param.kind
+    if previous is kind.POSITIONAL_ONLY:
+        params.append("/")
+    return ", ".join(params), ", ".join(call), defaults
+
+
+def generate_wrapper(
+    func: Callable[..., Any],
+    owner: str,
+    body: Callable[[str], List[str]],
+    bindings: Dict[str, Any],
+) -> Callable[..., Any]:
+    """Compiles a wrapper of func taking the same parameters, which avoids
+    packing and unpacking *args/**kwargs on every call. Functions whose
+    signature can not be inspected get `*args, **kwargs`. Coroutine
+    functions get a coroutine function.
+
+    Args:
+        func (Callable[..., Any]): function to wrap.
+        owner (str): module generating the wrapper, shown in tracebacks.
+        body (Callable[[str], List[str]]): returns the lines of the wrapper
+        body, given the expression calling func, awaited for coroutine
+        functions. func itself is bound to `_toradh_func`.
+        bindings (Dict[str, Any]): other names used by the body, all of them
+        starting with `_toradh_`.
+
+    Returns:
+        Callable[..., Any]: the wrapper, with the metadata of func.
+    """
+    import inspect
+
+    is_async = inspect.iscoroutinefunction(func)
+    source = signature_source(func)
+    params, call, defaults = source or ("*args, **kwargs", "*args, **kwargs", {})
+    names = {"_toradh_func": func, **bindings, **defaults}
+    code = "\n".join(
+        [
+            f"def factory({', '.join(names)}):",
+            f"    {'async ' if is_async else ''}def wrapper({params}):",
+            *(
+                f"        {line}"
+                for line in body(f"{'await ' if is_async else ''}_toradh_func({call})")
+            ),
+            "    return wrapper",
+        ]
+    )
+    namespace: Dict[str, Any] = {}
+    exec(compile(code, f"<toradh.{owner} {qualname(func)}>", "exec"), namespace)
+    wrapper = namespace["factory"](*names.values())
+    return functools.wraps(func)(wrapper)
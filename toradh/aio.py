@@ -0,0 +1,499 @@
+"""Helpers to run many Result returning coroutines concurrently, and
+adapters over async streams of Result values.
+
+Coroutines may return `Ok`/`Err` instances, plain values (wrapped in `Ok`)
+or raise, in which case the exception is returned as `Err`. Cancellation of
+the caller is never swallowed.
+
+The stream adapters (`afilter_ok`, `amap_ok`, `apartition`, `acollect`,
+`achunked`) only read from their input when their consumer asks for more,
+so backpressure is preserved along the pipeline.
+"""
+
+import asyncio
+import collections.abc
+import math
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .result import Err, Ok
+
+T = TypeVar("T")
+E = TypeVar("E", bound=BaseException)
+
+AnyResult = Union[Ok[Any], Err[Any]]
+
+
+async def _settle(aw: Awaitable[Any]) -> AnyResult:
+    try:
+        value = await aw
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        return Err(e)
+    if isinstance(value, (Ok, Err)):
+        return value
+    return Ok(value)
+
+
+async def _run_one(aw: Awaitable[Any], timeout: Optional[float]) -> AnyResult:
+    if timeout is None:
+        return await _settle(aw)
+    # the exceptions of the call, TimeoutError included, are settled inside
+    # wait_for: only its own timeout gets out
+    try:
+        return await asyncio.wait_for(_settle(aw), timeout)
+    except asyncio.TimeoutError:
+        return Err(TimeoutError(f"call did not finish within {timeout}s"))
+
+
+def _close(aws: Iterable[Tuple[int, Awaitable[Any]]]) -> None:
+    # avoids "coroutine was never awaited" warnings for skipped calls
+    for _, aw in aws:
+        if asyncio.iscoroutine(aw):
+            aw.close()
+
+
+async def as_completed_results(
+    aws: Iterable[Awaitable[Any]],
+    *,
+    limit: Optional[int] = None,
+    timeout: Optional[float] = None,
+    fail_fast: bool = False,
+) -> AsyncGenerator[Tuple[int, AnyResult], None]:
+    """Runs the awaitables with at most `limit` of them in flight and yields
+    `(index, result)` pairs as they finish. The input is consumed lazily, so
+    it can be a generator producing the coroutines on demand.
+
+    Example:
+        >>> async for index, res in as_completed_results(calls, limit=10):
+        >>>     if res.is_error():
+        >>>         ...
+
+    Args:
+        aws (Iterable[Awaitable[Any]]): coroutines or futures to run.
+        limit (Optional[int]): maximum amount of awaitables running at once.
+        timeout (Optional[float]): seconds allowed per call, a call exceeding
+        it yields `Err(TimeoutError)`.
+        fail_fast (bool): stop and cancel the remaining calls after the
+        first Err.
+
+    Yields:
+        Tuple[int, Result]: position in the input and the result of the call.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+    max_in_flight = math.inf if limit is None else limit
+    items = enumerate(aws)
+    pending: Dict["asyncio.Future[AnyResult]", int] = {}
+
+    def fill() -> None:
+        while len(pending) < max_in_flight:
+            item = next(items, None)
+            if item is None:
+                return
+            index, aw = item
+            pending[asyncio.ensure_future(_run_one(aw, timeout))] = index
+
+    try:
+        fill()
+        while pending:
+            done, _ = await asyncio.wait(
+                pending.keys(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in sorted(done, key=pending.__getitem__):
+                index = pending.pop(task)
+                result = task.result()
+                yield index, result
+                if fail_fast and isinstance(result, Err):
+                    return
+            fill()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        if isinstance(aws, collections.abc.Sequence):
+            _close(items)
+
+
+async def gather_results(
+    aws: Iterable[Awaitable[Any]],
+    *,
+    limit: Optional[int] = None,
+    timeout: Optional[float] = None,
+    fail_fast: bool = False,
+) -> List[AnyResult]:
+    """Runs the awaitables with at most `limit` of them in flight and returns
+    their results in the same order as the input.
+
+    Example:
+        >>> results = await gather_results(
+        >>>     (fetch(url) for url in urls), limit=20, timeout=5
+        >>> )
+
+    Args:
+        aws (Iterable[Awaitable[Any]]): coroutines or futures to run.
+        limit (Optional[int]): maximum amount of awaitables running at once.
+        timeout (Optional[float]): seconds allowed per call, a call exceeding
+        it returns `Err(TimeoutError)`.
+        fail_fast (bool): cancel the remaining calls after the first Err,
+        their positions hold `Err(asyncio.CancelledError())`.
+
+    Returns:
+        List[Result]: one result per awaitable.
+    """
+    aws = list(aws)
+    results: List[Optional[AnyResult]] = [None] * len(aws)
+    stream = as_completed_results(
+        aws, limit=limit, timeout=timeout, fail_fast=fail_fast
+    )
+    try:
+        async for index, result in stream:
+            results[index] = result
+    finally:
+        await stream.aclose()
+    return [
+        Err(asyncio.CancelledError()) if result is None else result
+        for result in results
+    ]
+
+
+async def collect_results(
+    aws: Iterable[Awaitable[Any]],
+    *,
+    limit: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> Union[Ok[List[Any]], Err[Any]]:
+    """Runs the awaitables with at most `limit` of them in flight and returns
+    every value, in input order, as a single Ok. On the first Err the
+    remaining calls are cancelled and that Err is returned.
+
+    Args:
+        aws (Iterable[Awaitable[Any]]): coroutines or futures to run.
+        limit (Optional[int]): maximum amount of awaitables running at once.
+        timeout (Optional[float]): seconds allowed per call, a call exceeding
+        it results in `Err(TimeoutError)`.
+
+    Returns:
+        Result[List[Any], Any]: Ok with every value or the first Err.
+    """
+    values: Dict[int, Any] = {}
+    stream = as_completed_results(aws, limit=limit, timeout=timeout, fail_fast=True)
+    try:
+        async for index, result in stream:
+            if isinstance(result, Err):
+                return result
+            values[index] = result._value
+    finally:
+        await stream.aclose()
+    return Ok([values[index] for index in range(len(values))])
+
+
+AsyncResults = AsyncIterable[Union[Ok[T], Err[E]]]
+
+
+async def afilter_ok(results: AsyncResults[T, E]) -> AsyncGenerator[T, None]:
+    """Async counterpart of `toradh.iter.filter_ok`: yields the values of the
+    Ok items, skipping the Err ones.
+
+    Args:
+        results (AsyncIterable[Result[T, E]]): input stream.
+
+    Yields:
+        T: unwrapped Ok values.
+    """
+    async for result in results:
+        if isinstance(result, Ok):
+            yield result._value
+
+
+async def afilter_err(results: AsyncResults[T, E]) -> AsyncGenerator[E, None]:
+    """Async counterpart of `toradh.iter.filter_err`: yields the errors of
+    the Err items, skipping the Ok ones.
+
+    Args:
+        results (AsyncIterable[Result[T, E]]): input stream.
+
+    Yields:
+        E: wrapped errors.
+    """
+    async for result in results:
+        if isinstance(result, Err):
+            yield result._err
+
+
+async def _apply(
+    op: Callable[[Any], Awaitable[Any]], value: Any, timeout: Optional[float]
+) -> AnyResult:
+    try:
+        aw = op(value)
+    except Exception as e:
+        return Err(e)
+    return await _run_one(aw, timeout)
+
+
+def _is_ready(entry: Any) -> bool:
+    return not isinstance(entry, asyncio.Future) or entry.done()
+
+
+def _resolve(entry: Any) -> AnyResult:
+    return entry.result() if isinstance(entry, asyncio.Future) else entry
+
+
+async def amap_ok(
+    results: AsyncResults[T, E],
+    op: Callable[[T], Awaitable[Any]],
+    *,
+    limit: int = 8,
+    timeout: Optional[float] = None,
+    ordered: bool = True,
+) -> AsyncGenerator[AnyResult, None]:
+    """Applies an async function to the Ok values, with up to `limit` calls
+    running at once. Err items are passed through untouched.
+
+    At most `limit` items are held between the input and the output (running,
+    or finished and waiting to be yielded). Nothing more is read from the
+    input until the consumer takes results out, so a slow consumer slows the
+    input down instead of growing a buffer.
+
+    The function may return an Ok/Err, a plain value (wrapped in Ok) or
+    raise, which results in Err.
+
+    Example:
+        >>> async for res in amap_ok(consumer(), enrich, limit=16):
+        >>>     ...
+
+    Args:
+        results (AsyncIterable[Result[T, E]]): input stream.
+        op (Callable[[T], Awaitable[Any]]): async function applied to values.
+        limit (int): maximum amount of items held at once.
+        timeout (Optional[float]): seconds allowed per call, a call exceeding
+        it results in `Err(TimeoutError)`.
+        ordered (bool): yield in input order, otherwise as calls finish.
+
+    Yields:
+        Result: one result per input item.
+    """
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+    source = results.__aiter__()
+    # input order entries: Futures for the calls, Results passed through
+    pending: Deque[Any] = collections.deque()
+    next_item: Optional["asyncio.Future[Any]"] = None
+    exhausted = False
+    try:
+        while True:
+            if ordered:
+                while pending and _is_ready(pending[0]):
+                    yield _resolve(pending.popleft())
+            else:
+                for entry in [entry for entry in pending if _is_ready(entry)]:
+                    pending.remove(entry)
+                    yield _resolve(entry)
+            if not exhausted and next_item is None and len(pending) < limit:
+                next_item = asyncio.ensure_future(source.__anext__())
+            if next_item is None and not pending:
+                return
+            waiting = [entry for entry in pending if isinstance(entry, asyncio.Future)]
+            if next_item is not None:
+                waiting.append(next_item)
+            if waiting and (next_item is None or not next_item.done()):
+                await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            if next_item is not None and next_item.done():
+                fetched, next_item = next_item, None
+                try:
+                    item = fetched.result()
+                except StopAsyncIteration:
+                    exhausted = True
+                    continue
+                if isinstance(item, Ok):
+                    call = _apply(op, item._value, timeout)
+                    pending.append(asyncio.ensure_future(call))
+                else:
+                    pending.append(item)
+    finally:
+        running = [entry for entry in pending if isinstance(entry, asyncio.Future)]
+        if next_item is not None:
+            running.append(next_item)
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+
+class _Partition:
+    """State shared by the two sides returned by `apartition`."""
+
+    __slots__ = ("source", "buffers", "maxsize", "exhausted", "_condition")
+
+    def __init__(self, source: AsyncIterator[Any], maxsize: int) -> None:
+        self.source = source
+        self.buffers: Tuple[Deque[Any], Deque[Any]] = (
+            collections.deque(),
+            collections.deque(),
+        )
+        self.maxsize = maxsize
+        self.exhausted = False
+        self._condition: Optional[asyncio.Condition] = None
+
+    @property
+    def condition(self) -> asyncio.Condition:
+        # created lazily, within the running loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def side(self, index: int) -> AsyncGenerator[Any, None]:
+        own, other = self.buffers[index], self.buffers[1 - index]
+        condition = self.condition
+        while True:
+            async with condition:
+                while True:
+                    if own:
+                        item = own.popleft()
+                        condition.notify_all()
+                        break
+                    if self.exhausted:
+                        return
+                    if len(other) >= self.maxsize:
+                        # wait for the other side to catch up
+                        await condition.wait()
+                        continue
+                    try:
+                        result = await self.source.__anext__()
+                    except StopAsyncIteration:
+                        self.exhausted = True
+                        condition.notify_all()
+                        return
+                    side = 0 if isinstance(result, Ok) else 1
+                    value = result._value if side == 0 else result._err
+                    if side == index:
+                        item = value
+                        break
+                    other.append(value)
+                    condition.notify_all()
+            yield item
+
+
+def apartition(
+    results: AsyncResults[T, E], *, maxsize: int = 1024
+) -> Tuple[AsyncGenerator[T, None], AsyncGenerator[E, None]]:
+    """Async counterpart of `toradh.iter.partition`: splits the stream into
+    its Ok values and its errors, both lazily.
+
+    Items meant for the other side are buffered, up to `maxsize`. Beyond
+    that the side reading ahead waits for the other one, so both sides must
+    be consumed concurrently (for instance from two tasks). When only one of
+    them is needed use `afilter_ok` or `afilter_err` instead.
+
+    Example:
+        >>> values, errors = apartition(consumer())
+        >>> await asyncio.gather(store(values), report(errors))
+
+    Args:
+        results (AsyncIterable[Result[T, E]]): input stream.
+        maxsize (int): items buffered for the slower side.
+
+    Returns:
+        Tuple[AsyncGenerator[T], AsyncGenerator[E]]: the values and the errors.
+    """
+    if maxsize < 1:
+        raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+    shared = _Partition(results.__aiter__(), maxsize)
+    return shared.side(0), shared.side(1)
+
+
+async def acollect(results: AsyncResults[T, E]) -> Union[Ok[List[T]], Err[E]]:
+    """Async counterpart of `toradh.iter.collect`: gathers the Ok values into
+    a list, stopping at the first Err without reading any further.
+
+    Args:
+        results (AsyncIterable[Result[T, E]]): input stream.
+
+    Returns:
+        Result[List[T], E]: every value, or the first Err found.
+    """
+    values: List[T] = []
+    async for result in results:
+        if isinstance(result, Ok):
+            values.append(result._value)
+        else:
+            return result
+    return Ok(values)
+
+
+async def achunked(
+    items: AsyncIterable[T], size: int, *, max_delay: Optional[float] = None
+) -> AsyncGenerator[List[T], None]:
+    """Groups the stream into lists of up to `size` items. With `max_delay`
+    a chunk is also yielded once that many seconds went by since its first
+    item arrived, so slow streams still produce regular batches.
+
+    Only one item is requested from the input at a time.
+
+    Example:
+        >>> async for batch in achunked(afilter_ok(consumer()), 500, max_delay=1):
+        >>>     await store(batch)
+
+    Args:
+        items (AsyncIterable[T]): input stream.
+        size (int): maximum items per chunk.
+        max_delay (Optional[float]): seconds a chunk may wait to be filled.
+
+    Yields:
+        List[T]: consecutive, non empty chunks.
+    """
+    if size < 1:
+        raise ValueError(f"size must be at least 1, got {size}")
+    source = items.__aiter__()
+    loop = asyncio.get_running_loop()
+    next_item: Optional["asyncio.Future[T]"] = None
+    chunk: List[T] = []
+    deadline = math.inf
+    try:
+        while True:
+            if next_item is None:
+                next_item = asyncio.ensure_future(source.__anext__())
+            if chunk and max_delay is not None:
+                remaining = deadline - loop.time()
+                if remaining > 0:
+                    await asyncio.wait([next_item], timeout=remaining)
+            else:
+                await asyncio.wait([next_item])
+            if not next_item.done():
+                # the chunk timed out, the pending read carries over
+                yield chunk
+                chunk = []
+                continue
+            fetched, next_item = next_item, None
+            try:
+                item = fetched.result()
+            except StopAsyncIteration:
+                if chunk:
+                    yield chunk
+                return
+            if not chunk and max_delay is not None:
+                deadline = loop.time() + max_delay
+            chunk.append(item)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    finally:
+        if next_item is not None:
+            next_item.cancel()
+            await asyncio.gather(next_item, return_exceptions=True)
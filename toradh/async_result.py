@@ -0,0 +1,241 @@
+"""Awaitable chains of Result transforms.
+
+`AsyncResult` wraps a coroutine (or any awaitable) resolving to a Result,
+or a Result already at hand, and records `map`/`and_then`/`map_err`/
+`or_else` steps taking regular or async callables. Whether a step must be
+awaited is decided once, when it is added, instead of checking the value
+it returns on every run. Awaiting the chain runs every step within a
+single coroutine, without going back to the event loop between steps that
+do not suspend.
+
+Chains built with `AsyncResult.chain()` have no source yet: their steps
+are set up once, then run over the source of each call given to `on`.
+
+Example:
+    >>> profile = await (
+    >>>     AsyncResult(fetch_user(user_id))  # Awaitable[Result[User, Exception]]
+    >>>     .map(to_dto)  # regular function
+    >>>     .and_then(fetch_settings)  # async function returning a Result
+    >>>     .map_err(ServiceError.wrap)
+    >>> )
+    >>>
+    >>> LOAD_PROFILE = AsyncResult.chain().map(to_dto).and_then(fetch_settings)
+    >>> profile = await LOAD_PROFILE.on(fetch_user(user_id))
+"""
+
+import inspect
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generator,
+    Generic,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from .result import Err, Ok
+
+T = TypeVar("T")
+V = TypeVar("V")
+E = TypeVar("E", bound=BaseException)
+R = TypeVar("R", bound=BaseException)
+
+AnyResult = Union[Ok[Any], Err[Any]]
+# applies to Ok (else Err), op returns a Result, op, op is a coroutine function
+_Step = Tuple[bool, bool, Callable[[Any], Any], bool]
+_NO_SOURCE: Any = object()
+
+
+def _is_async(op: Callable[..., Any]) -> bool:
+    # plain functions and methods are told apart by their code flags,
+    # inspect handles the rest (partials, marked functions) more slowly
+    code = getattr(op, "__code__", None)
+    if code is not None and not getattr(op, "__dict__", None):
+        return bool(code.co_flags & inspect.CO_COROUTINE)
+    return inspect.iscoroutinefunction(op)
+
+
+class AsyncResult(Generic[T, E]):
+    """Awaitable resolving to `Ok`/`Err` once its source and every step
+    added have run.
+
+    Each step returns a new AsyncResult, the source is shared: like a
+    coroutine, a chain built on a coroutine can only be awaited once. Reuse
+    the steps over new sources with `on` instead.
+
+    Callables are awaited when they are coroutine functions, as told by
+    their code flags or `inspect.iscoroutinefunction`. A regular function returning an
+    awaitable (a lambda calling a coroutine function) is not awaited.
+    """
+
+    __slots__ = ("_source", "_pending", "_steps")
+
+    def __init__(
+        self, source: Union[Awaitable[Union[Ok[T], Err[E]]], Ok[T], Err[E]]
+    ) -> None:
+        """
+        Args:
+            source (Union[Awaitable[Result[T, E]], Result[T, E]]): the
+            Result, or an awaitable resolving to it, such as a coroutine.
+        """
+        self._source: Any = source
+        self._pending = not isinstance(source, (Ok, Err))
+        self._steps: Tuple[_Step, ...] = ()
+
+    def _then(self, step: _Step) -> Any:
+        chained: AsyncResult[Any, Any] = AsyncResult.__new__(AsyncResult)
+        chained._source = self._source
+        chained._pending = self._pending
+        chained._steps = self._steps + (step,)
+        return chained
+
+    @classmethod
+    def chain(cls) -> "AsyncResult[Any, Any]":
+        """Starts a chain without source, to be reused through `on`.
+
+        Returns:
+            AsyncResult[Any, Any]: chain without steps nor source.
+        """
+        return cls(_NO_SOURCE)
+
+    def on(
+        self, source: Union[Awaitable[Union[Ok[Any], Err[Any]]], Ok[Any], Err[Any]]
+    ) -> "AsyncResult[T, E]":
+        """Returns the same steps over another source, without setting them
+        up again.
+
+        Args:
+            source (Union[Awaitable[Result], Result]): the Result, or an
+            awaitable resolving to it.
+
+        Returns:
+            AsyncResult[T, E]: chain ready to be awaited.
+        """
+        bound: AsyncResult[T, E] = AsyncResult.__new__(AsyncResult)
+        bound._source = source
+        bound._pending = not isinstance(source, (Ok, Err))
+        bound._steps = self._steps
+        return bound
+
+    @overload
+    def map(self, op: Callable[[T], Awaitable[V]]) -> "AsyncResult[V, E]": ...
+
+    @overload
+    def map(self, op: Callable[[T], V]) -> "AsyncResult[V, E]": ...
+
+    def map(self, op: Callable[[T], Any]) -> "AsyncResult[Any, E]":
+        """Applies op to the value in case of Ok, an Err is kept as is.
+
+        Args:
+            op (Callable[[T], Union[V, Awaitable[V]]]): regular or async
+            function to apply to the content of Ok().
+
+        Returns:
+            AsyncResult[V, E]: the chain with the new step.
+        """
+        return self._then((True, False, op, _is_async(op)))
+
+    @overload
+    def and_then(
+        self, op: Callable[[T], Awaitable[Union[Ok[V], Err[R]]]]
+    ) -> "AsyncResult[V, Union[E, R]]": ...
+
+    @overload
+    def and_then(
+        self, op: Callable[[T], Union[Ok[V], Err[R]]]
+    ) -> "AsyncResult[V, Union[E, R]]": ...
+
+    def and_then(self, op: Callable[[T], Any]) -> "AsyncResult[Any, Any]":
+        """Chains a Result returning operation in case of Ok, an Err is kept
+        as is.
+
+        Args:
+            op (Callable[[T], Union[Result[V, R], Awaitable[Result[V, R]]]]):
+            regular or async function to invoke with the content of Ok().
+
+        Returns:
+            AsyncResult[V, E | R]: the chain with the new step.
+        """
+        return self._then((True, True, op, _is_async(op)))
+
+    @overload
+    def map_err(self, op: Callable[[E], Awaitable[R]]) -> "AsyncResult[T, R]": ...
+
+    @overload
+    def map_err(self, op: Callable[[E], R]) -> "AsyncResult[T, R]": ...
+
+    def map_err(self, op: Callable[[E], Any]) -> "AsyncResult[T, Any]":
+        """Applies op to the error in case of Err, an Ok is kept as is.
+
+        Args:
+            op (Callable[[E], Union[R, Awaitable[R]]]): regular or async
+            function to apply to the content of Err().
+
+        Returns:
+            AsyncResult[T, R]: the chain with the new step.
+        """
+        return self._then((False, False, op, _is_async(op)))
+
+    @overload
+    def or_else(
+        self, op: Callable[[E], Awaitable[Union[Ok[T], Err[R]]]]
+    ) -> "AsyncResult[T, R]": ...
+
+    @overload
+    def or_else(
+        self, op: Callable[[E], Union[Ok[T], Err[R]]]
+    ) -> "AsyncResult[T, R]": ...
+
+    def or_else(self, op: Callable[[E], Any]) -> "AsyncResult[T, Any]":
+        """Chains a Result returning recovery in case of Err, an Ok is kept
+        as is.
+
+        Args:
+            op (Callable[[E], Union[Result[T, R], Awaitable[Result[T, R]]]]):
+            regular or async function to invoke with the content of Err().
+
+        Returns:
+            AsyncResult[T, R]: the chain with the new step.
+        """
+        return self._then((False, True, op, _is_async(op)))
+
+    async def _resolve(self) -> Any:
+        result = self._source
+        if self._pending:
+            result = await result
+        # like Pipeline, steps run over the raw value or error and a single
+        # Ok/Err is created at the end
+        if isinstance(result, Ok):
+            ok, x = True, result._value
+        else:
+            ok, x = False, result._err
+        last = result
+        for on_ok, returns_result, op, is_async in self._steps:
+            if on_ok is not ok:
+                continue
+            x = op(x)
+            if is_async:
+                x = await x
+            if returns_result:
+                last = x
+                if isinstance(x, Ok):
+                    ok, x = True, x._value
+                else:
+                    ok, x = False, x._err
+            else:
+                last = None
+        if last is not None:
+            return last
+        return Ok(x) if ok else Err(x)
+
+    def __await__(self) -> Generator[Any, None, Union[Ok[T], Err[E]]]:
+        if self._source is _NO_SOURCE:
+            raise TypeError("chains without source must be given one with on()")
+        return self._resolve().__await__()
+
+    def __repr__(self) -> str:
+        source = "" if self._source is _NO_SOURCE else repr(self._source)
+        return f"AsyncResult({source}, steps={len(self._steps)})"
@@ -0,0 +1,181 @@
+"""Early return on `Err` through generators.
+
+Python has no `?` operator: bailing out on the first Err takes either an
+`if is_err(...)` check after every step, or `unwrap()` inside a `try`, which
+pays for a raise and a catch on every failure. A `result_block` body
+instead `yield`s each Result: the value of an Ok is sent back into the
+body, while the first Err closes the body and is returned as is. Closing
+throws `GeneratorExit` at the pending `yield`, which runs its `finally`
+clauses and context managers, so the Err path does not avoid exceptions.
+
+It buys flat code rather than speed. `python -m benchmarks.bench_result_block`
+measured, per call, on CPython 3.11 (3.10 to 3.13 rank the same way):
+
+- success path: about 1.7 us, against 1.1 us for the `if is_err(...)`
+  checks and 0.9 us for `unwrap()` inside a `try`.
+- failure path: about 1.5 us, against 0.9 us for the checks and 1.8 us
+  for the `try`.
+
+The ratios vary between machines, on some the failure path costs more
+than the `try` too, so measure before using it on a hot path.
+
+Example:
+    >>> @result_block
+    >>> def transfer(src: int, dst: int, amount: int) -> ResultBlock[Result[int, Exception]]:
+    >>>     source = yield find_account(src)
+    >>>     target = yield find_account(dst)
+    >>>     yield check_funds(source, amount)
+    >>>     return Ok(source.balance - amount)
+    >>>
+    >>> transfer(1, 2, 10)  # Ok(90), or the first Err found
+"""
+
+import functools
+import inspect
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Generator,
+    Generic,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from ._shared import qualname
+from .result import Err, Ok
+
+R = TypeVar("R")
+
+AnyResult = Union[Ok[Any], Err[Any]]
+
+
+class Return(Generic[R]):
+    """Ends a block with a value. Async generators can not `return` a value,
+    so async blocks `yield Return(...)` instead; sync blocks may use both.
+
+    Example:
+        >>> yield Return(Ok(total))
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: R) -> None:
+        """
+        Args:
+            value (R): returned by the block, usually a Result.
+        """
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"Return({self.value!r})"
+
+
+# types of the block bodies: they yield Results, receive their values and
+# return R, or yield Return(R) for async ones
+ResultBlock = Generator[Union[AnyResult, Return[R]], Any, R]
+AsyncResultBlock = AsyncGenerator[Union[AnyResult, Return[R]], Any]
+
+
+def _unexpected(step: Any) -> TypeError:
+    return TypeError(f"result blocks must yield Ok, Err or Return, got {step!r}")
+
+
+async def _arun(gen: AsyncGenerator[Any, Any]) -> Any:
+    asend = gen.asend
+    value = None
+    try:
+        while True:
+            step = await asend(value)
+            if isinstance(step, Ok):
+                value = step._value
+            elif isinstance(step, Err):
+                await gen.aclose()
+                return step
+            elif isinstance(step, Return):
+                await gen.aclose()
+                return step.value
+            else:
+                await gen.aclose()
+                raise _unexpected(step)
+    except StopAsyncIteration:
+        return None
+
+
+@overload
+def result_block(
+    func: Callable[..., AsyncGenerator[Any, Any]],
+) -> Callable[..., Awaitable[Any]]: ...
+
+
+@overload
+def result_block(func: Callable[..., Generator[Any, Any, R]]) -> Callable[..., R]: ...
+
+
+def result_block(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Runs a generator function as a block returning early on Err.
+
+    Each `yield` in the body takes a Result: an Ok gives back its value, an
+    Err closes the body, raising `GeneratorExit` at that `yield` so its
+    `finally` clauses run, and becomes the return value. Otherwise the block returns what the body returns, as is.
+
+    Async generator functions become coroutine functions, they can `await`
+    between the yields and end with `yield Return(value)`; without it they
+    return None.
+
+    Example:
+        >>> @result_block
+        >>> async def load(user_id: int) -> AsyncResultBlock[Result[Profile, Exception]]:
+        >>>     user = yield await fetch_user(user_id)
+        >>>     settings = yield await fetch_settings(user)
+        >>>     yield Return(Ok(Profile(user, settings)))
+
+    Args:
+        func (Callable[..., Generator]): generator, or async generator,
+        function yielding Results.
+
+    Raises:
+        TypeError: if func is not a generator function, or, when called, if
+        the body yields something else than Ok, Err or Return.
+
+    Returns:
+        Callable[..., Any]: regular or coroutine function with the same
+        parameters.
+    """
+    if inspect.isasyncgenfunction(func):
+
+        @functools.wraps(func)
+        async def async_block(*args: Any, **kwargs: Any) -> Any:
+            return await _arun(func(*args, **kwargs))
+
+        return async_block
+
+    if not inspect.isgeneratorfunction(func):
+        raise TypeError(f"{qualname(func)} must be a generator function")
+
+    @functools.wraps(func)
+    def block(*args: Any, **kwargs: Any) -> Any:
+        gen = func(*args, **kwargs)
+        send = gen.send
+        value = None
+        try:
+            while True:
+                step = send(value)
+                if isinstance(step, Ok):
+                    value = step._value
+                elif isinstance(step, Err):
+                    # runs the finally clauses and context managers of the body
+                    gen.close()
+                    return step
+                elif isinstance(step, Return):
+                    gen.close()
+                    return step.value
+                else:
+                    gen.close()
+                    raise _unexpected(step)
+        except StopIteration as stop:
+            return stop.value
+
+    return block
@@ -0,0 +1,356 @@
+"""Circuit breaker for functions returning `Result`.
+
+The breaker watches the share of calls failing with given exception classes
+over a sliding time window. Once one of them goes over its threshold the
+circuit opens: calls are not made anymore and a preallocated
+`Err(CircuitOpenError)` is returned right away, shedding load from the
+failing dependency. After `open_for` seconds a few probe calls are let
+through (half open); if they succeed the circuit closes again, otherwise it
+stays open for another period.
+
+Err results of other exception classes (a "not found", a validation error)
+count as regular, successful calls.
+
+Example:
+    >>> breaker = CircuitBreaker(
+    >>>     {TimeoutError: 0.2, ConnectionError: 0.5},
+    >>>     window=30,
+    >>>     open_for=10,
+    >>>     on_state_change=lambda old, new: log.warning("%s -> %s", old, new),
+    >>> )
+    >>>
+    >>> @breaker
+    >>> def fetch(url: str) -> Result[bytes, Exception]:
+    >>>     ...
+"""
+
+import functools
+import inspect
+import threading
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from .lightweight import SentinelErr
+from .result import Err
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+CircuitState = Literal["closed", "open", "half_open"]
+StateListener = Callable[[CircuitState, CircuitState], None]
+
+
+class CircuitOpenError(Exception):
+    """Returned, as Err, by the calls rejected while the circuit is open."""
+
+
+class _Window:
+    """Calls and failures per exception class over the last `size` seconds,
+    kept in time buckets."""
+
+    __slots__ = ("width", "epochs", "totals", "failures")
+
+    def __init__(self, size: float, buckets: int, classes: int) -> None:
+        self.width = size / buckets
+        self.epochs = [-1] * buckets
+        self.totals = [0] * buckets
+        self.failures = [[0] * classes for _ in range(buckets)]
+
+    def record(self, now: float, classes: Tuple[int, ...]) -> None:
+        epoch = int(now // self.width)
+        index = epoch % len(self.epochs)
+        failures = self.failures[index]
+        if self.epochs[index] != epoch:
+            self.epochs[index] = epoch
+            self.totals[index] = 0
+            failures[:] = [0] * len(failures)
+        self.totals[index] += 1
+        for cls in classes:
+            failures[cls] += 1
+
+    def counts(self, now: float) -> Tuple[int, List[int]]:
+        oldest = int(now // self.width) - len(self.epochs)
+        total = 0
+        failures = [0] * len(self.failures[0])
+        for epoch, calls, bucket in zip(self.epochs, self.totals, self.failures):
+            if epoch > oldest:
+                total += calls
+                for cls, count in enumerate(bucket):
+                    failures[cls] += count
+        return total, failures
+
+    def clear(self) -> None:
+        for index, failures in enumerate(self.failures):
+            self.totals[index] = 0
+            failures[:] = [0] * len(failures)
+
+
+class CircuitBreaker:
+    """Stops calling a dependency while its failure rate is too high.
+
+    Works as a decorator for both regular and async functions, or through
+    `call`/`acall`.
+    """
+
+    def __init__(
+        self,
+        thresholds: Mapping[Type[BaseException], float],
+        *,
+        window: float = 60.0,
+        buckets: int = 10,
+        min_calls: int = 20,
+        open_for: float = 30.0,
+        half_open_probes: int = 1,
+        on_state_change: Optional[StateListener] = None,
+        clock: Callable[[], float] = time.monotonic,
+        name: str = "circuit",
+    ) -> None:
+        """
+        Args:
+            thresholds (Mapping[Type[BaseException], float]): failure rate,
+            between 0 and 1, opening the circuit for each exception class.
+            Subclasses count towards their base classes.
+            window (float): seconds covered by the failure rates.
+            buckets (int): time buckets dividing the window, more buckets
+            make the window slide more smoothly.
+            min_calls (int): calls needed within the window before the
+            circuit can open.
+            open_for (float): seconds the circuit stays open before probing.
+            half_open_probes (int): successful probes needed to close again,
+            also the maximum amount of probes in flight.
+            on_state_change (Optional[Callable[[str, str], None]]): called
+            with the previous and the new state after every transition.
+            clock (Callable[[], float]): time source, in seconds.
+            name (str): used in the CircuitOpenError message.
+
+        Raises:
+            ValueError: if a threshold or a setting is out of range.
+        """
+        for cls, threshold in thresholds.items():
+            if not 0.0 < threshold <= 1.0:
+                raise ValueError(
+                    f"threshold for {cls.__name__} must be in (0, 1], got {threshold}"
+                )
+        if window <= 0 or buckets < 1 or min_calls < 1 or half_open_probes < 1:
+            raise ValueError("window, buckets, min_calls and probes must be positive")
+        self.name = name
+        self._classes = tuple(thresholds)
+        self._thresholds = tuple(thresholds.values())
+        self._min_calls = min_calls
+        self._open_for = open_for
+        self._half_open_probes = half_open_probes
+        self._on_state_change = on_state_change
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._window = _Window(window, buckets, len(self._classes))
+        self._class_indices: Dict[type, Tuple[int, ...]] = {}
+        self._state: CircuitState = "closed"
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        self._rejection = SentinelErr(CircuitOpenError(f"{name} is open"))
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, "closed", "open" or "half_open"."""
+        with self._lock:
+            transitions = self._refresh(self._clock())
+            state = self._state
+        self._notify(transitions)
+        return state
+
+    @property
+    def rejection(self) -> SentinelErr[CircuitOpenError]:
+        """The Err returned while the circuit is open."""
+        return self._rejection
+
+    def failure_rates(self) -> Dict[str, float]:
+        """Returns the current failure rate of every exception class.
+
+        Returns:
+            Dict[str, float]: rate per class name, 0 without calls.
+        """
+        with self._lock:
+            total, failures = self._window.counts(self._clock())
+        return {
+            cls.__name__: (count / total if total else 0.0)
+            for cls, count in zip(self._classes, failures)
+        }
+
+    def reset(self) -> None:
+        """Closes the circuit and forgets the recorded calls."""
+        with self._lock:
+            transitions = self._move("closed")
+        self._notify(transitions)
+
+    def _move(self, state: CircuitState) -> List[Tuple[CircuitState, CircuitState]]:
+        # called with the lock held
+        previous = self._state
+        self._state = state
+        self._probes = self._probe_successes = 0
+        if state == "open":
+            self._opened_at = self._clock()
+        elif state == "closed":
+            self._window.clear()
+        return [(previous, state)] if previous != state else []
+
+    def _refresh(self, now: float) -> List[Tuple[CircuitState, CircuitState]]:
+        # called with the lock held
+        if self._state == "open" and now - self._opened_at >= self._open_for:
+            return self._move("half_open")
+        return []
+
+    def _notify(self, transitions: List[Tuple[CircuitState, CircuitState]]) -> None:
+        if self._on_state_change is not None:
+            for previous, state in transitions:
+                self._on_state_change(previous, state)
+
+    def _indices(self, err_type: type) -> Tuple[int, ...]:
+        try:
+            return self._class_indices[err_type]
+        except KeyError:
+            pass
+        indices = tuple(
+            index
+            for index, cls in enumerate(self._classes)
+            if issubclass(err_type, cls)
+        )
+        self._class_indices[err_type] = indices
+        return indices
+
+    def _acquire(self) -> Optional[bool]:
+        """Returns None if the call is rejected, else whether it is a probe."""
+        with self._lock:
+            transitions = self._refresh(self._clock())
+            state = self._state
+            if state == "closed":
+                allowed: Optional[bool] = False
+            elif state == "half_open" and self._probes < self._half_open_probes:
+                self._probes += 1
+                allowed = True
+            else:
+                allowed = None
+        self._notify(transitions)
+        return allowed
+
+    def _release(self, probe: bool, failure: Optional[type]) -> None:
+        indices = () if failure is None else self._indices(failure)
+        with self._lock:
+            if probe:
+                if self._state != "half_open":
+                    transitions = []
+                elif indices:
+                    transitions = self._move("open")
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self._half_open_probes:
+                        transitions = self._move("closed")
+                    else:
+                        transitions = []
+            else:
+                transitions = self._record(indices)
+        self._notify(transitions)
+
+    def _abandon(self, probe: bool) -> None:
+        if probe:
+            with self._lock:
+                if self._state == "half_open":
+                    self._probes -= 1
+
+    def _record(
+        self, indices: Tuple[int, ...]
+    ) -> List[Tuple[CircuitState, CircuitState]]:
+        # called with the lock held
+        now = self._clock()
+        self._window.record(now, indices)
+        if not indices or self._state != "closed":
+            return []
+        total, failures = self._window.counts(now)
+        if total < self._min_calls:
+            return []
+        for count, threshold in zip(failures, self._thresholds):
+            if count / total >= threshold:
+                return self._move("open")
+        return []
+
+    def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Calls func unless the circuit is open.
+
+        Exceptions raised by func are recorded like an Err of the same
+        class, then propagated.
+
+        Args:
+            func (Callable[..., Result]): function to call.
+
+        Returns:
+            Result: the result of func, or `rejection` if the circuit is open.
+        """
+        probe = self._acquire()
+        if probe is None:
+            return self._rejection
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self._release(probe, type(e))
+            raise
+        except BaseException:
+            # cancelled or interrupted, the call tells nothing on the dependency
+            self._abandon(probe)
+            raise
+        self._release(probe, type(result._err) if isinstance(result, Err) else None)
+        return result
+
+    async def acall(
+        self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Async counterpart of `call`.
+
+        Args:
+            func (Callable[..., Awaitable[Result]]): coroutine function.
+
+        Returns:
+            Result: the result of func, or `rejection` if the circuit is open.
+        """
+        probe = self._acquire()
+        if probe is None:
+            return self._rejection
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            self._release(probe, type(e))
+            raise
+        except BaseException:
+            # cancelled or interrupted, the call tells nothing on the dependency
+            self._abandon(probe)
+            raise
+        self._release(probe, type(result._err) if isinstance(result, Err) else None)
+        return result
+
+    def __call__(self, func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await self.acall(func, *args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return self.call(func, *args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker({self.name!r}, state={self._state!r})"
@@ -0,0 +1,116 @@
+import typing
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    List,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from ._shared import generate_wrapper
+from .result import Err, Ok
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import ParamSpec
+
+    P = ParamSpec("P")
+
+T = TypeVar("T")
+
+ExceptionTypes = Tuple[Type[BaseException], ...]
+
+
+def _wrap(
+    func: Callable[..., Any], exc_types: ExceptionTypes, strip_traceback: bool
+) -> Callable[..., Any]:
+    # The wrapper is generated with the same parameters as func. Together
+    # with the try block, free until something is raised, the success path
+    # costs little more than the bare call.
+    error = "_toradh_err.with_traceback(None)" if strip_traceback else "_toradh_err"
+
+    def body(call: str) -> List[str]:
+        return [
+            "try:",
+            f"    return _toradh_Ok({call})",
+            "except _toradh_exc_types as _toradh_err:",
+            f"    return _toradh_Err({error})",
+        ]
+
+    bindings = {"_toradh_exc_types": exc_types, "_toradh_Ok": Ok, "_toradh_Err": Err}
+    return generate_wrapper(func, "catch", body, bindings)
+
+
+class _Catcher(typing.Protocol):
+    """Decorator returned by `catch` called with exception types."""
+
+    @typing.overload
+    def __call__(  # type: ignore[overload-overlap]
+        self, func: "Callable[P, Coroutine[Any, Any, T]]", /
+    ) -> "Callable[P, Coroutine[Any, Any, Union[Ok[T], Err[Any]]]]": ...
+
+    @typing.overload
+    def __call__(
+        self, func: "Callable[P, T]", /
+    ) -> "Callable[P, Union[Ok[T], Err[Any]]]": ...
+
+
+# exception types come first: they are callables too, and would match the
+# overloads of the bare decorator
+@typing.overload
+def catch(  # type: ignore[overload-overlap]
+    *exc_types: Type[BaseException], strip_traceback: bool = False
+) -> _Catcher: ...
+
+
+@typing.overload
+def catch(  # type: ignore[overload-overlap]
+    func: "Callable[P, Coroutine[Any, Any, T]]", /
+) -> "Callable[P, Coroutine[Any, Any, Union[Ok[T], Err[Exception]]]]": ...
+
+
+@typing.overload
+def catch(func: "Callable[P, T]", /) -> "Callable[P, Union[Ok[T], Err[Exception]]]": ...
+
+
+def catch(*args: Any, strip_traceback: bool = False) -> Any:
+    """Decorator turning the given exceptions into `Err`, and the returned
+    value into `Ok`. Any other exception propagates unchanged. Works with
+    both regular and async functions.
+
+    Example:
+        >>> @catch(KeyError, ValueError)
+        >>> def parse(raw: dict) -> int:
+        >>>     return int(raw["id"])
+        >>>
+        >>> parse({"id": "1"})  # Ok(1)
+        >>> parse({})  # Err(KeyError('id'))
+
+        Used without arguments it captures any `Exception`:
+
+        >>> @catch
+        >>> def fetch() -> bytes: ...
+
+    Args:
+        *exc_types (Type[BaseException]): exceptions to capture, defaults to
+        `Exception`.
+        strip_traceback (bool): drop the traceback of the captured exception
+        so the Err does not keep the frames (and their locals) alive.
+
+    Returns:
+        Callable: the decorated function, returning Result.
+    """
+    if len(args) == 1 and not isinstance(args[0], type) and callable(args[0]):
+        return _wrap(args[0], (Exception,), strip_traceback)
+
+    for exc_type in args:
+        if not (isinstance(exc_type, type) and issubclass(exc_type, BaseException)):
+            raise TypeError(f"catch expects exception types, got {exc_type!r}")
+    exc_types: ExceptionTypes = tuple(args) or (Exception,)
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        return _wrap(func, exc_types, strip_traceback)
+
+    return decorator
@@ -0,0 +1,579 @@
+"""Wire formats for `Ok`/`Err`/`Some`/`Nothing`.
+
+Two formats are provided:
+
+- a compact tagged binary format, one self delimited frame per value, meant
+  for IPC and caches.
+- a JSON representation, including a streaming encoder/decoder for large
+  sequences of values (e.g. HTTP responses).
+
+Exceptions are never pickled. They travel as their registered type name,
+their `args` and, optionally, their cause. Tracebacks are dropped.
+Applications can plug their own exception types through an
+`ExceptionRegistry`.
+"""
+
+import builtins
+import json
+import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .option import Nothing, Some
+from .result import Err, Ok
+
+Encodable = Union[Ok[Any], Err[Any], Some[Any], Nothing]
+
+_OK = 0x01
+_ERR = 0x02
+_SOME = 0x03
+_NOTHING = 0x04
+_NO_CAUSE = 0x00
+_HAS_CAUSE = 0x01
+
+
+class CodecError(ValueError):
+    """Raised when a payload can not be encoded or decoded."""
+
+
+class RemoteError(Exception):
+    """Stand-in for an exception whose type is not known by the decoding side.
+
+    Attributes:
+        type_name (str): name the exception was encoded with.
+    """
+
+    def __init__(self, type_name: str, *args: Any) -> None:
+        super().__init__(*args)
+        self.type_name = type_name
+
+    def __repr__(self) -> str:
+        return f"RemoteError({self.type_name!r}, {', '.join(map(repr, self.args))})"
+
+
+class ExceptionRegistry:
+    """Maps exception types to the names used on the wire.
+
+    Builtin exceptions are always known by their plain name (`"ValueError"`).
+    Other types have to be registered, or they are decoded as `RemoteError`.
+
+    Example:
+        >>> registry = ExceptionRegistry()
+        >>> registry.register(CartNotFoundError)
+        >>> codec = Codec(registry=registry)
+    """
+
+    def __init__(self) -> None:
+        self._by_type: Dict[Type[BaseException], str] = {}
+        self._by_name: Dict[str, Type[BaseException]] = {}
+        self._encoders: Dict[
+            Type[BaseException], Callable[[BaseException], Tuple[Any, ...]]
+        ] = {}
+        self._decoders: Dict[str, Callable[[Tuple[Any, ...]], BaseException]] = {}
+
+    def register(
+        self,
+        exc_type: Type[BaseException],
+        name: Optional[str] = None,
+        encode: Optional[Callable[[BaseException], Tuple[Any, ...]]] = None,
+        decode: Optional[Callable[[Tuple[Any, ...]], BaseException]] = None,
+    ) -> None:
+        """Registers an exception type.
+
+        Args:
+            exc_type (Type[BaseException]): type to register.
+            name (Optional[str]): name on the wire, defaults to
+            "module.QualName".
+            encode (Optional[Callable]): returns the values to send for an
+            instance, defaults to its `args`.
+            decode (Optional[Callable]): builds an instance out of the decoded
+            values, defaults to `exc_type(*args)`.
+        """
+        name = name or f"{exc_type.__module__}.{exc_type.__qualname__}"
+        self._by_type[exc_type] = name
+        self._by_name[name] = exc_type
+        if encode is not None:
+            self._encoders[exc_type] = encode
+        if decode is not None:
+            self._decoders[name] = decode
+
+    def encode(self, exc: BaseException) -> Tuple[str, Tuple[Any, ...]]:
+        exc_type = type(exc)
+        name = self._by_type.get(exc_type)
+        if name is None:
+            if getattr(builtins, exc_type.__name__, None) is exc_type:
+                name = exc_type.__name__
+            elif isinstance(exc, RemoteError):
+                return exc.type_name, tuple(exc.args)
+            else:
+                name = f"{exc_type.__module__}.{exc_type.__qualname__}"
+        encoder = self._encoders.get(exc_type)
+        return name, tuple(encoder(exc) if encoder else exc.args)
+
+    def decode(self, name: str, args: Tuple[Any, ...]) -> BaseException:
+        decoder = self._decoders.get(name)
+        if decoder is not None:
+            return decoder(args)
+        exc_type: Optional[Type[BaseException]] = self._by_name.get(name)
+        if exc_type is None:
+            candidate = getattr(builtins, name, None)
+            if isinstance(candidate, type) and issubclass(candidate, BaseException):
+                exc_type = candidate
+        if exc_type is None:
+            return RemoteError(name, *args)
+        try:
+            return exc_type(*args)
+        except Exception:
+            # custom constructors, restore the args without calling __init__
+            exc = exc_type.__new__(exc_type)
+            exc.args = args
+            return exc
+
+
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def _json_dumps(value: Any) -> bytes:
+    return _JSON_ENCODER.encode(value).encode()
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _json_loads(data: bytes) -> Any:
+    return _JSON_DECODER.decode(data.decode())
+
+
+# what a JSON value cut at the end of a chunk may end with
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+_LITERALS = ("true", "false", "null", "NaN", "Infinity", "-Infinity")
+
+
+def _incomplete(error: json.JSONDecodeError) -> bool:
+    """Checks if a decoding error may go away once more text is appended,
+    the value being cut rather than invalid."""
+    rest = error.doc[error.pos :]
+    if error.msg.startswith("Unterminated string"):
+        return True
+    if error.msg.startswith("Invalid \\uXXXX escape"):
+        return '"' not in rest
+    return _NUMBER_TAIL.fullmatch(rest) is not None or any(
+        literal.startswith(rest) for literal in _LITERALS
+    )
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        try:
+            byte = data[pos]
+        except IndexError:
+            raise CodecError("truncated frame") from None
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+class Codec:
+    """Encodes and decodes `Ok`/`Err`/`Some`/`Nothing` values.
+
+    Wrapped values go through `value_dumps`/`value_loads`, JSON by default.
+    Any other serializer with the same signature (msgpack, pickle for
+    trusted peers...) can be plugged in.
+
+    Example:
+        >>> codec = Codec()
+        >>> codec.loads(codec.dumps(Err(KeyError("id"))))
+        Err(KeyError('id'))
+    """
+
+    def __init__(
+        self,
+        registry: Optional[ExceptionRegistry] = None,
+        value_dumps: Callable[[Any], bytes] = _json_dumps,
+        value_loads: Callable[[bytes], Any] = _json_loads,
+        include_cause: bool = True,
+        max_cause_depth: int = 3,
+    ) -> None:
+        """
+        Args:
+            registry (Optional[ExceptionRegistry]): known exception types.
+            value_dumps (Callable[[Any], bytes]): serializer for wrapped values.
+            value_loads (Callable[[bytes], Any]): deserializer for wrapped values.
+            include_cause (bool): also encode the `__cause__` (or `__context__`)
+            chain of exceptions.
+            max_cause_depth (int): maximum number of chained exceptions encoded.
+        """
+        self.registry = registry or ExceptionRegistry()
+        self._value_dumps = value_dumps
+        self._value_loads = value_loads
+        self._max_cause_depth = max_cause_depth if include_cause else 0
+
+    # binary format
+
+    def dumps(self, value: Encodable) -> bytes:
+        """Encodes a value as a binary frame.
+
+        Args:
+            value (Encodable): Ok, Err, Some or Nothing instance.
+
+        Raises:
+            CodecError: if the value, or the value it wraps, can not be
+            encoded.
+
+        Returns:
+            bytes: encoded frame.
+        """
+        out = bytearray()
+        self._write(out, value)
+        return bytes(out)
+
+    def dumps_many(self, values: Iterable[Encodable]) -> bytes:
+        """Encodes several values as consecutive frames.
+
+        Args:
+            values (Iterable[Encodable]): values to encode.
+
+        Raises:
+            CodecError: if a value, or a value it wraps, can not be encoded.
+
+        Returns:
+            bytes: every frame, one after the other.
+        """
+        out = bytearray()
+        for value in values:
+            self._write(out, value)
+        return bytes(out)
+
+    def loads(self, data: bytes) -> Encodable:
+        """Decodes a single binary frame.
+
+        Args:
+            data (bytes): encoded frame.
+
+        Raises:
+            CodecError: if the payload is not valid.
+
+        Returns:
+            Encodable: decoded value.
+        """
+        value, pos = self._read(data, 0)
+        if pos != len(data):
+            raise CodecError(f"{len(data) - pos} trailing bytes after frame")
+        return value
+
+    def iter_loads(self, data: bytes) -> Iterator[Encodable]:
+        """Lazily decodes consecutive frames.
+
+        Args:
+            data (bytes): frames as produced by `dumps_many`.
+
+        Raises:
+            CodecError: if a frame is not valid.
+
+        Yields:
+            Encodable: decoded values.
+        """
+        pos = 0
+        view = memoryview(data)
+        while pos < len(data):
+            value, pos = self._read(view, pos)
+            yield value
+
+    def _dump_value(self, value: Any) -> bytes:
+        try:
+            return self._value_dumps(value)
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(f"can not encode {type(value).__name__}: {e}") from e
+
+    def _load_value(self, data: bytes) -> Any:
+        try:
+            return self._value_loads(data)
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(f"invalid value payload: {e}") from e
+
+    def _write(self, out: bytearray, value: Encodable) -> None:
+        if isinstance(value, Ok):
+            out.append(_OK)
+            self._write_bytes(out, self._dump_value(value._value))
+        elif isinstance(value, Err):
+            out.append(_ERR)
+            self._write_exception(out, value._err, self._max_cause_depth)
+        elif isinstance(value, Nothing):
+            out.append(_NOTHING)
+        elif isinstance(value, Some):
+            out.append(_SOME)
+            self._write_bytes(out, self._dump_value(value._value))
+        else:
+            raise CodecError(f"can not encode {type(value).__name__}")
+
+    def _write_bytes(self, out: bytearray, data: bytes) -> None:
+        _write_varint(out, len(data))
+        out += data
+
+    def _write_exception(self, out: bytearray, exc: BaseException, depth: int) -> None:
+        name, args = self.registry.encode(exc)
+        self._write_bytes(out, name.encode())
+        self._write_bytes(out, self._dump_value(list(args)))
+        cause = exc.__cause__ or exc.__context__
+        if depth > 0 and cause is not None:
+            out.append(_HAS_CAUSE)
+            self._write_exception(out, cause, depth - 1)
+        else:
+            out.append(_NO_CAUSE)
+
+    def _read(self, data: Any, pos: int) -> Tuple[Encodable, int]:
+        try:
+            tag = data[pos]
+        except IndexError:
+            raise CodecError("empty frame") from None
+        pos += 1
+        if tag == _OK:
+            payload, pos = self._read_bytes(data, pos)
+            return Ok(self._load_value(payload)), pos
+        if tag == _ERR:
+            exc, pos = self._read_exception(data, pos)
+            return Err(exc), pos
+        if tag == _NOTHING:
+            return Nothing(), pos
+        if tag == _SOME:
+            payload, pos = self._read_bytes(data, pos)
+            return Some(self._load_value(payload)), pos
+        raise CodecError(f"unknown tag {tag:#x}")
+
+    def _read_bytes(self, data: Any, pos: int) -> Tuple[bytes, int]:
+        size, pos = _read_varint(data, pos)
+        end = pos + size
+        if end > len(data):
+            raise CodecError("truncated frame")
+        return bytes(data[pos:end]), end
+
+    def _read_exception(self, data: Any, pos: int) -> Tuple[BaseException, int]:
+        name, pos = self._read_bytes(data, pos)
+        args, pos = self._read_bytes(data, pos)
+        values = self._load_value(args)
+        if not isinstance(values, (list, tuple)):
+            raise CodecError(f"invalid error arguments {values!r}")
+        try:
+            type_name = name.decode()
+        except UnicodeDecodeError as e:
+            raise CodecError(f"invalid error type name: {e}") from e
+        exc = self.registry.decode(type_name, tuple(values))
+        if pos >= len(data):
+            raise CodecError("truncated frame")
+        has_cause = data[pos]
+        pos += 1
+        if has_cause == _HAS_CAUSE:
+            cause, pos = self._read_exception(data, pos)
+            exc.__cause__ = cause
+        return exc, pos
+
+    # JSON format
+
+    def to_json(self, value: Encodable) -> Dict[str, Any]:
+        """Returns the JSON compatible representation of a value.
+
+        - `Ok(v)` -> `{"ok": v}`
+        - `Err(e)` -> `{"err": {"type": "ValueError", "args": [...]}}`
+        - `Some(v)` -> `{"some": v}`
+        - `Nothing()` -> `{"nothing": null}`
+
+        Args:
+            value (Encodable): value to convert.
+
+        Returns:
+            Dict[str, Any]: JSON compatible dict.
+        """
+        if isinstance(value, Ok):
+            return {"ok": value._value}
+        if isinstance(value, Err):
+            return {"err": self._exception_to_json(value._err, self._max_cause_depth)}
+        if isinstance(value, Nothing):
+            return {"nothing": None}
+        if isinstance(value, Some):
+            return {"some": value._value}
+        raise CodecError(f"can not encode {type(value).__name__}")
+
+    def from_json(self, data: Dict[str, Any]) -> Encodable:
+        """Builds a value back from its JSON compatible representation.
+
+        Args:
+            data (Dict[str, Any]): as returned by `to_json`.
+
+        Raises:
+            CodecError: if the payload is not valid.
+
+        Returns:
+            Encodable: decoded value.
+        """
+        if not isinstance(data, dict) or len(data) != 1:
+            raise CodecError(f"invalid payload {data!r}")
+        ((key, payload),) = data.items()
+        if key == "ok":
+            return Ok(payload)
+        if key == "err":
+            return Err(self._exception_from_json(payload))
+        if key == "some":
+            return Some(payload)
+        if key == "nothing":
+            return Nothing()
+        raise CodecError(f"unknown key {key!r}")
+
+    def iterencode_json(self, values: Iterable[Encodable]) -> Iterator[str]:
+        """Lazily encodes values as a JSON array, one chunk per value.
+
+        Args:
+            values (Iterable[Encodable]): values to encode.
+
+        Raises:
+            CodecError: if a wrapped value is not JSON serializable.
+
+        Yields:
+            str: pieces of the JSON document.
+        """
+        encoder = _JSON_ENCODER
+        separator = "["
+        for value in values:
+            yield separator
+            try:
+                chunk = encoder.encode(self.to_json(value))
+            except (TypeError, ValueError) as e:
+                raise CodecError(f"can not encode {value!r}: {e}") from e
+            yield chunk
+            separator = ","
+        yield "[]" if separator == "[" else "]"
+
+    def iterdecode_json(self, chunks: Iterable[str]) -> Iterator[Encodable]:
+        """Lazily decodes a JSON array of values, as produced by
+        `iterencode_json`, out of arbitrary text chunks. Only the values which
+        are not complete yet are kept in memory. An invalid value is reported
+        as soon as it is read, without waiting for the rest of the document.
+
+        Args:
+            chunks (Iterable[str]): pieces of the JSON document.
+
+        Raises:
+            CodecError: if the document is not valid, or ends before the
+            closing bracket.
+
+        Yields:
+            Encodable: decoded values.
+        """
+        buffer = ""
+        pos = 0
+        # characters dropped from the front of the buffer, for the errors
+        dropped = 0
+        # chunks received since the last pass over the buffer
+        pending: List[str] = []
+        pending_size = 0
+        started = finished = False
+        values = 0
+        # a value must be followed by "," or the closing "]"
+        separated = True
+        remaining = iter(chunks)
+        last = False
+        while not last:
+            chunk = next(remaining, None)
+            if chunk is None:
+                last = True
+            else:
+                pending.append(chunk)
+                pending_size += len(chunk)
+                # an incomplete value is parsed again once as much text came
+                # as it holds, which keeps the copying and the parsing linear
+                if pending_size < len(buffer) - pos:
+                    continue
+            if pending:
+                buffer = buffer[pos:] + "".join(pending)
+                dropped += pos
+                pos = 0
+                pending.clear()
+                pending_size = 0
+            while True:
+                while pos < len(buffer) and buffer[pos].isspace():
+                    pos += 1
+                if pos == len(buffer):
+                    break
+                char = buffer[pos]
+                if finished:
+                    raise CodecError(f"unexpected {char!r} after the JSON array")
+                if not started:
+                    if char != "[":
+                        raise CodecError("expected a JSON array")
+                    started = True
+                    pos += 1
+                elif char == "]" and (not separated or not values):
+                    finished = True
+                    pos += 1
+                elif not separated:
+                    if char != ",":
+                        raise CodecError(f"expected ',' or ']', got {char!r}")
+                    separated = True
+                    pos += 1
+                else:
+                    try:
+                        item, end = _JSON_DECODER.raw_decode(buffer, pos)
+                    except json.JSONDecodeError as e:
+                        if not last and _incomplete(e):
+                            # wait for the next chunk
+                            break
+                        raise CodecError(
+                            f"invalid JSON array at character {dropped + e.pos}: {e.msg}"
+                        ) from None
+                    pos = end
+                    separated = False
+                    values += 1
+                    yield self.from_json(item)
+        if not finished:
+            raise CodecError("truncated JSON array")
+
+    def _exception_to_json(self, exc: BaseException, depth: int) -> Dict[str, Any]:
+        name, args = self.registry.encode(exc)
+        payload: Dict[str, Any] = {"type": name, "args": list(args)}
+        cause = exc.__cause__ or exc.__context__
+        if depth > 0 and cause is not None:
+            payload["cause"] = self._exception_to_json(cause, depth - 1)
+        return payload
+
+    def _exception_from_json(self, payload: Dict[str, Any]) -> BaseException:
+        try:
+            exc = self.registry.decode(payload["type"], tuple(payload.get("args", ())))
+        except (KeyError, TypeError):
+            raise CodecError(f"invalid error payload {payload!r}") from None
+        if "cause" in payload:
+            exc.__cause__ = self._exception_from_json(payload["cause"])
+        return exc
+
+
+default_codec = Codec()
+dumps = default_codec.dumps
+loads = default_codec.loads
+dumps_many = default_codec.dumps_many
+iter_loads = default_codec.iter_loads
+to_json = default_codec.to_json
+from_json = default_codec.from_json
+iterencode_json = default_codec.iterencode_json
+iterdecode_json = default_codec.iterdecode_json
@@ -0,0 +1,160 @@
+"""Type based dispatch, a table driven alternative to `match res.kind()`.
+
+A `match` statement tries its class patterns one after the other on every
+call, so its cost grows with the number of cases. A `Dispatcher` resolves
+each concrete type once, through its MRO, and caches the handler found:
+later values of the same type cost a single dict lookup. The cache keeps
+the most recently used types, up to `cache_size`, so classes created on
+the fly do not grow it forever.
+
+Example:
+    >>> handle = dispatch({
+    >>>     int: lambda value: value,
+    >>>     KeyError: lambda err: -1,
+    >>>     ValueError: lambda err: -2,
+    >>> })
+    >>> handle(res.kind())
+"""
+
+import collections
+from typing import Any, Callable, Dict, Generic, Mapping, Optional, Tuple, TypeVar
+
+R = TypeVar("R")
+
+Handler = Callable[[Any], R]
+
+
+class UnhandledTypeError(TypeError):
+    """Raised when a dispatcher has no handler for the type of a value."""
+
+    def __init__(self, value_type: type, handled: Tuple[type, ...]) -> None:
+        names = ", ".join(t.__qualname__ for t in handled)
+        super().__init__(
+            f"no handler for {value_type.__qualname__} "
+            f"(handled types: {names or 'none'})"
+        )
+        self.value_type = value_type
+
+
+class Dispatcher(Generic[R]):
+    """Calls the handler registered for the type of a value, see
+    `dispatch`."""
+
+    __slots__ = ("_handlers", "_default", "_cache", "_cache_size")
+
+    def __init__(
+        self,
+        handlers: Mapping[type, Handler[R]],
+        default: Optional[Handler[R]] = None,
+        cache_size: int = 256,
+    ) -> None:
+        if cache_size < 1:
+            raise ValueError(f"cache_size must be at least 1, got {cache_size}")
+        for key, handler in handlers.items():
+            if not isinstance(key, type):
+                raise TypeError(f"dispatch keys must be types, got {key!r}")
+            if not callable(handler):
+                raise TypeError(f"handler for {key.__qualname__} is not callable")
+        self._handlers: Dict[type, Handler[R]] = dict(handlers)
+        self._default = default
+        self._cache_size = cache_size
+        self._cache: "collections.OrderedDict[type, Handler[R]]" = (
+            collections.OrderedDict()
+        )
+
+    def _resolve(self, value_type: type) -> Handler[R]:
+        handlers = self._handlers
+        handler: Optional[Handler[R]] = None
+        for base in value_type.__mro__:
+            if base in handlers:
+                handler = handlers[base]
+                break
+        else:
+            # virtual subclasses, registered on ABCs, are not in the MRO:
+            # the first matching key in registration order wins
+            for key, candidate in handlers.items():
+                if issubclass(value_type, key):
+                    handler = candidate
+                    break
+        if handler is None:
+            handler = self._default or self._unhandled
+        cache = self._cache
+        cache[value_type] = handler
+        if len(cache) > self._cache_size:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                # emptied by other threads meanwhile
+                pass
+        return handler
+
+    def _unhandled(self, value: Any) -> R:
+        raise UnhandledTypeError(type(value), tuple(self._handlers))
+
+    def handler_for(self, value_type: type) -> Optional[Handler[R]]:
+        """Returns the handler used for values of the given type.
+
+        Args:
+            value_type (type): type to look up.
+
+        Returns:
+            Optional[Callable[[Any], R]]: the handler, None if unhandled.
+        """
+        try:
+            handler = self._cache[value_type]
+        except KeyError:
+            handler = self._resolve(value_type)
+        return None if handler == self._unhandled else handler
+
+    def __call__(self, value: Any) -> R:
+        value_type = type(value)
+        cache = self._cache
+        try:
+            handler = cache[value_type]
+            cache.move_to_end(value_type)
+        except KeyError:
+            # not cached yet, or evicted by another thread after the lookup
+            handler = self._resolve(value_type)
+        return handler(value)
+
+    def __repr__(self) -> str:
+        names = ", ".join(t.__qualname__ for t in self._handlers)
+        return f"Dispatcher({names})"
+
+
+def dispatch(
+    handlers: Mapping[type, Handler[R]],
+    *,
+    default: Optional[Handler[R]] = None,
+    cache_size: int = 256,
+) -> Dispatcher[R]:
+    """Builds a dispatcher calling the handler of the closest type, in MRO
+    order, of every value it receives.
+
+    Unlike the cases of a `match` statement, the order of the mapping does
+    not matter: a ValueError goes to the ValueError handler even if an
+    Exception handler is also given. The one exception are virtual
+    subclasses (`ABC.register`), which are not in the MRO: types matching
+    none of the keys through their MRO go to the first key, in the order of
+    the mapping, they are a subclass of.
+
+    Example:
+        >>> handle = dispatch({int: str, Exception: repr}, default=lambda v: "?")
+        >>> handle(Ok(1).kind())  # "1"
+        >>> handle(Err(KeyError("k")).kind())  # "KeyError('k')"
+
+    Args:
+        handlers (Mapping[type, Callable[[Any], R]]): handler per type.
+        default (Optional[Callable[[Any], R]]): handler for the types not
+        covered, by default they raise `UnhandledTypeError`.
+        cache_size (int): resolved types kept, the least recently used ones
+        are resolved again once dropped.
+
+    Raises:
+        TypeError: if a key is not a type or a handler is not callable.
+        ValueError: if cache_size is lower than 1.
+
+    Returns:
+        Dispatcher[R]: callable taking the value to dispatch.
+    """
+    return Dispatcher(handlers, default, cache_size)
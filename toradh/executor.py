@@ -0,0 +1,209 @@
+"""Thread and process pools returning `Result` values instead of raising."""
+
+import concurrent.futures
+import itertools
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .result import Err, Ok
+
+AnyResult = Union[Ok[Any], Err[Any]]
+Catch = Tuple[Type[BaseException], ...]
+
+
+def _call(
+    fn: Callable[..., Any], args: Tuple[Any, ...], kwargs: Any, catch: Catch
+) -> AnyResult:
+    # runs on the worker side, so exceptions travel back as plain values.
+    try:
+        value = fn(*args, **kwargs)
+    except catch as e:
+        return Err(e)
+    if isinstance(value, (Ok, Err)):
+        return value
+    return Ok(value)
+
+
+def _call_chunk(
+    fn: Callable[..., Any], chunk: List[Tuple[Any, ...]], catch: Catch
+) -> List[AnyResult]:
+    return [_call(fn, args, {}, catch) for args in chunk]
+
+
+def _chunks(
+    iterable: Iterable[Tuple[Any, ...]], size: int
+) -> Iterator[List[Tuple[Any, ...]]]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class ResultExecutor:
+    """Wraps a `concurrent.futures.Executor` so every call results in an
+    `Ok` or an `Err` instead of raising.
+
+    Exceptions are captured where the function runs, which means they cross
+    process boundaries as regular return values. Exceptions which are not
+    part of `catch` still propagate from `Future.result()`.
+
+    Example:
+        >>> with ResultExecutor.processes(max_workers=4) as pool:
+        >>>     for res in pool.map(validate, rows, chunksize=256):
+        >>>         if res.is_error():
+        >>>             ...
+    """
+
+    def __init__(
+        self,
+        executor: concurrent.futures.Executor,
+        catch: Catch = (Exception,),
+    ) -> None:
+        """Creates a ResultExecutor on top of an existing executor.
+
+        Args:
+            executor (concurrent.futures.Executor): pool running the calls.
+            catch (Tuple[Type[BaseException], ...]): exceptions turned into Err.
+        """
+        self._executor = executor
+        self._catch = catch
+
+    @classmethod
+    def threads(
+        cls, max_workers: Optional[int] = None, catch: Catch = (Exception,)
+    ) -> "ResultExecutor":
+        """Creates a ResultExecutor backed by a thread pool.
+
+        Args:
+            max_workers (Optional[int]): number of threads.
+            catch (Tuple[Type[BaseException], ...]): exceptions turned into Err.
+
+        Returns:
+            ResultExecutor:
+        """
+        return cls(concurrent.futures.ThreadPoolExecutor(max_workers), catch)
+
+    @classmethod
+    def processes(
+        cls, max_workers: Optional[int] = None, catch: Catch = (Exception,)
+    ) -> "ResultExecutor":
+        """Creates a ResultExecutor backed by a process pool. Functions,
+        arguments and results must be picklable.
+
+        Args:
+            max_workers (Optional[int]): number of processes.
+            catch (Tuple[Type[BaseException], ...]): exceptions turned into Err.
+
+        Returns:
+            ResultExecutor:
+        """
+        return cls(concurrent.futures.ProcessPoolExecutor(max_workers), catch)
+
+    def submit(
+        self, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> "concurrent.futures.Future[AnyResult]":
+        """Schedules fn(*args, **kwargs).
+
+        Args:
+            fn (Callable[..., Any]): function to run.
+
+        Returns:
+            Future[Result]: future resolving to Ok(value) or Err(exception).
+        """
+        inner = self._executor.submit(_call, fn, args, kwargs, self._catch)
+        outer: "concurrent.futures.Future[AnyResult]" = concurrent.futures.Future()
+        outer.set_running_or_notify_cancel()
+        inner.add_done_callback(lambda done: self._transfer(done, outer))
+        return outer
+
+    def map(
+        self,
+        fn: Callable[..., Any],
+        *iterables: Iterable[Any],
+        chunksize: int = 1,
+        ordered: bool = True,
+    ) -> Iterator[AnyResult]:
+        """Applies fn to every set of arguments taken from the iterables.
+
+        The calls are grouped in chunks of `chunksize` items, each chunk being
+        a single round trip to the workers. Large chunks considerably reduce
+        the overhead of process pools.
+
+        Args:
+            fn (Callable[..., Any]): function to run.
+            chunksize (int): number of calls sent to a worker at once.
+            ordered (bool): yield results in submission order if True, else
+            as soon as each chunk is done.
+
+        Returns:
+            Iterator[Result]: one result per call.
+        """
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+        futures = [
+            (
+                self._executor.submit(_call_chunk, fn, chunk, self._catch),
+                len(chunk),
+            )
+            for chunk in _chunks(zip(*iterables), chunksize)
+        ]
+        return self._results(futures, ordered)
+
+    def _results(
+        self,
+        futures: List[Tuple["concurrent.futures.Future[List[AnyResult]]", int]],
+        ordered: bool,
+    ) -> Iterator[AnyResult]:
+        sizes = dict(futures)
+        pending = (
+            (future for future, _ in futures)
+            if ordered
+            else concurrent.futures.as_completed(sizes)
+        )
+        try:
+            for future in pending:
+                try:
+                    results = future.result()
+                except self._catch as e:
+                    # the chunk never made it back (broken pool, pickling...)
+                    results = [Err(e)] * sizes[future]
+                yield from results
+        finally:
+            for future in sizes:
+                future.cancel()
+
+    def _transfer(
+        self,
+        inner: "concurrent.futures.Future[AnyResult]",
+        outer: "concurrent.futures.Future[AnyResult]",
+    ) -> None:
+        try:
+            outer.set_result(inner.result())
+        except self._catch as e:
+            outer.set_result(Err(e))
+        except BaseException as e:
+            outer.set_exception(e)
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """Releases the workers, see `concurrent.futures.Executor.shutdown`."""
+        if cancel_futures:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+        else:
+            self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "ResultExecutor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown(wait=True)
@@ -0,0 +1,244 @@
+"""Process wide counters on how `Err` and `Nothing` are used.
+
+Once enabled the following are counted:
+
+- `err_created`: Err instances created, by exception type.
+- `err_unwrapped`: `Err.unwrap()` calls (which raise), by exception type.
+- `nothing_unwrapped`: `Nothing.unwrap()` calls (which raise).
+- `unwrap_or_fallback`: `unwrap_or`/`unwrap_or_else` calls returning the
+  fallback, by the type holding no value ("Err" or "Nothing").
+
+Counting is installed on the classes when enabled and removed when
+disabled, so a disabled registry adds nothing to the hot paths. Each
+thread increments its own counters, without locks or contention, and
+`snapshot` adds them up.
+
+Example:
+    >>> from toradh import instrumentation
+    >>> instrumentation.enable()
+    >>> ...
+    >>> instrumentation.snapshot()["err_created"]
+    {'ValueError': 12, 'KeyError': 3}
+    >>> print(instrumentation.to_prometheus())
+"""
+
+import collections
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+
+from . import _hooks
+from ._hooks import Factory
+from ._shared import PerThread, label
+from .option import Nothing
+from .result import Err
+
+Counts = Dict[Tuple[str, Any], int]
+
+ERR_CREATED = "err_created"
+ERR_UNWRAPPED = "err_unwrapped"
+NOTHING_UNWRAPPED = "nothing_unwrapped"
+UNWRAP_OR_FALLBACK = "unwrap_or_fallback"
+
+_METRICS = {
+    ERR_CREATED: ("Err instances created.", "exception"),
+    ERR_UNWRAPPED: ("Err.unwrap() calls, each one raising.", "exception"),
+    NOTHING_UNWRAPPED: ("Nothing.unwrap() calls, each one raising.", ""),
+    UNWRAP_OR_FALLBACK: ("unwrap_or/unwrap_or_else calls using the fallback.", "type"),
+}
+
+# drawn after the lightweight mode and the type check policy
+_ORDER = 10
+_LAYER = "instrumentation"
+
+
+def _new() -> Counts:
+    return collections.defaultdict(int)
+
+
+def _copy(counts: Counts) -> Counts:
+    # copying a dict is atomic, iterating over it is not
+    return collections.defaultdict(int, counts)
+
+
+def _add(into: Counts, counts: Counts) -> None:
+    for key, value in counts.items():
+        into[key] += value
+
+
+def _subtract(into: Counts, counts: Counts) -> None:
+    for key, value in counts.items():
+        into[key] -= value
+
+
+_lock = threading.Lock()
+_enabled = False
+_installed: List[Tuple[type, str]] = []
+_counts = PerThread(_new, _copy, _add, _subtract)
+_local = _counts.local
+_register = _counts.register
+
+
+def _fallback(key: Tuple[str, Any], name: str) -> Factory:
+    # same parameter names as the wrapped method, for keyword calls
+    def unwrap_or(inner: Callable[..., Any]) -> Callable[..., Any]:
+        def counted(self: Any, default: Any) -> Any:
+            try:
+                counts = _local.state
+            except AttributeError:
+                counts = _register()
+            counts[key] += 1
+            return inner(self, default)
+
+        return counted
+
+    def unwrap_or_else(inner: Callable[..., Any]) -> Callable[..., Any]:
+        def counted(self: Any, op: Any) -> Any:
+            try:
+                counts = _local.state
+            except AttributeError:
+                counts = _register()
+            counts[key] += 1
+            return inner(self, op)
+
+        return counted
+
+    return unwrap_or if name == "unwrap_or" else unwrap_or_else
+
+
+def _nothing_unwrapped(inner: Callable[..., Any]) -> Callable[..., Any]:
+    key = (NOTHING_UNWRAPPED, "")
+
+    def unwrap(self: Any) -> Any:
+        try:
+            counts = _local.state
+        except AttributeError:
+            counts = _register()
+        counts[key] += 1
+        return inner(self)
+
+    return unwrap
+
+
+def _err_unwrapped(inner: Callable[..., Any]) -> Callable[..., Any]:
+    def unwrap(self: Err[Any]) -> Any:
+        try:
+            counts = _local.state
+        except AttributeError:
+            counts = _register()
+        counts[ERR_UNWRAPPED, type(self._err)] += 1
+        return inner(self)
+
+    return unwrap
+
+
+def _err_created(inner: Callable[..., Any]) -> Callable[..., Any]:
+    def __init__(self: Err[Any], err: BaseException) -> None:
+        inner(self, err)
+        try:
+            counts = _local.state
+        except AttributeError:
+            counts = _register()
+        counts[ERR_CREATED, type(err)] += 1
+
+    return __init__
+
+
+def _subclasses(cls: type) -> List[type]:
+    found = [cls]
+    sub: type
+    for sub in cls.__subclasses__():
+        found.extend(_subclasses(sub))
+    return found
+
+
+def enable() -> None:
+    """Starts counting. The counters keep their values from previous runs,
+    see `reset`."""
+    global _enabled
+    with _lock:
+        if _enabled:
+            return
+        nothing_fallback = (UNWRAP_OR_FALLBACK, "Nothing")
+        err_fallback = (UNWRAP_OR_FALLBACK, "Err")
+        layers: List[Tuple[type, str, Factory]] = [
+            (Err, "__init__", _err_created),
+            (Nothing, "unwrap", _nothing_unwrapped),
+            (Nothing, "unwrap_or", _fallback(nothing_fallback, "unwrap_or")),
+            (Err, "unwrap_or", _fallback(err_fallback, "unwrap_or")),
+            (Err, "unwrap_or_else", _fallback(err_fallback, "unwrap_or_else")),
+        ]
+        # subclasses overriding unwrap, such as toradh.lightweight.SentinelErr
+        for cls in _subclasses(Err):
+            if "unwrap" in cls.__dict__:
+                layers.append((cls, "unwrap", _err_unwrapped))
+        for owner, name, factory in layers:
+            _hooks.add_layer(owner, name, _LAYER, factory, order=_ORDER)
+            _installed.append((owner, name))
+        _enabled = True
+
+
+def disable() -> None:
+    """Stops counting, removing every hook. The counters keep their values."""
+    global _enabled
+    with _lock:
+        for owner, name in _installed:
+            _hooks.remove_layer(owner, name, _LAYER)
+        _installed.clear()
+        _enabled = False
+
+
+def is_enabled() -> bool:
+    """Checks if the counters are being updated.
+
+    Returns:
+        bool: True if enabled, else False.
+    """
+    return _enabled
+
+
+def snapshot() -> Dict[str, Dict[str, int]]:
+    """Returns the current value of every counter, added up across threads.
+
+    Returns:
+        Dict[str, Dict[str, int]]: counts per metric and label. Metrics
+        without a label (`nothing_unwrapped`) use the empty string.
+    """
+    result: Dict[str, Dict[str, int]] = {metric: {} for metric in _METRICS}
+    for (metric, value_label), value in _counts.totals().items():
+        if value:
+            labels = result[metric]
+            name = label(value_label)
+            labels[name] = labels.get(name, 0) + value
+    return result
+
+
+def reset() -> None:
+    """Sets every counter back to zero."""
+    _counts.reset()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def to_prometheus(prefix: str = "toradh") -> str:
+    """Formats the counters in the Prometheus text exposition format.
+
+    Args:
+        prefix (str): prepended to every metric name.
+
+    Returns:
+        str: one HELP/TYPE header and its samples per metric.
+    """
+    lines: List[str] = []
+    for metric, labels in snapshot().items():
+        description, label_name = _METRICS[metric]
+        name = f"{prefix}_{metric}_total"
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} counter")
+        if not label_name:
+            lines.append(f"{name} {labels.get('', 0)}")
+            continue
+        for text, value in sorted(labels.items()):
+            lines.append(f'{name}{{{label_name}="{_escape(text)}"}} {value}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,236 @@
+"""Lazy adapters over iterables of `Result` and `Option` values.
+
+Every adapter pulls from its input one item at a time, so they can be
+chained over unbounded streams (generators, file readers, cursors) with
+constant memory use. Only `collect`/`collect_all` build a list, the one
+holding their output.
+
+Example:
+    >>> rows = (parse(line) for line in open("data.csv"))
+    >>> for batch in chunked(filter_ok(rows), 1000):
+    >>>     store(batch)
+"""
+
+import collections
+import itertools
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from ._compat import error_group
+from .option import Some, Optional
+from .result import Err, Ok
+
+T = TypeVar("T")
+A = TypeVar("A")
+E = TypeVar("E", bound=BaseException)
+
+Results = Iterable[Union[Ok[T], Err[E]]]
+
+_END: Any = object()
+
+
+def filter_ok(results: Results[T, E]) -> Iterator[T]:
+    """Yields the values of the Ok items, skipping the Err ones.
+
+    Args:
+        results (Iterable[Result[T, E]]): input stream.
+
+    Yields:
+        T: unwrapped Ok values.
+    """
+    for result in results:
+        if isinstance(result, Ok):
+            yield result._value
+
+
+def filter_err(results: Results[T, E]) -> Iterator[E]:
+    """Yields the errors of the Err items, skipping the Ok ones.
+
+    Args:
+        results (Iterable[Result[T, E]]): input stream.
+
+    Yields:
+        E: wrapped errors.
+    """
+    for result in results:
+        if isinstance(result, Err):
+            yield result._err
+
+
+def filter_some(options: Iterable[Optional[T]]) -> Iterator[T]:
+    """Yields the values of the Some items, skipping Nothing.
+
+    Args:
+        options (Iterable[Optional[T]]): input stream.
+
+    Yields:
+        T: unwrapped values.
+    """
+    for option in options:
+        if isinstance(option, Some):
+            yield option._value  # type: ignore[misc]
+
+
+def partition(results: Results[T, E]) -> Tuple[Iterator[T], Iterator[E]]:
+    """Splits the stream into its Ok values and its errors, both lazily.
+
+    Each side pulls from the shared input on demand. Items meant for the
+    other side are buffered until it reads them, so memory stays bounded as
+    long as both sides are consumed at a similar pace, as with
+    `itertools.tee`. The two iterators must not be used from different
+    threads at the same time.
+
+    Example:
+        >>> values, errors = partition(parse(line) for line in lines)
+        >>> for value, error in zip(values, errors):
+        >>>     ...
+
+    Args:
+        results (Iterable[Result[T, E]]): input stream.
+
+    Returns:
+        Tuple[Iterator[T], Iterator[E]]: the Ok values and the errors.
+    """
+    source = iter(results)
+    values: Deque[Any] = collections.deque()
+    errors: Deque[Any] = collections.deque()
+
+    def side(own: Deque[Any], other: Deque[Any], wants_ok: bool) -> Iterator[Any]:
+        while True:
+            if own:
+                yield own.popleft()
+                continue
+            result = next(source, _END)
+            if result is _END:
+                return
+            if isinstance(result, Ok):
+                if wants_ok:
+                    yield result._value
+                else:
+                    other.append(result._value)
+            elif wants_ok:
+                other.append(result._err)
+            else:
+                yield result._err
+
+    return side(values, errors, True), side(errors, values, False)
+
+
+def collect(results: Results[T, E]) -> Union[Ok[List[T]], Err[E]]:
+    """Gathers the Ok values into a list, stopping at the first Err. The
+    rest of the input is left unconsumed.
+
+    Example:
+        >>> collect([Ok(1), Ok(2)])  # Ok([1, 2])
+        >>> collect([Ok(1), Err(ValueError()), Ok(3)])  # Err(ValueError())
+
+    Args:
+        results (Iterable[Result[T, E]]): input stream.
+
+    Returns:
+        Result[List[T], E]: every value, or the first Err found.
+    """
+    values: List[T] = []
+    append = values.append
+    for result in results:
+        if isinstance(result, Ok):
+            append(result._value)
+        else:
+            return result
+    return Ok(values)
+
+
+sequence = collect
+
+
+def collect_all(results: Results[T, E]) -> Union[Ok[List[T]], Err[BaseException]]:
+    """Gathers the Ok values into a list, or every error if any failed.
+    Once the first Err is found the values are no longer kept.
+
+    Example:
+        >>> collect_all([Ok(1), Err(KeyError()), Err(ValueError())])
+        >>> # Err(ExceptionGroup("2 of 3 results failed", [KeyError(), ValueError()]))
+
+    Args:
+        results (Iterable[Result[T, E]]): input stream.
+
+    Returns:
+        Result[List[T], BaseException]: every value, or an `ExceptionGroup`
+        (`toradh._compat.ErrorGroup` before Python 3.11) holding every error.
+    """
+    values: List[T] = []
+    errors: List[BaseException] = []
+    total = 0
+    for total, result in enumerate(results, 1):
+        if isinstance(result, Ok):
+            if not errors:
+                values.append(result._value)
+        else:
+            if not errors:
+                values.clear()
+            errors.append(result._err)
+    if errors:
+        return Err(error_group(f"{len(errors)} of {total} results failed", errors))
+    return Ok(values)
+
+
+def try_fold(
+    results: Results[T, E], initial: A, op: Callable[[A, T], A]
+) -> Union[Ok[A], Err[E]]:
+    """Folds the Ok values into an accumulator, stopping at the first Err.
+
+    Example:
+        >>> try_fold(amounts, 0, lambda total, amount: total + amount)
+
+    Args:
+        results (Iterable[Result[T, E]]): input stream.
+        initial (A): starting value of the accumulator.
+        op (Callable[[A, T], A]): combines the accumulator with a value.
+
+    Returns:
+        Result[A, E]: the final accumulator, or the first Err found.
+    """
+    acc = initial
+    for result in results:
+        if isinstance(result, Ok):
+            acc = op(acc, result._value)
+        else:
+            return result
+    return Ok(acc)
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Groups the stream into lists of `size` items, the last one may be
+    shorter.
+
+    Args:
+        items (Iterable[T]): input stream.
+        size (int): items per chunk.
+
+    Raises:
+        ValueError: if size is lower than 1.
+
+    Yields:
+        List[T]: consecutive chunks.
+    """
+    if size < 1:
+        raise ValueError(f"size must be at least 1, got {size}")
+    return _chunks(iter(items), size)
+
+
+def _chunks(source: Iterator[T], size: int) -> Iterator[List[T]]:
+    islice = itertools.islice
+    while True:
+        chunk = list(islice(source, size))
+        if not chunk:
+            return
+        yield chunk
@@ -0,0 +1,261 @@
+"""Opt-in lightweight mode for `Err`.
+
+By default an `Err` keeps its exception exactly as given, traceback
+included, and `Err.unwrap()` raises that same instance, which extends its
+traceback every time. In long lived caches of failures this keeps whole
+frame chains, and their locals, alive.
+
+Once enabled:
+
+- exceptions stored by new `Err` instances lose their traceback, or keep
+  only the innermost `traceback_limit` entries, with the locals of the
+  finished frames cleared.
+- `Err.unwrap()` raises a copy of the stored exception, so the stored one
+  never grows a traceback again.
+- a `site_sample_rate` fraction of the new `Err` instances record the file
+  and line they were created at, see `creation_site`.
+
+`sentinel` gives preallocated, shared `Err` instances for hot failure paths
+and can be used whether the mode is enabled or not.
+"""
+
+import copy
+import inspect
+import os
+import sys
+import threading
+import typing
+from types import FrameType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    NoReturn,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from . import _hooks
+from ._shared import thread_random
+from .result import Err
+
+E = TypeVar("E", bound=BaseException)
+
+Site = Tuple[str, int]
+
+_LAYER = "lightweight"
+_SITE_ATTR = "_toradh_site"
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_SUSPENDABLE = inspect.CO_GENERATOR | inspect.CO_COROUTINE | inspect.CO_ASYNC_GENERATOR
+
+_lock = threading.Lock()
+_enabled = False
+_sentinels: Dict[Tuple[type, Hashable], "SentinelErr[Any]"] = {}
+
+
+def _strip(exc: BaseException, limit: int) -> None:
+    # the exception itself and every one it chains to
+    seen: Optional[Set[int]] = None
+    while True:
+        tb = exc.__traceback__
+        if tb is not None:
+            if limit <= 0:
+                exc.__traceback__ = None
+            else:
+                entries = []
+                while tb is not None:
+                    entries.append(tb)
+                    tb = tb.tb_next
+                # the kept frames still reach the outer ones through f_back,
+                # so the locals of every finished frame are released
+                for entry in entries:
+                    # clearing a suspended generator frame would close it
+                    if entry.tb_frame.f_code.co_flags & _SUSPENDABLE:
+                        continue
+                    try:
+                        entry.tb_frame.clear()
+                    except RuntimeError:
+                        # the frame is still running
+                        pass
+                # keep the innermost entries, where the error was raised
+                exc.__traceback__ = entries[-limit:][0]
+        chained = exc.__cause__ or exc.__context__
+        if chained is None:
+            return
+        # raising never chains in a cycle, but __cause__/__context__ can be
+        # set by hand; only tracked past the first link, the common case
+        if seen is None:
+            seen = {id(exc)}
+        if id(chained) in seen:
+            return
+        seen.add(id(chained))
+        exc = chained
+
+
+def _fresh(exc: BaseException) -> BaseException:
+    """Returns a copy of exc to be raised, keeping the original untouched."""
+    try:
+        clone = copy.copy(exc)
+    except Exception:
+        clone = None
+    if type(clone) is not type(exc) or clone is exc:
+        # the type can not be rebuilt out of its args
+        return exc.with_traceback(None)
+    clone.__cause__ = exc.__cause__
+    clone.__context__ = exc.__context__
+    clone.__suppress_context__ = exc.__suppress_context__
+    return clone
+
+
+def _caller_site() -> Optional[Site]:
+    frame: Optional[FrameType] = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not filename.startswith((_PACKAGE_DIR, "<toradh")):
+            return filename, frame.f_lineno
+        frame = frame.f_back
+    return None
+
+
+def _init_layer(
+    traceback_limit: int, site_sample_rate: float
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def factory(inner: Callable[..., Any]) -> Callable[..., Any]:
+        if site_sample_rate <= 0:
+
+            def __init__(self: Err[Any], err: BaseException) -> None:
+                inner(self, err)
+                if err.__traceback__ is not None:
+                    _strip(err, traceback_limit)
+
+            return __init__
+
+        def sampled_init(self: Err[Any], err: BaseException) -> None:
+            inner(self, err)
+            if err.__traceback__ is not None:
+                _strip(err, traceback_limit)
+            if thread_random.draw() < site_sample_rate:
+                site = _caller_site()
+                if site is not None:
+                    # stored on the exception so it goes away along with it
+                    try:
+                        setattr(err, _SITE_ATTR, site)
+                    except AttributeError:
+                        pass
+
+        return sampled_init
+
+    return factory
+
+
+def _unwrap_layer(inner: Callable[..., Any]) -> Callable[..., Any]:
+    def unwrap(self: Err[Any]) -> NoReturn:
+        raise _fresh(self._err)
+
+    return unwrap
+
+
+def enable(traceback_limit: int = 0, site_sample_rate: float = 0.0) -> None:
+    """Turns the lightweight mode on, or updates its settings.
+
+    Only Err instances created afterwards are affected.
+
+    Example:
+        >>> enable(traceback_limit=1, site_sample_rate=0.01)
+
+    Args:
+        traceback_limit (int): traceback entries kept per exception, 0 drops
+        the traceback entirely.
+        site_sample_rate (float): fraction of Err instances recording where
+        they were created.
+
+    Raises:
+        ValueError: if the arguments are out of range.
+    """
+    global _enabled
+    if traceback_limit < 0:
+        raise ValueError(f"traceback_limit must be positive, got {traceback_limit}")
+    if not 0.0 <= site_sample_rate <= 1.0:
+        raise ValueError(
+            f"site_sample_rate must be between 0 and 1, got {site_sample_rate}"
+        )
+    with _lock:
+        _hooks.add_layer(
+            Err, "__init__", _LAYER, _init_layer(traceback_limit, site_sample_rate)
+        )
+        _hooks.add_layer(Err, "unwrap", _LAYER, _unwrap_layer)
+        _enabled = True
+
+
+def disable() -> None:
+    """Turns the lightweight mode off. Already created Err instances keep
+    their stripped tracebacks."""
+    global _enabled
+    with _lock:
+        _hooks.remove_layer(Err, "__init__", _LAYER)
+        _hooks.remove_layer(Err, "unwrap", _LAYER)
+        _enabled = False
+
+
+def is_enabled() -> bool:
+    """Checks if the lightweight mode is on.
+
+    Returns:
+        bool: True if enabled, else False.
+    """
+    return _enabled
+
+
+def creation_site(err: Err[Any]) -> Optional[Site]:
+    """Returns where the given Err was created, if it was sampled.
+
+    Args:
+        err (Err): instance to look up.
+
+    Returns:
+        Optional[Tuple[str, int]]: file name and line number, or None.
+    """
+    return getattr(err._err, _SITE_ATTR, None)
+
+
+class SentinelErr(Err[E]):
+    """Preallocated Err shared between every failure of the same kind.
+
+    Its exception is never raised itself, `unwrap()` always raises a fresh
+    copy, so the shared instance never collects a traceback.
+    """
+
+    __slots__ = ()
+
+    def unwrap(self) -> NoReturn:
+        raise _fresh(self._err)
+
+
+def sentinel(exc: E) -> SentinelErr[E]:
+    """Returns the shared Err for an exception type and its args, creating
+    it on first use.
+
+    Example:
+        >>> NOT_FOUND = sentinel(KeyError("user not found"))
+        >>> def get(user_id: int) -> Result[User, KeyError]:
+        >>>     user = CACHE.get(user_id)
+        >>>     return Ok(user) if user is not None else NOT_FOUND
+
+    Args:
+        exc (E): exception describing the failure, its args must be hashable.
+
+    Returns:
+        SentinelErr[E]: shared instance.
+    """
+    key = (type(exc), exc.args)
+    instance = _sentinels.get(key)
+    if instance is None:
+        with _lock:
+            instance = _sentinels.get(key)
+            if instance is None:
+                instance = SentinelErr(exc.with_traceback(None))
+                _sentinels[key] = instance
+    return typing.cast(SentinelErr[E], instance)
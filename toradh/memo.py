@@ -0,0 +1,407 @@
+"""Memoization for functions returning `Result`.
+
+Unlike `functools.lru_cache`, Ok and Err results follow their own caching
+policy: Ok values are kept for `ttl` seconds while each exception type gets
+its own time to live through `err_ttl`, or is not cached at all. Concurrent
+calls with the same arguments share a single call to the wrapped function.
+
+Example:
+    >>> @memoize(maxsize=10_000, ttl=60, err_ttl={KeyError: 5})
+    >>> def find_user(user_id: int) -> Result[User, Exception]:
+    >>>     ...
+    >>>
+    >>> find_user(1)
+    >>> find_user.stats()  # CacheStats(hits=0, misses=1, ...)
+    >>> find_user.invalidate(1)
+"""
+
+import asyncio
+import collections
+import functools
+import inspect
+import sys
+import threading
+import time
+import types
+import typing
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from ._shared import PerThread
+from .result import Err
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import ParamSpec
+
+    P = ParamSpec("P")
+else:
+    # only type checkers read the parameters, a TypeVar keeps the protocol
+    # generic at runtime without importing typing_extensions
+    P = TypeVar("P")
+R = TypeVar("R")
+R_co = TypeVar("R_co", covariant=True)
+
+# separates positional from keyword arguments in the cache keys
+_KWARGS_MARK = object()
+_NOT_CACHED = 0.0
+_FAILED: Any = object()
+# under the GIL the C methods of OrderedDict run atomically, free-threaded
+# builds need the lock for every access
+_GIL = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+class CacheStats(NamedTuple):
+    """Counters of a memoized function.
+
+    Attributes:
+        hits (int): calls answered from the cache.
+        misses (int): calls reaching the wrapped function.
+        evictions (int): entries dropped to stay within maxsize.
+        expirations (int): entries dropped because their ttl ran out.
+        size (int): entries currently cached, expired ones are dropped
+        before counting.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+
+
+class MemoizedFunction(typing.Protocol[P, R_co]):
+    """Function returned by `memoize`, with the same parameters and return
+    type as the wrapped one, and methods to manage its cache."""
+
+    __name__: str
+    __qualname__: str
+    __wrapped__: Callable[..., Any]
+
+    def __call__(self, *args: "P.args", **kwargs: "P.kwargs") -> R_co: ...
+
+    @typing.overload
+    def __get__(
+        self, instance: None, owner: Optional[type] = None
+    ) -> "MemoizedFunction[P, R_co]": ...
+
+    @typing.overload
+    def __get__(
+        self, instance: object, owner: Optional[type] = None
+    ) -> Callable[..., R_co]: ...
+
+    def stats(self) -> CacheStats: ...
+
+    def invalidate(self, *args: Any, **kwargs: Any) -> bool: ...
+
+    def invalidate_if(self, predicate: Callable[[Any], bool]) -> int: ...
+
+    def clear(self) -> None: ...
+
+
+class _Entry:
+    __slots__ = ("result", "expires_at")
+
+    def __init__(self, result: Any, expires_at: Optional[float]) -> None:
+        self.result = result
+        self.expires_at = expires_at
+
+
+class _Flight:
+    """A call in progress, shared by the threads asking for the same key."""
+
+    __slots__ = ("done", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = _FAILED
+
+
+def _new_count() -> List[int]:
+    return [0]
+
+
+def _add_count(into: List[int], count: List[int]) -> None:
+    into[0] += count[0]
+
+
+def _subtract_count(into: List[int], count: List[int]) -> None:
+    into[0] -= count[0]
+
+
+def _make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    if not kwargs:
+        return args
+    return args + (_KWARGS_MARK,) + tuple(kwargs.items())
+
+
+class _Memoized:
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        maxsize: Optional[int],
+        ttl: Optional[float],
+        err_ttl: Mapping[Type[BaseException], Optional[float]],
+        clock: Callable[[], float],
+    ) -> None:
+        functools.update_wrapper(self, func)
+        self._func = func
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._err_ttl = dict(err_ttl)
+        self._err_ttl_cache: Dict[type, Optional[float]] = {}
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "collections.OrderedDict[Hashable, _Entry]" = (
+            collections.OrderedDict()
+        )
+        # calls in progress, _Flight for threads and Task for coroutines
+        self._flights: Dict[Hashable, Any] = {}
+        self._hits = self._misses = self._evictions = self._expirations = 0
+        # hits answered without the lock, counted by each thread
+        self._unlocked_hits = PerThread(_new_count, list, _add_count, _subtract_count)
+        self._local = self._unlocked_hits.local
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        # lets the decorator be used on methods
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+
+    def _ttl_for(self, result: Any) -> Optional[float]:
+        if not isinstance(result, Err):
+            return self._ttl
+        err_type = type(result._err)
+        try:
+            return self._err_ttl_cache[err_type]
+        except KeyError:
+            pass
+        ttl: Optional[float] = _NOT_CACHED
+        for base in err_type.__mro__:
+            if base in self._err_ttl:
+                ttl = self._err_ttl[base]
+                break
+        self._err_ttl_cache[err_type] = ttl
+        return ttl
+
+    def _lookup(self, key: Hashable) -> Optional[_Entry]:
+        # called with the lock held
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= self._clock():
+            del self._entries[key]
+            self._expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry
+
+    def _store(self, key: Hashable, result: Any) -> None:
+        ttl = self._ttl_for(result)
+        if ttl is not None and ttl <= 0:
+            return
+        expires_at = None if ttl is None else self._clock() + ttl
+        with self._lock:
+            self._entries[key] = _Entry(result, expires_at)
+            self._entries.move_to_end(key)
+            if self._maxsize is not None and len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        key = args if not kwargs else _make_key(args, kwargs)
+        # hits are answered inline and without the lock, which costs more
+        # than the rest of the hit, everything else goes through _load
+        entry = self._entries.get(key) if _GIL else None
+        if entry is not None:
+            expires_at = entry.expires_at
+            if expires_at is None or expires_at > self._clock():
+                try:
+                    self._entries.move_to_end(key)
+                except KeyError:
+                    # dropped by another thread since, still a valid result
+                    pass
+                try:
+                    hits = self._local.state
+                except AttributeError:
+                    hits = self._unlocked_hits.register()
+                hits[0] += 1
+                return entry.result
+        return self._load(key, args, kwargs)
+
+    def _load(self, key: Hashable, args: Any, kwargs: Any) -> Any:
+        while True:
+            with self._lock:
+                entry = self._lookup(key)
+                if entry is not None:
+                    return entry.result
+                flight: Any = self._flights.get(key)
+                leader = flight is None
+                if leader:
+                    self._misses += 1
+                    flight = self._flights[key] = _Flight()
+            if not leader:
+                flight.done.wait()
+                if flight.result is not _FAILED:
+                    return flight.result
+                # the call raised, try again
+                continue
+            try:
+                result = self._func(*args, **kwargs)
+                self._store(key, result)
+                flight.result = result
+                return result
+            finally:
+                with self._lock:
+                    del self._flights[key]
+                flight.done.set()
+
+    def stats(self) -> CacheStats:
+        """Returns the counters of the cache, after dropping the expired
+        entries.
+
+        Returns:
+            CacheStats: hits, misses, evictions, expirations and size.
+        """
+        unlocked_hits = self._unlocked_hits.totals()[0]
+        with self._lock:
+            now = self._clock()
+            expired = [
+                key
+                for key, entry in self._entries.items()
+                if entry.expires_at is not None and entry.expires_at <= now
+            ]
+            for key in expired:
+                del self._entries[key]
+            self._expirations += len(expired)
+            return CacheStats(
+                self._hits + unlocked_hits,
+                self._misses,
+                self._evictions,
+                self._expirations,
+                len(self._entries),
+            )
+
+    def invalidate(self, *args: Any, **kwargs: Any) -> bool:
+        """Drops the entry cached for the given arguments.
+
+        Returns:
+            bool: True if there was an entry.
+        """
+        with self._lock:
+            return self._entries.pop(_make_key(args, kwargs), None) is not None
+
+    def invalidate_if(self, predicate: Callable[[Any], bool]) -> int:
+        """Drops every entry whose cached result matches the predicate.
+
+        Example:
+            >>> find_user.invalidate_if(is_err)
+
+        Args:
+            predicate (Callable[[Result], bool]): called with each result.
+
+        Returns:
+            int: number of entries dropped.
+        """
+        with self._lock:
+            entries = list(self._entries.items())
+        # the predicate runs without the lock, it may use the cache itself
+        matched = [(key, entry) for key, entry in entries if predicate(entry.result)]
+        dropped = 0
+        with self._lock:
+            for key, entry in matched:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+                    dropped += 1
+        return dropped
+
+    def clear(self) -> None:
+        """Drops every entry and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+            self._unlocked_hits.reset()
+
+
+class _AsyncMemoized(_Memoized):
+    async def _run(self, key: Hashable, args: Any, kwargs: Any) -> Any:
+        try:
+            result = await self._func(*args, **kwargs)
+            self._store(key, result)
+            return result
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        key = _make_key(args, kwargs)
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                return entry.result
+            task = self._flights.get(key)
+            if task is None:
+                self._misses += 1
+                task = asyncio.ensure_future(self._run(key, args, kwargs))
+                self._flights[key] = task
+        # cancelling one caller must not cancel the call shared with others
+        return await asyncio.shield(task)
+
+
+def memoize(
+    maxsize: Optional[int] = 1024,
+    ttl: Optional[float] = None,
+    err_ttl: Optional[Mapping[Type[BaseException], Optional[float]]] = None,
+    clock: Callable[[], float] = time.monotonic,
+) -> "Callable[[Callable[P, R]], MemoizedFunction[P, R]]":
+    """Caches the results of a function, or coroutine function, returning
+    `Result`.
+
+    Exceptions raised by the function are never cached. Values which are
+    neither Ok nor Err follow the Ok policy.
+
+    Example:
+        >>> @memoize(ttl=300, err_ttl={KeyError: 10, LookupError: 1})
+        >>> async def fetch(url: str) -> Result[bytes, Exception]:
+        >>>     ...
+
+    Args:
+        maxsize (Optional[int]): maximum entries, least recently used ones
+        are dropped first. None for no bound.
+        ttl (Optional[float]): seconds an Ok result stays valid, None for no
+        expiration, 0 to not cache Ok at all.
+        err_ttl (Optional[Mapping[Type[BaseException], Optional[float]]]):
+        seconds an Err result stays valid, per exception type, resolved
+        through the MRO of the exception. None for no expiration. Errors not
+        covered are not cached.
+        clock (Callable[[], float]): time source, in seconds.
+
+    Raises:
+        ValueError: if maxsize is lower than 1.
+
+    Returns:
+        Callable[[Callable[P, R]], MemoizedFunction[P, R]]: the decorator.
+        The decorated function also offers `stats()`,
+        `invalidate(*args, **kwargs)`, `invalidate_if(predicate)` and
+        `clear()`.
+    """
+    if maxsize is not None and maxsize < 1:
+        raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+
+    def decorator(func: "Callable[P, R]") -> "MemoizedFunction[P, R]":
+        cls = _AsyncMemoized if inspect.iscoroutinefunction(func) else _Memoized
+        memoized: Any = cls(func, maxsize, ttl, err_ttl or {}, clock)
+        return typing.cast("MemoizedFunction[P, R]", memoized)
+
+    return decorator
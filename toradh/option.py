@@ -1,14 +1,19 @@
+import threading
 import typing
 from typing import Generic, TypeVar, Union
 
-import typeguard
+from . import typecheck
+from ._frozen import Frozen, slot_setter
 
 
 T = TypeVar("T")
 V = TypeVar("V")
 
 
-class Option(Generic[T]):
+class Option(Frozen, Generic[T]):
+    __slots__ = ("_value", "_hash")
+    _value: typing.Optional[T]
+    _hash: int
     __match_args__ = ("_value",)
 
     def __init__(self, value: Union[T, None]) -> None:
@@ -31,11 +36,11 @@ class Option(Generic[T]):
         Raises:
             ValueError: if calling the __init__ method directly.
         """
-        if getattr(self, "_flag", None) is None:
+        if type(self) is Option:
             raise ValueError(
                 'you need to call either "empty()" or "of()" methods to create an instance'
             )
-        self._value = value
+        _set_value(self, value)
 
     @classmethod
     def empty(cls) -> "Nothing":
@@ -44,8 +49,7 @@ class Option(Generic[T]):
         Returns:
             Nothing:
         """
-        setattr(cls, "_flag", True)
-        return Nothing()
+        return _NOTHING
 
     @typing.overload
     @classmethod
@@ -66,9 +70,8 @@ class Option(Generic[T]):
         Returns:
             Union[Some[T], Nothing]: Either an instance of Some[T] if T is not none else Nothing()
         """
-        setattr(cls, "_flag", True)
         if value is None:
-            return Nothing()
+            return _NOTHING
         return Some(value)
 
     def is_some(self) -> bool:
@@ -87,7 +90,7 @@ class Option(Generic[T]):
         """
         return self._value is None
 
-    @typeguard.typechecked
+    @typecheck.typechecked
     def unwrap(self) -> T:
         """Returns the value wrapped in the Option
         Returns:
@@ -96,7 +99,7 @@ class Option(Generic[T]):
         assert self._value is not None
         return self._value
 
-    @typeguard.typechecked
+    @typecheck.typechecked
     def unwrap_or(self, default: T) -> T:
         """Returns the value wrapped in case of Some()
         else returns the default value.
@@ -110,7 +113,7 @@ class Option(Generic[T]):
         assert self._value is not None
         return self._value
 
-    @typeguard.typechecked
+    @typecheck.typechecked
     def map(self, func: typing.Callable[[T], V]) -> "Option[V]":
         assert self._value
         return Option.of(func(self._value))
@@ -119,26 +122,79 @@ class Option(Generic[T]):
         return f"Some({self._value})"
 
 
+_set_value = slot_setter(Option, "_value")
+_set_hash = slot_setter(Option, "_hash")
+
+
 class Some(Option[T], Generic[T]):
+    __slots__ = ()
     __match_args__ = ("_value",)
 
     def __init__(self, value: T) -> None:
         """Representation of a desired value within a control flow.
+        Instances are immutable, and hashable if the value is.
 
         Args:
             value (T): actual value to be wrapped.
         """
-        self._flag = True
-        super().__init__(value)
+        _set_value(self, value)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if isinstance(other, Some):
+            return self._value == other._value
+        return False
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        value = hash((Some, self._value))
+        _set_hash(self, value)
+        return value
+
+    def __reduce_ex__(self, protocol: typing.SupportsIndex) -> typing.Any:
+        # compact pickles, subclasses keep the default protocol.
+        if type(self) is Some:
+            return (Some, (self._value,))
+        return super().__reduce_ex__(protocol)
+
+
+_nothing_lock = threading.Lock()
 
 
 class Nothing(Option[None]):
+    __slots__ = ()
     __match_args__ = ("_value",)
+    _instance: typing.ClassVar[typing.Optional["Nothing"]] = None
+
+    def __new__(cls) -> "Nothing":
+        # every Nothing() is the same immutable value, so a single
+        # instance per class is shared.
+        instance = cls._instance
+        if instance is None or type(instance) is not cls:
+            # only the first instance of each class takes the lock
+            with _nothing_lock:
+                instance = cls._instance
+                if instance is None or type(instance) is not cls:
+                    instance = super().__new__(cls)
+                    _set_value(instance, None)
+                    cls._instance = instance
+        return instance
 
     def __init__(self) -> None:
-        """Representation of the absence of a desired value."""
-        self._flag = True
-        super().__init__(None)
+        """Representation of the absence of a desired value.
+        All instances are the same shared object, so `is` checks are valid.
+        """
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        return (type(self), ())
+
+    def __eq__(self, other: typing.Any) -> bool:
+        return isinstance(other, Nothing)
+
+    def __hash__(self) -> int:
+        return _NOTHING_HASH
 
     def is_some(self) -> bool:
         return False
@@ -149,16 +205,20 @@ class Nothing(Option[None]):
     def unwrap(self) -> typing.NoReturn:
         raise ValueError("Trying to unwrap Nothing() is not allowed")
 
-    @typeguard.typechecked
+    @typecheck.typechecked
     def unwrap_or(self, default: T) -> T:
         return default
 
-    @typeguard.typechecked
+    @typecheck.typechecked
     def map(self, func: typing.Callable[[T], V]) -> Option[V]:
-        return typing.cast(Option, Nothing())
+        return typing.cast(Option, self)
 
     def __repr__(self) -> str:
         return "Empty"
 
 
+_NOTHING = Nothing()
+_NOTHING_HASH = hash((Nothing,))
+
+
 Optional = typing.Union[Some[T], Nothing]
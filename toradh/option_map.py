@@ -0,0 +1,154 @@
+import itertools
+import typing
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    KeysView,
+    List,
+    Mapping,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .option import _NOTHING, Nothing, Some
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class OptionMap(Generic[K, V]):
+    """Dict-like container whose lookups return `Option`.
+
+    Every value is stored already wrapped in its `Some`, so `get` hands out
+    that same instance on every hit and the shared `Nothing` on a miss:
+    a lookup is a single `dict.get` call and allocates nothing, unlike
+    `Option.of(data.get(key))`. The only extra memory is one `Some` per
+    stored value.
+
+    Like `Option.of`, a None value is stored as `Nothing`: `get` returns
+    Nothing for it, while the key stays in the map and `map[key]` gives
+    None back.
+
+    The returned `Some` instances are shared, which is safe as they are
+    immutable.
+
+    Example:
+        >>> carts = OptionMap({1: Cart(id=1)})
+        >>> carts.get(1)  # Some(Cart(id=1))
+        >>> carts.get(2)  # Nothing
+        >>> carts.get_many([1, 2])  # [Some(Cart(id=1)), Nothing]
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(
+        self,
+        items: Union[Mapping[K, V], Iterable[Tuple[K, V]], None] = None,
+    ) -> None:
+        """
+        Args:
+            items (Union[Mapping[K, V], Iterable[Tuple[K, V]], None]): initial
+            content, as a mapping or as key-value pairs.
+        """
+        self._data: Dict[K, Union[Some[V], Nothing]] = {}
+        if items is not None:
+            self.update(items)
+
+    def get(self, key: K) -> Union[Some[V], Nothing]:
+        """Looks up a key.
+
+        Args:
+            key (K): key to look for.
+
+        Returns:
+            Optional[V]: the Some stored for the key, or Nothing if it is
+            missing or its value is None.
+        """
+        return self._data.get(key, _NOTHING)
+
+    def get_many(self, keys: Iterable[K]) -> List[Union[Some[V], Nothing]]:
+        """Looks up several keys at once.
+
+        Args:
+            keys (Iterable[K]): keys to look for.
+
+        Returns:
+            List[Optional[V]]: one Option per key, in the same order.
+        """
+        return list(map(self._data.get, keys, itertools.repeat(_NOTHING)))
+
+    def pop(self, key: K) -> Union[Some[V], Nothing]:
+        """Removes a key.
+
+        Args:
+            key (K): key to remove.
+
+        Returns:
+            Optional[V]: the value removed, or Nothing if it was not present
+            or None.
+        """
+        return self._data.pop(key, _NOTHING)
+
+    def update(self, items: Union[Mapping[K, V], Iterable[Tuple[K, V]]]) -> None:
+        """Inserts or replaces several values.
+
+        Args:
+            items (Union[Mapping[K, V], Iterable[Tuple[K, V]]]): new content,
+            as a mapping or as key-value pairs.
+        """
+        pairs = items.items() if isinstance(items, Mapping) else items
+        self._data.update(
+            (key, _NOTHING if value is None else Some(value)) for key, value in pairs
+        )
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def keys(self) -> KeysView[K]:
+        return self._data.keys()
+
+    def values(self) -> Iterator[V]:
+        for some in self._data.values():
+            yield some._value  # type: ignore[misc]
+
+    def items(self) -> Iterator[Tuple[K, V]]:
+        for key, some in self._data.items():
+            yield key, some._value  # type: ignore[misc]
+
+    def to_dict(self) -> Dict[K, V]:
+        """Returns the content as a plain dict.
+
+        Returns:
+            Dict[K, V]: unwrapped values per key.
+        """
+        return dict(self.items())
+
+    def __getitem__(self, key: K) -> V:
+        return typing.cast(V, self._data[key]._value)
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._data[key] = _NOTHING if value is None else Some(value)
+
+    def __delitem__(self, key: K) -> None:
+        del self._data[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._data)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, OptionMap):
+            return self.to_dict() == other.to_dict()
+        return False
+
+    def __repr__(self) -> str:
+        return f"OptionMap({self.to_dict()!r})"
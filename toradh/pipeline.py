@@ -0,0 +1,197 @@
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar, Union
+
+from .result import Err, Ok
+
+T = TypeVar("T")
+V = TypeVar("V")
+W = TypeVar("W")
+
+# step kinds, the first two run over Ok values and the last two over errors
+_MAP = 0
+_AND_THEN = 1
+_MAP_ERR = 2
+_OR_ELSE = 3
+
+_Step = Tuple[int, Callable[[Any], Any]]
+
+
+class Pipeline(Generic[T, V]):
+    """Lazy chain of `map`/`and_then`/`map_err`/`or_else` steps over a Result.
+
+    Unlike chaining the methods of `Ok`/`Err`, a pipeline does not build a
+    wrapper after every step. The steps run over the raw value (or error)
+    and a single `Ok`/`Err` is created at the end. Once an `Err` shows up,
+    every Ok step is skipped until the next error handling step, or the end.
+
+    Pipelines are immutable, adding a step returns a new pipeline so a
+    common prefix can be shared.
+
+    Example:
+        >>> parse = Pipeline().map(str.strip).and_then(to_int).map(abs)
+        >>> parse(Ok(" -3 "))
+        Ok(3)
+    """
+
+    __slots__ = ("_steps", "_run")
+
+    def __init__(self, steps: Tuple[_Step, ...] = ()) -> None:
+        self._steps = steps
+        self._run: Optional[Callable[[Any], Any]] = None
+
+    def _add(self, kind: int, op: Callable[[Any], Any]) -> "Pipeline[Any, Any]":
+        return Pipeline(self._steps + ((kind, op),))
+
+    def map(self, op: Callable[[V], W]) -> "Pipeline[T, W]":
+        """Adds a step applied to the value in case of Ok().
+
+        Args:
+            op (Callable[[V], W]): function to apply to the Ok value.
+
+        Returns:
+            Pipeline[T, W]: new pipeline.
+        """
+        return self._add(_MAP, op)
+
+    def and_then(self, op: Callable[[V], Union[Ok[W], Err[Any]]]) -> "Pipeline[T, W]":
+        """Adds a Result returning step invoked with the value in case of Ok().
+
+        Args:
+            op (Callable[[V], Result[W, Any]]): function to invoke with the Ok value.
+
+        Returns:
+            Pipeline[T, W]: new pipeline.
+        """
+        return self._add(_AND_THEN, op)
+
+    def map_err(self, op: Callable[[Any], BaseException]) -> "Pipeline[T, V]":
+        """Adds a step applied to the error in case of Err().
+
+        Args:
+            op (Callable[[Any], BaseException]): function to apply to the error.
+
+        Returns:
+            Pipeline[T, V]: new pipeline.
+        """
+        return self._add(_MAP_ERR, op)
+
+    def or_else(self, op: Callable[[Any], Union[Ok[V], Err[Any]]]) -> "Pipeline[T, V]":
+        """Adds a Result returning recovery step invoked with the error in case of Err().
+
+        Args:
+            op (Callable[[Any], Result[V, Any]]): function to invoke with the error.
+
+        Returns:
+            Pipeline[T, V]: new pipeline.
+        """
+        return self._add(_OR_ELSE, op)
+
+    def compile(self) -> Callable[[Union[Ok[T], Err[Any]]], Union[Ok[V], Err[Any]]]:
+        """Returns the fused function running every step, which saves one
+        call level over invoking the pipeline itself in tight loops.
+
+        Returns:
+            Callable[[Result[T, Any]], Result[V, Any]]: fused function.
+        """
+        run = self._run
+        if run is None:
+            run = self._run = _compile(self._steps)
+        return run
+
+    def __call__(self, result: Union[Ok[T], Err[Any]]) -> Union[Ok[V], Err[Any]]:
+        """Runs every step over the given result.
+
+        Args:
+            result (Result[T, Any]): input of the pipeline.
+
+        Returns:
+            Result[V, Any]: output of the last step.
+        """
+        run = self._run
+        if run is None:
+            run = self.compile()
+        return run(result)
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __repr__(self) -> str:
+        names = ("map", "and_then", "map_err", "or_else")
+        chain = ".".join(
+            f"{names[kind]}({getattr(op, '__name__', repr(op))})"
+            for kind, op in self._steps
+        )
+        return f"Pipeline().{chain}" if chain else "Pipeline()"
+
+
+def _compile(steps: Tuple[_Step, ...]) -> Callable[[Any], Any]:
+    """Generates a single function with the steps inlined, one after the
+    other. Every step is guarded by the track it applies to, and once an
+    Err shows up with no error handling step left the function returns
+    right away.
+    """
+    kinds = [kind for kind, _ in steps]
+    names = [f"op{index}" for index in range(len(steps))]
+    has_err_steps = any(kind >= _MAP_ERR for kind in kinds)
+
+    body: List[str] = [
+        "if isinstance(result, Ok):",
+        "    ok = True",
+        "    x = result._value",
+        "else:",
+    ]
+    if has_err_steps:
+        body += ["    ok = False", "    x = result._err"]
+    else:
+        body += ["    return result"]
+    # last Result returned by a step, handed back as is when no later step
+    # changed it to save an allocation.
+    body += ["last = result"]
+
+    for index, (kind, name) in enumerate(zip(kinds, names)):
+        err_steps_left = any(later >= _MAP_ERR for later in kinds[index + 1 :])
+        if kind == _MAP:
+            body += ["if ok:", f"    x = {name}(x)", "    last = None"]
+        elif kind == _MAP_ERR:
+            body += ["if not ok:", f"    x = {name}(x)", "    last = None"]
+        elif kind == _AND_THEN:
+            body += [
+                "if ok:",
+                f"    last = {name}(x)",
+                "    if isinstance(last, Ok):",
+                "        x = last._value",
+                "    else:",
+            ]
+            if err_steps_left:
+                body += ["        ok = False", "        x = last._err"]
+            else:
+                body += ["        return last"]
+        else:
+            body += [
+                "if not ok:",
+                f"    last = {name}(x)",
+                "    if isinstance(last, Ok):",
+                "        ok = True",
+                "        x = last._value",
+                "    else:",
+                "        x = last._err",
+            ]
+
+    body += [
+        "if last is not None:",
+        "    return last",
+        "return Ok(x) if ok else Err(x)",
+    ]
+    # the steps are bound as closure variables of a factory, which is
+    # faster to look up than globals.
+    source = "\n".join(
+        [f"def factory(Ok, Err, {', '.join(names + ['isinstance'])}):"]
+        + ["    def run(result):"]
+        + [f"        {line}" for line in body]
+        + ["    return run"]
+    )
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<toradh.pipeline>", "exec"), namespace)
+    run: Callable[[Any], Any] = namespace["factory"](
+        Ok, Err, *(op for _, op in steps), isinstance
+    )
+    return run
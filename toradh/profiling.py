@@ -0,0 +1,258 @@
+"""Latency histograms of Result returning functions, split by outcome.
+
+Each call of a `profile`d function is timed and counted in the histogram of
+its outcome: `"Ok"`, or the exception type held by the `Err`. Comparing
+them tells whether the Err paths are cheap early exits or slow timeouts.
+
+Histograms have fixed memory: 64 buckets growing by powers of two, from 1
+nanosecond to centuries, plus the total time. Each thread records into its
+own histograms, without locks, and `snapshot` adds them up.
+
+Example:
+    >>> @profile(sample_rate=0.1)
+    >>> async def fetch(url: str) -> Result[bytes, Exception]:
+    >>>     ...
+    >>>
+    >>> snapshot()["app.fetch"]["TimeoutError"].percentile(0.99)
+    >>> reset()
+"""
+
+import threading
+import time
+import typing
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from ._shared import PerThread, generate_wrapper, label, qualname, thread_random
+from .result import Err
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+BUCKETS = 64
+# index of the total time, after the buckets
+_TOTAL = BUCKETS
+# latencies from here on go to the last bucket
+_MAX_NS = 1 << (BUCKETS - 1)
+OK = "Ok"
+
+# histograms of one thread: outcome (OK or exception type) to counts
+Histograms = Dict[Any, List[int]]
+
+
+class Histogram(NamedTuple):
+    """Latencies of the calls with the same outcome.
+
+    Attributes:
+        calls (int): calls recorded.
+        total_ns (int): time spent in those calls, in nanoseconds.
+        buckets (Tuple[int, ...]): calls per bucket, bucket `i` holds the
+        latencies in `[2 ** (i - 1), 2 ** i)` nanoseconds, bucket 0 those
+        under a nanosecond.
+    """
+
+    calls: int
+    total_ns: int
+    buckets: Tuple[int, ...]
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+
+    def percentile(self, q: float) -> int:
+        """Estimates a latency percentile, within a factor of two.
+
+        Args:
+            q (float): between 0 and 1, 0.99 for the 99th percentile.
+
+        Returns:
+            int: upper bound, in nanoseconds, of the bucket holding it. 0
+            without calls.
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"q must be between 0 and 1, got {q}")
+        rank = q * self.calls
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return 1 << index
+        return 0
+
+
+def _new() -> Histograms:
+    return {}
+
+
+def _copy(histograms: Histograms) -> Histograms:
+    # copying the dict first is atomic, iterating over it is not
+    return {outcome: list(counts) for outcome, counts in dict(histograms).items()}
+
+
+def _add(into: Histograms, histograms: Histograms) -> None:
+    for outcome, counts in histograms.items():
+        target = into.get(outcome)
+        if target is None:
+            into[outcome] = list(counts)
+        else:
+            for index, value in enumerate(counts):
+                target[index] += value
+
+
+def _subtract(into: Histograms, histograms: Histograms) -> None:
+    for outcome, counts in histograms.items():
+        target = into.get(outcome)
+        if target is not None:
+            for index, value in enumerate(counts):
+                target[index] -= value
+
+
+def _histograms() -> PerThread[Histograms]:
+    return PerThread(_new, _copy, _add, _subtract)
+
+
+_lock = threading.Lock()
+# one entry per name, decorating again (closures, lambdas) reuses it
+_profiles: Dict[str, PerThread[Histograms]] = {}
+
+
+def _wrap(
+    func: Callable[..., Any],
+    state: PerThread[Histograms],
+    sample_rate: float,
+    clock: Callable[[], int],
+) -> Callable[..., Any]:
+    # Like catch, the wrapper is generated with the same parameters as func
+    # and the recording is inlined.
+    def body(call: str) -> List[str]:
+        sampling = (
+            []
+            if sample_rate >= 1.0
+            else [
+                "if _toradh_random.draw() >= _toradh_rate:",
+                f"    return {call}",
+            ]
+        )
+        return [
+            *sampling,
+            "try:",
+            "    _toradh_histograms = _toradh_local.state",
+            "except AttributeError:",
+            "    _toradh_histograms = _toradh_state.register()",
+            "_toradh_start = _toradh_clock()",
+            f"_toradh_result = {call}",
+            "_toradh_elapsed = _toradh_clock() - _toradh_start",
+            "if isinstance(_toradh_result, _toradh_Err):",
+            "    _toradh_outcome = type(_toradh_result._err)",
+            "else:",
+            "    _toradh_outcome = _toradh_OK",
+            "_toradh_counts = _toradh_histograms.get(_toradh_outcome)",
+            "if _toradh_counts is None:",
+            f"    _toradh_counts = [0] * {BUCKETS + 1}",
+            "    _toradh_histograms[_toradh_outcome] = _toradh_counts",
+            f"if _toradh_elapsed < {_MAX_NS}:",
+            "    _toradh_counts[_toradh_elapsed.bit_length()] += 1",
+            "else:",
+            f"    _toradh_counts[{BUCKETS - 1}] += 1",
+            f"_toradh_counts[{_TOTAL}] += _toradh_elapsed",
+            "return _toradh_result",
+        ]
+
+    bindings = {
+        "_toradh_local": state.local,
+        "_toradh_state": state,
+        "_toradh_random": thread_random,
+        "_toradh_rate": sample_rate,
+        "_toradh_clock": clock,
+        "_toradh_Err": Err,
+        "_toradh_OK": OK,
+    }
+    return generate_wrapper(func, "profiling", body, bindings)
+
+
+def profile(
+    name: Optional[str] = None,
+    *,
+    sample_rate: float = 1.0,
+    clock: Callable[[], int] = time.perf_counter_ns,
+) -> Callable[[F], F]:
+    """Records the latency of every call, or of a sample of them, in the
+    histogram of its outcome. Works with both regular and async functions.
+
+    Values other than Err count as "Ok". Calls raising an exception are not
+    recorded. Functions profiled under the same name share their
+    histograms.
+
+    Example:
+        >>> @profile("users.find", sample_rate=0.01)
+        >>> def find(user_id: int) -> Result[User, KeyError]:
+        >>>     ...
+
+    Args:
+        name (Optional[str]): key of the function in `snapshot`, by default
+        its module and qualified name.
+        sample_rate (float): fraction of the calls recorded, between 0 and 1.
+        clock (Callable[[], int]): time source, in nanoseconds.
+
+    Raises:
+        ValueError: if sample_rate is out of range.
+
+    Returns:
+        Callable[[F], F]: the decorator.
+    """
+    if not 0.0 <= sample_rate <= 1.0:
+        raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+
+    def decorator(func: F) -> F:
+        key = name or f"{func.__module__}.{qualname(func)}"
+        with _lock:
+            state = _profiles.get(key)
+            if state is None:
+                state = _profiles[key] = _histograms()
+        return typing.cast(F, _wrap(func, state, sample_rate, clock))
+
+    return decorator
+
+
+def snapshot() -> Dict[str, Dict[str, Histogram]]:
+    """Returns the histograms of every profiled function, added up across
+    threads.
+
+    Returns:
+        Dict[str, Dict[str, Histogram]]: histogram per function name and
+        outcome, "Ok" or the name of the exception type. Outcomes without
+        calls since the last reset are left out.
+    """
+    result: Dict[str, Dict[str, Histogram]] = {}
+    with _lock:
+        profiles = list(_profiles.items())
+    for key, state in profiles:
+        outcomes = result.setdefault(key, {})
+        for outcome, counts in state.totals().items():
+            buckets = tuple(counts[:BUCKETS])
+            count = sum(buckets)
+            if count:
+                name = label(outcome)
+                previous = outcomes.get(name)
+                if previous is not None:
+                    # another class with the same qualified name
+                    buckets = tuple(map(sum, zip(buckets, previous.buckets)))
+                    count += previous.calls
+                    counts[_TOTAL] += previous.total_ns
+                outcomes[name] = Histogram(count, counts[_TOTAL], buckets)
+    return result
+
+
+def reset() -> None:
+    """Sets every histogram back to zero."""
+    with _lock:
+        profiles = list(_profiles.values())
+    for state in profiles:
+        state.reset()
@@ -1,9 +1,11 @@
-import inspect
 import typing
 from typing import Any, Callable, Generic, Literal, NoReturn, TypeVar, Union
-from typing_extensions import TypeIs
 
-import typeguard
+from . import typecheck
+from ._frozen import Frozen, slot_setter
+
+if typing.TYPE_CHECKING:
+    from typing_extensions import TypeIs
 
 # source: https://jellis18.github.io/post/2021-12-13-python-exceptions-rust-go/
 
@@ -17,6 +19,8 @@ R = TypeVar("R", bound=BaseException)
 class ResultProto(typing.Protocol[T, E]):
     def __eq__(self, other: Any) -> bool: ...
 
+    def __hash__(self) -> int: ...
+
     def kind(self) -> T:
         """Returns the instance with the objective to be use for structural pattern matching.
 
@@ -94,6 +98,56 @@ class ResultProto(typing.Protocol[T, E]):
         """
         ...
 
+    def map(self, op: Callable[[T], V]) -> "Union[Ok[V], Err[E]]":
+        """Applies op to the wrapped value in case of Ok(), an Err() is returned as is.
+
+        Args:
+            op (Callable[[T], V]): function to apply to the content of Ok()
+
+        Returns:
+            Union[Ok[V], Err[E]]: Ok(op(value)) or the same Err() instance.
+        """
+        ...
+
+    def and_then(
+        self, op: Callable[[T], "Union[Ok[V], Err[R]]"]
+    ) -> "Union[Ok[V], Err[Union[E, R]]]":
+        """Chains a Result returning operation in case of Ok(), an Err() is
+        returned as is.
+
+        Args:
+            op (Callable[[T], Result[V, R]]): function to invoke with the content of Ok()
+
+        Returns:
+            Result[V, E | R]: the result of op or the same Err() instance.
+        """
+        ...
+
+    def map_err(self, op: Callable[[E], R]) -> "Union[Ok[T], Err[R]]":
+        """Applies op to the wrapped error in case of Err(), an Ok() is returned as is.
+
+        Args:
+            op (Callable[[E], R]): function to apply to the content of Err()
+
+        Returns:
+            Union[Ok[T], Err[R]]: the same Ok() instance or Err(op(err)).
+        """
+        ...
+
+    def or_else(
+        self, op: Callable[[E], "Union[Ok[T], Err[R]]"]
+    ) -> "Union[Ok[T], Err[R]]":
+        """Chains a Result returning recovery operation in case of Err(), an Ok()
+        is returned as is.
+
+        Args:
+            op (Callable[[E], Result[T, R]]): function to invoke with the content of Err()
+
+        Returns:
+            Result[T, R]: the same Ok() instance or the result of op.
+        """
+        ...
+
     def map_to_err(self, result: "Err[R]") -> "Err[R]":
         """Give a new exception to return as a new instance of Err
 
@@ -106,23 +160,36 @@ class ResultProto(typing.Protocol[T, E]):
         ...
 
 
-class Ok(Generic[T]):
+class Ok(Frozen, Generic[T]):
+    __slots__ = ("_value", "_hash")
     _value: T
+    _hash: int
     __match_args__ = ("_value",)
 
     def __init__(self, value: T):
         """Creates a OK object which represent a successful value.
+        Instances are immutable, and hashable if the value is.
 
         Args:
             value (T): instance to wrap
         """
-        self._value = value
+        _set_ok_value(self, value)
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, Ok):
             return self._value == other._value
         return False
 
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        # same hash for subclasses, as they compare equal
+        value = hash((Ok, self._value))
+        _set_ok_hash(self, value)
+        return value
+
     def kind(self) -> T:
         """Returns the instance with the objective to be use for structural pattern matching.
 
@@ -188,6 +255,8 @@ class Ok(Generic[T]):
         Returns:
             T:
         """
+        import inspect
+
         res = op(self.unwrap())
         if inspect.isawaitable(res):
             await res
@@ -195,28 +264,89 @@ class Ok(Generic[T]):
     def or_else_throw(self, result: "Err[R]") -> "Ok[T]":
         return Ok(self.unwrap())
 
+    def map(self, op: Callable[[T], V]) -> "Ok[V]":
+        """Applies op to the wrapped value.
+
+        Args:
+            op (Callable[[T], V]): function to apply to the content of Ok()
+
+        Returns:
+            Ok[V]: new Ok() with the result of op.
+        """
+        return Ok(op(self._value))
+
+    def and_then(
+        self, op: Callable[[T], "Union[Ok[V], Err[R]]"]
+    ) -> "Union[Ok[V], Err[R]]":
+        """Chains a Result returning operation over the wrapped value.
+
+        Args:
+            op (Callable[[T], Result[V, R]]): function to invoke with the content of Ok()
+
+        Returns:
+            Result[V, R]: the result of op.
+        """
+        return op(self._value)
+
+    def map_err(self, op: Callable[[Any], Any]) -> "Ok[T]":
+        """Nothing to map over, returns the same instance.
+
+        Returns:
+            Ok[T]: self
+        """
+        return self
+
+    def or_else(self, op: Callable[[Any], Any]) -> "Ok[T]":
+        """Nothing to recover from, returns the same instance.
+
+        Returns:
+            Ok[T]: self
+        """
+        return self
+
+    def __reduce_ex__(self, protocol: typing.SupportsIndex) -> Any:
+        # compact pickles, subclasses keep the default protocol.
+        if type(self) is Ok:
+            return (Ok, (self._value,))
+        return super().__reduce_ex__(protocol)
+
     def __repr__(self) -> str:
         return f"Ok({repr(self._value)})"
 
 
-class Err(Generic[E]):
+_set_ok_value = slot_setter(Ok, "_value")
+_set_ok_hash = slot_setter(Ok, "_hash")
+
+
+class Err(Frozen, Generic[E]):
+    __slots__ = ("_err", "_hash")
     _err: E
+    _hash: int
     __match_args__ = ("_err",)
 
     def __init__(self, err: E):
         """Representation of an wrapped error. Meant to be use for control flow
-        management.
+        management. Instances are immutable, and hashable if the error is.
 
         Args:
             err (E): error instance to wrap
         """
-        self._err = err
+        _set_err(self, err)
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, Err):
             return self._err == other._err
         return False
 
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        value = hash((Err, self._err))
+        _set_err_hash(self, value)
+        return value
+
     def kind(self) -> E:
         """Returns the instance with the objective to be use for structural pattern matching.
 
@@ -236,11 +366,11 @@ class Err(Generic[E]):
         """
         raise self._err
 
-    @typeguard.typechecked
+    @typecheck.typechecked
     def unwrap_or(self, default: T) -> T:
         return default
 
-    @typeguard.typechecked
+    @typecheck.typechecked
     def unwrap_or_else(self, op: Callable[[E], T]) -> T:
         return op(self._err)
 
@@ -266,11 +396,11 @@ class Err(Generic[E]):
         """
         return None
 
-    @typeguard.typechecked
+    @typecheck.typechecked
     def or_else_throw(self, result: "Err[R]") -> "Err[R]":
         return result
 
-    @typeguard.typechecked
+    @typecheck.typechecked
     def map_to_err(self, err: R) -> "Err[R]":
         """Give a new exception to return as a new instance of Err
 
@@ -282,17 +412,67 @@ class Err(Generic[E]):
         """
         return Err(err)
 
+    def map(self, op: Callable[[Any], Any]) -> "Err[E]":
+        """Nothing to map over, returns the same instance.
+
+        Returns:
+            Err[E]: self
+        """
+        return self
+
+    def and_then(self, op: Callable[[Any], Any]) -> "Err[E]":
+        """Short-circuits the chain, returns the same instance.
+
+        Returns:
+            Err[E]: self
+        """
+        return self
+
+    def map_err(self, op: Callable[[E], R]) -> "Err[R]":
+        """Applies op to the wrapped error.
+
+        Args:
+            op (Callable[[E], R]): function to apply to the content of Err()
+
+        Returns:
+            Err[R]: new Err() with the result of op.
+        """
+        return Err(op(self._err))
+
+    def or_else(
+        self, op: Callable[[E], "Union[Ok[T], Err[R]]"]
+    ) -> "Union[Ok[T], Err[R]]":
+        """Chains a Result returning recovery operation over the wrapped error.
+
+        Args:
+            op (Callable[[E], Result[T, R]]): function to invoke with the content of Err()
+
+        Returns:
+            Result[T, R]: the result of op.
+        """
+        return op(self._err)
+
+    def __reduce_ex__(self, protocol: typing.SupportsIndex) -> Any:
+        # compact pickles, subclasses keep the default protocol.
+        if type(self) is Err:
+            return (Err, (self._err,))
+        return super().__reduce_ex__(protocol)
+
     def __repr__(self) -> str:
         return f"Err({repr(self._err)})"
 
 
+_set_err = slot_setter(Err, "_err")
+_set_err_hash = slot_setter(Err, "_hash")
+
+
 Result = Union[Ok[T], Err[E]]
 
 
 # Helper functions
 
 
-def is_ok(val: Result) -> TypeIs[Ok]:
+def is_ok(val: Result) -> "TypeIs[Ok]":
     """Helper function which indicates if the value is of type Ok or Err
 
     Args:
@@ -313,7 +493,7 @@ def is_ok(val: Result) -> TypeIs[Ok]:
         return False
 
 
-def is_err(val: Result) -> TypeIs[Err]:
+def is_err(val: Result) -> "TypeIs[Err]":
     """Helper function which indicates if the value is of type Err or Ok
 
     Args:
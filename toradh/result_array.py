@@ -0,0 +1,319 @@
+import typing
+from array import array
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Tuple, TypeVar
+
+from .result import Err, Ok, Result
+
+T = TypeVar("T")
+V = TypeVar("V")
+E = TypeVar("E", bound=BaseException)
+
+# number of set bits for every possible byte, used with bytes.translate
+_POPCOUNT = bytes(bin(byte).count("1") for byte in range(256))
+# rows per block of the rank index, 64 rows are 8 bytes of the mask
+_BLOCK_SHIFT = 6
+_BLOCK_ROWS = 1 << _BLOCK_SHIFT
+# dtype kinds stored as is by to_masked_array: bool, integers, floats, complex
+_NUMERIC_KINDS = "biufc"
+
+
+class ResultArray(Generic[T, E]):
+    """Columnar container for large amounts of `Result` values.
+
+    Instead of one `Ok`/`Err` object per row, the Ok values and the errors
+    are stored densely in two separate lists and a bitmask records which
+    rows succeeded. Bulk operations (`count_ok`, `values`, `errors`,
+    `partition`, `map`) work directly over those lists. The number of Ok
+    rows before every block of 64 rows is kept along the mask, so indexing
+    only counts the bits of a single block.
+
+    Example:
+        >>> arr = ResultArray.from_results([Ok(1), Err(ValueError()), Ok(3)])
+        >>> arr.count_ok()
+        2
+        >>> arr.map(lambda x: x * 10).values()
+        [10, 30]
+    """
+
+    __slots__ = ("_values", "_errors", "_mask", "_ranks", "_len")
+
+    def __init__(self) -> None:
+        self._values: List[T] = []
+        self._errors: List[E] = []
+        # bit i is set when row i is Ok
+        self._mask = bytearray()
+        # number of Ok rows before each block of rows
+        self._ranks = array("q")
+        self._len = 0
+
+    @classmethod
+    def from_results(cls, results: Iterable[Result[T, E]]) -> "ResultArray[T, E]":
+        """Builds an array out of an iterable of `Ok`/`Err` instances.
+
+        Args:
+            results (Iterable[Result[T, E]]): values to store.
+
+        Returns:
+            ResultArray[T, E]: new instance.
+        """
+        arr: ResultArray[T, E] = cls()
+        arr.extend(results)
+        return arr
+
+    def append_ok(self, value: T) -> None:
+        """Appends a successful row.
+
+        Args:
+            value (T): value of the row.
+        """
+        index = self._len
+        if not index & 7:
+            if not index % _BLOCK_ROWS:
+                self._ranks.append(len(self._values))
+            self._mask.append(0)
+        self._mask[index >> 3] |= 1 << (index & 7)
+        self._values.append(value)
+        self._len = index + 1
+
+    def append_err(self, err: E) -> None:
+        """Appends a failed row.
+
+        Args:
+            err (E): error of the row.
+        """
+        index = self._len
+        if not index & 7:
+            if not index % _BLOCK_ROWS:
+                self._ranks.append(len(self._values))
+            self._mask.append(0)
+        self._errors.append(err)
+        self._len = index + 1
+
+    def append(self, result: Result[T, E]) -> None:
+        """Appends a `Ok` or `Err` instance.
+
+        Args:
+            result (Result[T, E]): row to append.
+
+        Raises:
+            TypeError: if the value is neither Ok nor Err.
+        """
+        if isinstance(result, Ok):
+            self.append_ok(result._value)
+        elif isinstance(result, Err):
+            self.append_err(result._err)
+        else:
+            raise TypeError(f"expected Ok or Err, got {type(result).__name__}")
+
+    def extend(self, results: Iterable[Result[T, E]]) -> None:
+        """Appends every `Ok` or `Err` from the iterable.
+
+        Args:
+            results (Iterable[Result[T, E]]): rows to append.
+        """
+        for result in results:
+            self.append(result)
+
+    def is_ok(self, index: int) -> bool:
+        """Checks if the row at the given index is Ok.
+
+        Args:
+            index (int): row position, negative values count from the end.
+
+        Returns:
+            bool: True if the row is Ok, else False.
+        """
+        index = self._normalize(index)
+        return bool(self._mask[index >> 3] >> (index & 7) & 1)
+
+    def count_ok(self) -> int:
+        """Returns the number of Ok rows."""
+        return len(self._values)
+
+    def count_err(self) -> int:
+        """Returns the number of Err rows."""
+        return len(self._errors)
+
+    def values(self) -> List[T]:
+        """Returns the values of every Ok row, in order."""
+        return list(self._values)
+
+    def errors(self) -> List[E]:
+        """Returns the errors of every Err row, in order."""
+        return list(self._errors)
+
+    def partition(self) -> Tuple[List[T], List[E]]:
+        """Splits the rows into Ok values and errors.
+
+        Returns:
+            Tuple[List[T], List[E]]: Ok values and errors, each in order.
+        """
+        return list(self._values), list(self._errors)
+
+    def map(self, func: Callable[[T], V]) -> "ResultArray[V, E]":
+        """Applies func to every Ok row, Err rows are kept as they are.
+
+        Args:
+            func (Callable[[T], V]): function to apply to each Ok value.
+
+        Returns:
+            ResultArray[V, E]: new instance with the same layout.
+        """
+        arr: ResultArray[V, E] = ResultArray()
+        arr._values = list(map(func, self._values))
+        arr._errors = self._errors.copy()
+        arr._mask = self._mask.copy()
+        arr._ranks = self._ranks[:]
+        arr._len = self._len
+        return arr
+
+    def to_list(self) -> List[Result[T, E]]:
+        """Converts the array back into a list of `Ok`/`Err` instances."""
+        return list(self)
+
+    def to_masked_array(self, fill_value: Any = None) -> Any:
+        """Converts the array into a NumPy masked array, where Err rows are
+        masked. The errors themselves are not part of the output.
+
+        Requires NumPy to be installed.
+
+        Numbers are stored with a numeric dtype, wide enough for fill_value.
+        Any other value (strings, sequences, mixed types) is stored as is in
+        an object array: a fixed width string dtype would truncate
+        fill_value, and sequences would become extra dimensions.
+
+        Args:
+            fill_value (Any): value placed under the masked rows, and used
+            by `filled()`.
+
+        Returns:
+            numpy.ma.MaskedArray: one dimensional, Ok values with Err rows
+            masked.
+        """
+        np = _import_numpy()
+        ok = np.unpackbits(
+            np.frombuffer(bytes(self._mask), dtype=np.uint8), bitorder="little"
+        )[: self._len].astype(bool)
+        try:
+            values = np.asarray(self._values)
+        except ValueError:
+            # sequences of different lengths
+            values = None
+        fill = np.asarray(fill_value)
+        if (
+            values is not None
+            and len(values)
+            and values.ndim == 1
+            and values.dtype.kind in _NUMERIC_KINDS
+            and (fill_value is None or fill.dtype.kind in _NUMERIC_KINDS)
+        ):
+            dtype = values.dtype if fill_value is None else np.result_type(values, fill)
+            data = np.empty(self._len, dtype=dtype)
+            data[ok] = values
+        else:
+            data = np.empty(self._len, dtype=object)
+            # one row at a time, numpy would unpack sequences into rows
+            for index, value in zip(np.flatnonzero(ok).tolist(), self._values):
+                data[index] = value
+        if fill_value is not None:
+            data[~ok] = fill_value
+        return np.ma.MaskedArray(data, mask=~ok, fill_value=fill_value)
+
+    @classmethod
+    def from_masked_array(
+        cls, array: Any, error: typing.Optional[E] = None
+    ) -> "ResultArray[Any, E]":
+        """Builds an array out of a NumPy masked array. Masked rows become
+        Err rows.
+
+        Requires NumPy to be installed.
+
+        Args:
+            array (numpy.ma.MaskedArray): one dimensional masked array.
+            error (Optional[E]): error used for the masked rows. Defaults to
+            a ValueError.
+
+        Returns:
+            ResultArray[Any, E]: new instance.
+        """
+        np = _import_numpy()
+        masked = np.ma.getmaskarray(array)
+        err = typing.cast(E, ValueError("masked value") if error is None else error)
+        arr: ResultArray[Any, E] = cls()
+        arr._values = np.ma.getdata(array)[~masked].tolist()
+        arr._errors = [err] * int(masked.sum())
+        arr._mask = bytearray(np.packbits(~masked, bitorder="little").tobytes())
+        arr._ranks = _block_ranks(arr._mask)
+        arr._len = len(masked)
+        return arr
+
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("ResultArray index out of range")
+        return index
+
+    def _rank(self, index: int) -> int:
+        # number of Ok rows before the given index: the count before its
+        # block, then the bits of at most 7 bytes and of its own byte
+        mask = self._mask
+        byte = index >> 3
+        block = index >> _BLOCK_SHIFT
+        full = sum(mask[block << (_BLOCK_SHIFT - 3) : byte].translate(_POPCOUNT))
+        partial = mask[byte] & ((1 << (index & 7)) - 1) if index & 7 else 0
+        return self._ranks[block] + full + _POPCOUNT[partial]
+
+    def __getitem__(self, index: int) -> Result[T, E]:
+        index = self._normalize(index)
+        rank = self._rank(index)
+        if self._mask[index >> 3] >> (index & 7) & 1:
+            return Ok(self._values[rank])
+        return Err(self._errors[index - rank])
+
+    def __iter__(self) -> Iterator[Result[T, E]]:
+        values = iter(self._values)
+        errors = iter(self._errors)
+        mask = self._mask
+        for index in range(self._len):
+            if mask[index >> 3] >> (index & 7) & 1:
+                yield Ok(next(values))
+            else:
+                yield Err(next(errors))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ResultArray):
+            return (
+                self._len == other._len
+                and self._mask == other._mask
+                and self._values == other._values
+                and self._errors == other._errors
+            )
+        return False
+
+    def __repr__(self) -> str:
+        return f"ResultArray({self.to_list()!r})"
+
+
+def _block_ranks(mask: bytearray) -> "array[int]":
+    """Returns the number of set bits before every block of the mask."""
+    step = 1 << (_BLOCK_SHIFT - 3)
+    ranks = array("q")
+    rank = 0
+    for start in range(0, len(mask), step):
+        ranks.append(rank)
+        rank += sum(mask[start : start + step].translate(_POPCOUNT))
+    return ranks
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is required for masked array conversions: pip install numpy"
+        ) from e
+    return numpy
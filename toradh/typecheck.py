@@ -0,0 +1,189 @@
+"""Runtime type-check policy for the methods of `Option` and `Result`.
+
+Methods decorated with `typechecked` are validated by typeguard according
+to a process wide policy:
+
+- `"off"`: the plain method is installed on the class, no wrapper at all.
+- `"sampled"`: only a fraction of the calls are validated.
+- `"full"`: every call is validated (default).
+
+The initial policy is read from the `TORADH_TYPECHECK` environment variable
+and the sampling rate from `TORADH_TYPECHECK_SAMPLE_RATE`. Both can be
+changed at runtime through `set_typecheck_policy`.
+
+typeguard is only imported by the first call that gets validated, so it
+does not slow down `import toradh`.
+"""
+
+import functools
+import os
+import threading
+import typing
+from typing import Any, Callable, List, Literal, Optional, TypeVar
+
+from . import _hooks
+from ._shared import thread_random
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+TypeCheckPolicy = Literal["off", "sampled", "full"]
+
+POLICY_ENV_VAR = "TORADH_TYPECHECK"
+SAMPLE_RATE_ENV_VAR = "TORADH_TYPECHECK_SAMPLE_RATE"
+
+_POLICIES = ("off", "sampled", "full")
+_DEFAULT_POLICY: TypeCheckPolicy = "full"
+_DEFAULT_SAMPLE_RATE = 0.01
+
+
+def _validate_policy(policy: str) -> TypeCheckPolicy:
+    if policy not in _POLICIES:
+        raise ValueError(
+            f"unknown type check policy {policy!r}, expected one of {_POLICIES}"
+        )
+    return typing.cast(TypeCheckPolicy, policy)
+
+
+def _validate_sample_rate(rate: float) -> float:
+    if not 0.0 <= rate <= 1.0:
+        raise ValueError(f"sample rate must be between 0 and 1, got {rate}")
+    return rate
+
+
+class _CheckedMethod:
+    """Registry entry holding both versions of a decorated method."""
+
+    __slots__ = ("owner", "name", "func", "_checked")
+
+    def __init__(self, owner: type, name: str, func: Callable[..., Any]) -> None:
+        self.owner = owner
+        self.name = name
+        self.func = func
+        self._checked: Optional[Callable[..., Any]] = None
+
+    @property
+    def checked(self) -> Callable[..., Any]:
+        if self._checked is None:
+            import typeguard
+
+            self._checked = typeguard.typechecked(self.func)
+        return self._checked
+
+    def resolve(self, policy: TypeCheckPolicy, rate: float) -> Callable[..., Any]:
+        if policy == "off":
+            return self.func
+        if policy == "full":
+            if self._checked is None:
+                return _deferred(self)
+            return self._checked
+        return _sampled(self, rate)
+
+    def install(self, policy: TypeCheckPolicy, rate: float) -> None:
+        _hooks.set_base(self.owner, self.name, self.resolve(policy, rate))
+
+
+def _deferred(entry: _CheckedMethod) -> Callable[..., Any]:
+    # builds the checked version on first use, then takes itself off the class
+    @functools.wraps(entry.func)
+    def first_call(*args: Any, **kwargs: Any) -> Any:
+        checked = entry.checked
+        with _lock:
+            entry.install(_policy, _sample_rate)
+        return checked(*args, **kwargs)
+
+    return first_call
+
+
+def _sampled(entry: _CheckedMethod, rate: float) -> Callable[..., Any]:
+    func = entry.func
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if thread_random.draw() < rate:
+            return entry.checked(*args, **kwargs)
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+class _PolicyMethod:
+    """Class body placeholder replaced by the policy selected implementation
+    as soon as the owning class is created."""
+
+    def __init__(self, func: Callable[..., Any]) -> None:
+        self.func = func
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        entry = _CheckedMethod(owner, name, self.func)
+        with _lock:
+            _registry.append(entry)
+            entry.install(_policy, _sample_rate)
+
+
+_lock = threading.Lock()
+_registry: List[_CheckedMethod] = []
+_policy: TypeCheckPolicy = _validate_policy(
+    os.environ.get(POLICY_ENV_VAR, _DEFAULT_POLICY).strip().lower()
+)
+_sample_rate: float = _validate_sample_rate(
+    float(os.environ.get(SAMPLE_RATE_ENV_VAR, _DEFAULT_SAMPLE_RATE))
+)
+
+
+def typechecked(func: F) -> F:
+    """Marks a method to be type checked according to the current policy.
+
+    Only usable on functions defined within a class body.
+
+    Args:
+        func (F): method to decorate.
+
+    Returns:
+        F: the implementation selected by the active policy.
+    """
+    return typing.cast(F, _PolicyMethod(func))
+
+
+def set_typecheck_policy(
+    policy: TypeCheckPolicy, sample_rate: Optional[float] = None
+) -> None:
+    """Changes how the decorated methods are type checked.
+
+    Example:
+        >>> set_typecheck_policy("off")
+        >>> set_typecheck_policy("sampled", sample_rate=0.05)
+
+    Args:
+        policy (TypeCheckPolicy): one of "off", "sampled" or "full".
+        sample_rate (Optional[float]): fraction of calls to validate when
+        the policy is "sampled". Keeps the previous rate if not given.
+
+    Raises:
+        ValueError: if the policy or the sample rate are not valid.
+    """
+    global _policy, _sample_rate
+    policy = _validate_policy(policy)
+    rate = _sample_rate if sample_rate is None else _validate_sample_rate(sample_rate)
+    with _lock:
+        _policy = policy
+        _sample_rate = rate
+        for entry in _registry:
+            entry.install(policy, rate)
+
+
+def get_typecheck_policy() -> TypeCheckPolicy:
+    """Returns the active type check policy.
+
+    Returns:
+        TypeCheckPolicy: one of "off", "sampled" or "full".
+    """
+    return _policy
+
+
+def get_sample_rate() -> float:
+    """Returns the fraction of calls validated under the "sampled" policy.
+
+    Returns:
+        float: value between 0 and 1.
+    """
+    return _sample_rate
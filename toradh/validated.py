@@ -0,0 +1,268 @@
+"""Validation accumulating every error, instead of stopping at the first one.
+
+`Result` short circuits: a chain of checks reports its first failure only.
+`Validated` is either `Valid(value)` or `Invalid(*errors)`; combining
+several of them runs every check once and keeps all the errors found, so a
+payload is validated in a single pass. At the end `to_result` turns it back
+into an `Ok`, or an `Err` holding an `ExceptionGroup`.
+
+Example:
+    >>> def check_row(row: Dict[str, str]) -> Validated[Row]:
+    >>>     return combine(
+    >>>         parse_email(row["email"]),  # Result[str, ValueError]
+    >>>         parse_age(row["age"]),  # Result[int, ValueError]
+    >>>     ).map(lambda fields: Row(*fields))
+    >>>
+    >>> collect(check_row(row) for row in rows).to_result("invalid upload")
+"""
+
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from ._compat import error_group
+from ._frozen import Frozen, slot_setter
+from .result import Err, Ok
+
+T = TypeVar("T")
+V = TypeVar("V")
+E = TypeVar("E", bound=BaseException)
+
+
+class Valid(Frozen, Generic[T]):
+    __slots__ = ("_value",)
+    _value: T
+    __match_args__ = ("_value",)
+
+    def __init__(self, value: T) -> None:
+        """A value which passed its checks.
+
+        Args:
+            value (T): validated value.
+        """
+        _set_valid_value(self, value)
+
+    def is_valid(self) -> bool:
+        return True
+
+    def is_invalid(self) -> bool:
+        return False
+
+    @property
+    def errors(self) -> Tuple[BaseException, ...]:
+        """Errors found, always empty."""
+        return ()
+
+    def map(self, op: Callable[[T], V]) -> "Valid[V]":
+        """Transforms the value.
+
+        Args:
+            op (Callable[[T], V]): function to apply to the value.
+
+        Returns:
+            Valid[V]: the transformed value.
+        """
+        return Valid(op(self._value))
+
+    def to_result(self, message: str = "validation failed") -> Ok[T]:
+        """Converts to a Result.
+
+        Args:
+            message (str): message of the group, in case of errors.
+
+        Returns:
+            Ok[T]: the value.
+        """
+        return Ok(self._value)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Valid):
+            return self._value == other._value
+        return False
+
+    def __hash__(self) -> int:
+        return hash((Valid, self._value))
+
+    def __repr__(self) -> str:
+        return f"Valid({self._value!r})"
+
+
+_set_valid_value = slot_setter(Valid, "_value")
+
+
+class Invalid(Frozen):
+    __slots__ = ("_errors",)
+    _errors: Tuple[BaseException, ...]
+    __match_args__ = ("_errors",)
+
+    def __init__(self, *errors: BaseException) -> None:
+        """The errors found by the checks which failed.
+
+        Args:
+            *errors (BaseException): at least one error.
+
+        Raises:
+            ValueError: if no error is given.
+        """
+        if not errors:
+            raise ValueError("Invalid needs at least one error")
+        _set_invalid_errors(self, errors)
+
+    def is_valid(self) -> bool:
+        return False
+
+    def is_invalid(self) -> bool:
+        return True
+
+    @property
+    def errors(self) -> Tuple[BaseException, ...]:
+        """Errors found, in the order the checks were given."""
+        return self._errors
+
+    def map(self, op: Callable[[Any], Any]) -> "Invalid":
+        """Nothing to transform, returns the same instance.
+
+        Returns:
+            Invalid: self
+        """
+        return self
+
+    def to_result(self, message: str = "validation failed") -> Err[BaseException]:
+        """Converts to a Result.
+
+        Args:
+            message (str): message of the group holding the errors.
+
+        Returns:
+            Err[BaseException]: an `ExceptionGroup` (`toradh._compat.ErrorGroup`
+            before Python 3.11) with every error, even if there is only one.
+        """
+        return Err(error_group(message, self._errors))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Invalid):
+            return self._errors == other._errors
+        return False
+
+    def __hash__(self) -> int:
+        return hash((Invalid, self._errors))
+
+    def __repr__(self) -> str:
+        return f"Invalid{self._errors!r}"
+
+
+_set_invalid_errors = slot_setter(Invalid, "_errors")
+
+Validated = Union[Valid[T], Invalid]
+Check = Union[Valid[T], Invalid, Ok[T], Err[BaseException]]
+
+
+def from_result(result: Union[Ok[T], Err[E]]) -> Validated[T]:
+    """Converts a Result, Ok becomes Valid and Err becomes Invalid.
+
+    Args:
+        result (Result[T, E]): result to convert.
+
+    Returns:
+        Validated[T]: the same value or error.
+    """
+    if isinstance(result, Ok):
+        return Valid(result._value)
+    return Invalid(result._err)
+
+
+def _gather(checks: Iterable[Check[Any]], values: List[Any]) -> List[BaseException]:
+    # single pass over the checks, values are dropped once an error is found
+    errors: List[BaseException] = []
+    for check in checks:
+        if isinstance(check, (Ok, Valid)):
+            if not errors:
+                values.append(check._value)
+        elif isinstance(check, Err):
+            errors.append(check._err)
+        elif isinstance(check, Invalid):
+            errors.extend(check._errors)
+        else:
+            raise TypeError(f"expected a Result or a Validated, got {check!r}")
+    return errors
+
+
+def combine(*checks: Check[Any]) -> Validated[Tuple[Any, ...]]:
+    """Combines independent checks, keeping the errors of every failed one.
+
+    Example:
+        >>> combine(Ok(1), Err(KeyError()), Invalid(ValueError(), TypeError()))
+        >>> # Invalid(KeyError(), ValueError(), TypeError())
+        >>> combine(Ok(1), Valid("a")).map(lambda pair: dict([pair]))
+        >>> # Valid({1: "a"})
+
+    Args:
+        *checks (Union[Result, Validated]): outcome of each check, Results
+        are accepted as they are, without converting them first.
+
+    Raises:
+        TypeError: if a check is neither a Result nor a Validated.
+
+    Returns:
+        Validated[Tuple]: every value in order, or every error in order.
+    """
+    values: List[Any] = []
+    errors = _gather(checks, values)
+    if errors:
+        return Invalid(*errors)
+    return Valid(tuple(values))
+
+
+def collect(checks: Iterable[Check[T]]) -> Validated[List[T]]:
+    """Gathers the values of many checks of the same kind, such as one per
+    row of an upload, or every error if any failed.
+
+    Example:
+        >>> collect(validate_row(row) for row in rows)
+
+    Args:
+        checks (Iterable[Union[Result[T, E], Validated[T]]]): outcome of
+        each check, consumed once.
+
+    Raises:
+        TypeError: if a check is neither a Result nor a Validated.
+
+    Returns:
+        Validated[List[T]]: every value in order, or every error in order.
+    """
+    values: List[T] = []
+    errors = _gather(checks, values)
+    if errors:
+        return Invalid(*errors)
+    return Valid(values)
+
+
+def validate(value: T, *checks: Callable[[T], Check[Any]]) -> Validated[T]:
+    """Runs every check against a value, instead of stopping at the first
+    failure.
+
+    Example:
+        >>> validate(password, min_length(8), has_digit, not_in(common_passwords))
+
+    Args:
+        value (T): value to check.
+        *checks (Callable[[T], Union[Result, Validated]]): the checks, their
+        Ok/Valid values are ignored.
+
+    Raises:
+        TypeError: if a check returns neither a Result nor a Validated.
+
+    Returns:
+        Validated[T]: the value itself, or the errors of every failed check.
+    """
+    errors = _gather((check(value) for check in checks), [])
+    if errors:
+        return Invalid(*errors)
+    return Valid(value)